@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_addone.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_addone.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_addone.pdb"
+  "libdacestub_addone.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_addone.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
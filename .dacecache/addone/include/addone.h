@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * addoneHandle_t;
+extern "C" addoneHandle_t __dace_init_addone();
+extern "C" int __dace_exit_addone(addoneHandle_t handle);
+extern "C" void __program_addone(addoneHandle_t handle, csr * __restrict__ sparsemats_in, csr * __restrict__ sparsemats_out);
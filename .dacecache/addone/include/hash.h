@@ -0,0 +1 @@
+#define __HASH_addone "7cdf42c776739fcdcf2ff1bd5a9ebcc942116fbd664b08a2ee14b3d0c95689e5"
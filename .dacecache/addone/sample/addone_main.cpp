@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/addone.h"
+
+int main(int argc, char **argv) {
+    addoneHandle_t handle;
+    int err;
+    csr * __restrict__ sparsemats_in = (csr*) calloc(5, sizeof(csr));
+    csr * __restrict__ sparsemats_out = (csr*) calloc(5, sizeof(csr));
+
+
+    handle = __dace_init_addone();
+    __program_addone(handle, sparsemats_in, sparsemats_out);
+    err = __dace_exit_addone(handle);
+
+    free(sparsemats_in);
+    free(sparsemats_out);
+
+
+    return err;
+}
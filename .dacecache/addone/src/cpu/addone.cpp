@@ -0,0 +1,84 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+struct csr {
+    int rows;
+    int cols;
+    int nnz;
+    float* data;
+    int rowsp1;
+    int* rowptr;
+    int* colind;
+};
+
+struct addone_state_t {
+
+};
+
+void __program_addone_internal(addone_state_t*__state, csr * __restrict__ sparsemats_in, csr * __restrict__ sparsemats_out)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 5; i += 1) {
+                {
+                    csr mat_in = sparsemats_in[i];
+                    csr* mat_out = sparsemats_out + i;
+
+                    ///////////////////
+
+                    for (int j = 0; j < mat_in.nnz; ++j) {
+                        mat_out->data[j] = mat_in.data[j] + 1.0f;
+                    }
+                    ///////////////////
+
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_addone(addone_state_t *__state, csr * __restrict__ sparsemats_in, csr * __restrict__ sparsemats_out)
+{
+    __program_addone_internal(__state, sparsemats_in, sparsemats_out);
+}
+
+struct __dace_batch_args_addone {
+    csr * __restrict__ sparsemats_in;
+    csr * __restrict__ sparsemats_out;
+};
+
+DACE_EXPORTED int __program_addone_batch(addone_state_t *__state, const __dace_batch_args_addone *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_addone_internal(__state, __args[__i].sparsemats_in, __args[__i].sparsemats_out);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED addone_state_t *__dace_init_addone()
+{
+    int __result = 0;
+    addone_state_t *__state = new addone_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_addone(addone_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * adi_test_adi_kernelHandle_t;
+extern "C" adi_test_adi_kernelHandle_t __dace_init_adi_test_adi_kernel(long long N);
+extern "C" int __dace_exit_adi_test_adi_kernel(adi_test_adi_kernelHandle_t handle);
+extern "C" void __program_adi_test_adi_kernel(adi_test_adi_kernelHandle_t handle, double * __restrict__ u, long long N, long long TSTEPS);
@@ -0,0 +1 @@
+#define __HASH_adi_test_adi_kernel "84c83a9ad059eef16103446bcfbe5b88d6aac829f1d167e6dc5a2fd0de5c3171"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/adi_test_adi_kernel.h"
+
+int main(int argc, char **argv) {
+    adi_test_adi_kernelHandle_t handle;
+    int err;
+    long long N = 42;
+    long long TSTEPS = 42;
+    double * __restrict__ u = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_adi_test_adi_kernel(N);
+    __program_adi_test_adi_kernel(handle, u, N, TSTEPS);
+    err = __dace_exit_adi_test_adi_kernel(handle);
+
+    free(u);
+
+
+    return err;
+}
@@ -0,0 +1,1027 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct adi_test_adi_kernel_state_t {
+    double __0___tmp3;
+    double __0___tmp5;
+    double __0___tmp7;
+    double __0___tmp11;
+    double __0___tmp12;
+    double __0___tmp14;
+    double __0___tmp15;
+    double __0___tmp17;
+    double __0___tmp20;
+    double __0___tmp24;
+    double __0___tmp28;
+    double __0___tmp30;
+    double __0___tmp31;
+    double __0___tmp43;
+    double __0___tmp47;
+    double __0___tmp49;
+    double __0___tmp50;
+    double * __restrict__ __0_v;
+    double * __restrict__ __0_p;
+    double * __restrict__ __0_q;
+    double __0_DX;
+    double __0_DY;
+    double __0_DT;
+    double __0_B1;
+    double __0_B2;
+    double __0_mul1;
+    double __0_mul2;
+    double __0_a;
+    double __0_b;
+    double __0_d;
+    double __0_e;
+};
+
+inline void nested_UnaryOp_97_0_2_18(adi_test_adi_kernel_state_t *__state, const double&  __tmp24, const double&  __tmp28, const double&  __tmp31, const double&  a, const double&  b, const double&  d, double* __restrict__ u, double* __restrict__ p, double* __restrict__ q, int N, long long __i0) {
+    long long j;
+
+
+
+
+    for (j = 1; (j <= (N - 2)); j = j + 1) {
+        {
+            double __tmp62[1]  DACE_ALIGN(64);
+            double __tmp26[1]  DACE_ALIGN(64);
+            double __tmp37[1]  DACE_ALIGN(64);
+
+            double __s2_n4__out_n5IN___tmp25;
+            {
+                double __in1 = a;
+                double __in2 = p[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n4__out_n5IN___tmp25 = __out;
+            }
+            {
+                const double __in1 = __s2_n4__out_n5IN___tmp25;
+                double __in2 = b;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __tmp26[0] = __out;
+            }
+            {
+                double __in2 = __tmp26[0];
+                double __in1 = __tmp24;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __tmp62[0] = __out;
+            }
+
+            dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+            __tmp62, p + ((N * (__i0 + 1)) + j), 1);
+            double __s2_n18__out_n19IN___tmp29;
+            {
+                double __in1 = __tmp28;
+                double __in2 = u[((N * j) + __i0)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n18__out_n19IN___tmp29 = __out;
+            }
+            double __s2_n25__out_n26IN___tmp32;
+            {
+                double __in1 = __tmp31;
+                double __in2 = u[(((N * j) + __i0) + 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n25__out_n26IN___tmp32 = __out;
+            }
+            double __s2_n25__out_n26IN___tmp33;
+            {
+                const double __in1 = __s2_n18__out_n19IN___tmp29;
+                const double __in2 = __s2_n25__out_n26IN___tmp32;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __s2_n25__out_n26IN___tmp33 = __out;
+            }
+            double __s2_n27__out_n28IN___tmp34;
+            {
+                double __in1 = d;
+                double __in2 = u[(((N * j) + __i0) + 2)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n27__out_n28IN___tmp34 = __out;
+            }
+            double __s2_n27__out_n28IN___tmp35;
+            {
+                const double __in1 = __s2_n25__out_n26IN___tmp33;
+                const double __in2 = __s2_n27__out_n28IN___tmp34;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Sub_)
+                __out = (__in1 - __in2);
+                ///////////////////
+
+                __s2_n27__out_n28IN___tmp35 = __out;
+            }
+            double __s2_n29__out_n30IN___tmp36;
+            {
+                double __in1 = a;
+                double __in2 = q[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n29__out_n30IN___tmp36 = __out;
+            }
+            {
+                const double __in1 = __s2_n27__out_n28IN___tmp35;
+                const double __in2 = __s2_n29__out_n30IN___tmp36;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Sub_)
+                __out = (__in1 - __in2);
+                ///////////////////
+
+                __tmp37[0] = __out;
+            }
+            double __s2_n34__out_n35IN___tmp38;
+            {
+                double __in1 = a;
+                double __in2 = p[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s2_n34__out_n35IN___tmp38 = __out;
+            }
+            double __s2_n35__out_n36IN___tmp39;
+            {
+                const double __in1 = __s2_n34__out_n35IN___tmp38;
+                double __in2 = b;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __s2_n35__out_n36IN___tmp39 = __out;
+            }
+            {
+                const double __in2 = __s2_n35__out_n36IN___tmp39;
+                double __in1 = __tmp37[0];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                q[((N * (__i0 + 1)) + j)] = __out;
+            }
+
+        }
+
+    }
+
+    
+}
+
+inline void nested_BinOp_102_2_0_4_6(adi_test_adi_kernel_state_t *__state, double* __restrict__ p, double* __restrict__ q, double* __restrict__ v, int N, long long __i0) {
+    long long j;
+
+
+
+
+    for (j = (N - 2); (j >= 1); j = j - 1) {
+        {
+            double __tmp41[1]  DACE_ALIGN(64);
+
+            {
+                double __in2 = v[(((N * (j + 1)) + __i0) + 1)];
+                double __in1 = p[((N * (__i0 + 1)) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp41[0] = __out;
+            }
+            {
+                double __in1 = __tmp41[0];
+                double __in2 = q[((N * (__i0 + 1)) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                v[(((N * j) + __i0) + 1)] = __out;
+            }
+
+        }
+
+    }
+
+    
+}
+
+inline void nested_UnaryOp_108_0_6_18(adi_test_adi_kernel_state_t *__state, const double&  __tmp43, const double&  __tmp47, const double&  __tmp50, const double&  a, const double&  d, const double&  e, double* __restrict__ v, double* __restrict__ p, double* __restrict__ q, int N, long long __i0) {
+    long long j;
+
+
+
+
+    for (j = 1; (j <= (N - 2)); j = j + 1) {
+        {
+            double __tmp56[1]  DACE_ALIGN(64);
+            double __tmp45[1]  DACE_ALIGN(64);
+            double __tmp63[1]  DACE_ALIGN(64);
+
+            double __s8_n4__out_n5IN___tmp44;
+            {
+                double __in1 = d;
+                double __in2 = p[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n4__out_n5IN___tmp44 = __out;
+            }
+            {
+                const double __in1 = __s8_n4__out_n5IN___tmp44;
+                double __in2 = e;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __tmp45[0] = __out;
+            }
+            {
+                double __in2 = __tmp45[0];
+                double __in1 = __tmp43;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __tmp63[0] = __out;
+            }
+
+            dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+            __tmp63, p + ((N * (__i0 + 1)) + j), 1);
+            double __s8_n18__out_n19IN___tmp48;
+            {
+                double __in1 = __tmp47;
+                double __in2 = v[((N * __i0) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n18__out_n19IN___tmp48 = __out;
+            }
+            double __s8_n25__out_n26IN___tmp51;
+            {
+                double __in1 = __tmp50;
+                double __in2 = v[((N * (__i0 + 1)) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n25__out_n26IN___tmp51 = __out;
+            }
+            double __s8_n25__out_n26IN___tmp52;
+            {
+                const double __in1 = __s8_n18__out_n19IN___tmp48;
+                const double __in2 = __s8_n25__out_n26IN___tmp51;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __s8_n25__out_n26IN___tmp52 = __out;
+            }
+            double __s8_n27__out_n28IN___tmp53;
+            {
+                double __in1 = a;
+                double __in2 = v[((N * (__i0 + 2)) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n27__out_n28IN___tmp53 = __out;
+            }
+            double __s8_n27__out_n28IN___tmp54;
+            {
+                const double __in1 = __s8_n25__out_n26IN___tmp52;
+                const double __in2 = __s8_n27__out_n28IN___tmp53;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Sub_)
+                __out = (__in1 - __in2);
+                ///////////////////
+
+                __s8_n27__out_n28IN___tmp54 = __out;
+            }
+            double __s8_n29__out_n30IN___tmp55;
+            {
+                double __in1 = d;
+                double __in2 = q[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n29__out_n30IN___tmp55 = __out;
+            }
+            {
+                const double __in1 = __s8_n27__out_n28IN___tmp54;
+                const double __in2 = __s8_n29__out_n30IN___tmp55;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Sub_)
+                __out = (__in1 - __in2);
+                ///////////////////
+
+                __tmp56[0] = __out;
+            }
+            double __s8_n34__out_n35IN___tmp57;
+            {
+                double __in1 = d;
+                double __in2 = p[(((N * (__i0 + 1)) + j) - 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __s8_n34__out_n35IN___tmp57 = __out;
+            }
+            double __s8_n35__out_n36IN___tmp58;
+            {
+                const double __in1 = __s8_n34__out_n35IN___tmp57;
+                double __in2 = e;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                __s8_n35__out_n36IN___tmp58 = __out;
+            }
+            {
+                const double __in2 = __s8_n35__out_n36IN___tmp58;
+                double __in1 = __tmp56[0];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                q[((N * (__i0 + 1)) + j)] = __out;
+            }
+
+        }
+
+    }
+
+    
+}
+
+inline void nested_BinOp_113_2_0_8_6(adi_test_adi_kernel_state_t *__state, double* __restrict__ p, double* __restrict__ q, double* __restrict__ u, int N, long long __i0) {
+    long long j;
+
+
+
+
+    for (j = (N - 2); (j >= 1); j = j - 1) {
+        {
+            double __tmp60[1]  DACE_ALIGN(64);
+
+            {
+                double __in1 = p[((N * (__i0 + 1)) + j)];
+                double __in2 = u[(((N * (__i0 + 1)) + j) + 1)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp60[0] = __out;
+            }
+            {
+                double __in1 = __tmp60[0];
+                double __in2 = q[((N * (__i0 + 1)) + j)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                u[((N * (__i0 + 1)) + j)] = __out;
+            }
+
+        }
+
+    }
+
+    
+}
+
+void __program_adi_test_adi_kernel_internal(adi_test_adi_kernel_state_t*__state, double * __restrict__ u, long long N, long long TSTEPS)
+{
+    long long __tmp23;
+    long long t;
+
+    {
+
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_float64_)
+            __out = dace::float64(N);
+            ///////////////////
+
+            __state->__0___tmp3 = __out;
+        }
+        {
+            double __in2 = __state->__0___tmp3;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (1.0 / __in2);
+            ///////////////////
+
+            __state->__0_DX = __out;
+        }
+        {
+            double __in1 = __state->__0_DX;
+            double __in2 = __state->__0_DX;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * __in2);
+            ///////////////////
+
+            __state->__0___tmp12 = __out;
+        }
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_float64_)
+            __out = dace::float64(N);
+            ///////////////////
+
+            __state->__0___tmp5 = __out;
+        }
+        {
+            double __in2 = __state->__0___tmp5;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (1.0 / __in2);
+            ///////////////////
+
+            __state->__0_DY = __out;
+        }
+        {
+            double __in1 = __state->__0_DY;
+            double __in2 = __state->__0_DY;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * __in2);
+            ///////////////////
+
+            __state->__0___tmp15 = __out;
+        }
+        {
+            long long __inp = TSTEPS;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_float64_)
+            __out = dace::float64(__inp);
+            ///////////////////
+
+            __state->__0___tmp7 = __out;
+        }
+        {
+            double __in2 = __state->__0___tmp7;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (1.0 / __in2);
+            ///////////////////
+
+            __state->__0_DT = __out;
+        }
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_80_4)
+            __out = 2.0;
+            ///////////////////
+
+            __state->__0_B1 = __out;
+        }
+        {
+            double __in1 = __state->__0_B1;
+            double __in2 = __state->__0_DT;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * __in2);
+            ///////////////////
+
+            __state->__0___tmp11 = __out;
+        }
+        {
+            double __in2 = __state->__0___tmp12;
+            double __in1 = __state->__0___tmp11;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / __in2);
+            ///////////////////
+
+            __state->__0_mul1 = __out;
+        }
+        {
+            double __in = __state->__0_mul1;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_USub_)
+            __out = (- __in);
+            ///////////////////
+
+            __state->__0___tmp17 = __out;
+        }
+        {
+            double __in1 = __state->__0___tmp17;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / 2.0);
+            ///////////////////
+
+            __state->__0_a = __out;
+        }
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_81_4)
+            __out = 1.0;
+            ///////////////////
+
+            __state->__0_B2 = __out;
+        }
+        {
+            double __in1 = __state->__0_B2;
+            double __in2 = __state->__0_DT;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * __in2);
+            ///////////////////
+
+            __state->__0___tmp14 = __out;
+        }
+        {
+            double __in2 = __state->__0___tmp15;
+            double __in1 = __state->__0___tmp14;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / __in2);
+            ///////////////////
+
+            __state->__0_mul2 = __out;
+        }
+        {
+            double __in2 = __state->__0_mul2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (1.0 + __in2);
+            ///////////////////
+
+            __state->__0_b = __out;
+        }
+        {
+            double __in = __state->__0_mul2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_USub_)
+            __out = (- __in);
+            ///////////////////
+
+            __state->__0___tmp20 = __out;
+        }
+        {
+            double __in1 = __state->__0___tmp20;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / 2.0);
+            ///////////////////
+
+            __state->__0_d = __out;
+        }
+        {
+            double __in2 = __state->__0_mul2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (1.0 + __in2);
+            ///////////////////
+
+            __state->__0_e = __out;
+        }
+
+    }
+
+    __tmp23 = (TSTEPS + 1);
+
+    for (t = 1; (t < __tmp23); t = (t + 1)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 1; __i1 < (N - 1); __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_93_8)
+                        __out = 1.0;
+                        ///////////////////
+
+                        __state->__0_v[__i1] = __out;
+                    }
+                }
+            }
+
+            dace::CopyNDDynamic<double, 1, false, 1>::template ConstSrc<1>::Copy(
+            __state->__0_v + 1, __state->__0_q + N, (N - 2), N);
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 1; __i0 < (N - 1); __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_94_8)
+                        __out = 0.0;
+                        ///////////////////
+
+                        __state->__0_p[(N * __i0)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                double __in = __state->__0_a;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_USub_)
+                __out = (- __in);
+                ///////////////////
+
+                __state->__0___tmp24 = __out;
+            }
+            {
+                double __in = __state->__0_d;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_USub_)
+                __out = (- __in);
+                ///////////////////
+
+                __state->__0___tmp28 = __out;
+            }
+            {
+                double __in2 = __state->__0_d;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (2.0 * __in2);
+                ///////////////////
+
+                __state->__0___tmp30 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp30;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (1.0 + __in2);
+                ///////////////////
+
+                __state->__0___tmp31 = __out;
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (N - 2); __i0 += 1) {
+                    nested_UnaryOp_97_0_2_18(__state, __state->__0___tmp24, __state->__0___tmp28, __state->__0___tmp31, __state->__0_a, __state->__0_b, __state->__0_d, &u[0], &__state->__0_p[0], &__state->__0_q[0], N, __i0);
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 1; __i1 < (N - 1); __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_100_8)
+                        __out = 1.0;
+                        ///////////////////
+
+                        __state->__0_v[((N * (N - 1)) + __i1)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (N - 2); __i0 += 1) {
+                    nested_BinOp_102_2_0_4_6(__state, &__state->__0_p[0], &__state->__0_q[0], &__state->__0_v[0], N, __i0);
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 1; __i0 < (N - 1); __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_104_8)
+                        __out = 1.0;
+                        ///////////////////
+
+                        u[(N * __i0)] = __out;
+                    }
+                }
+            }
+
+            dace::CopyNDDynamic<double, 1, false, 1>::Dynamic::Copy(
+            u + N, __state->__0_q + N, (N - 2), N, N);
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 1; __i0 < (N - 1); __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_105_8)
+                        __out = 0.0;
+                        ///////////////////
+
+                        __state->__0_p[(N * __i0)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                double __in = __state->__0_d;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_USub_)
+                __out = (- __in);
+                ///////////////////
+
+                __state->__0___tmp43 = __out;
+            }
+            {
+                double __in = __state->__0_a;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_USub_)
+                __out = (- __in);
+                ///////////////////
+
+                __state->__0___tmp47 = __out;
+            }
+            {
+                double __in2 = __state->__0_a;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (2.0 * __in2);
+                ///////////////////
+
+                __state->__0___tmp49 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp49;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Add_)
+                __out = (1.0 + __in2);
+                ///////////////////
+
+                __state->__0___tmp50 = __out;
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (N - 2); __i0 += 1) {
+                    nested_UnaryOp_108_0_6_18(__state, __state->__0___tmp43, __state->__0___tmp47, __state->__0___tmp50, __state->__0_a, __state->__0_d, __state->__0_e, &__state->__0_v[0], &__state->__0_p[0], &__state->__0_q[0], N, __i0);
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 1; __i0 < (N - 1); __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_111_8)
+                        __out = 1.0;
+                        ///////////////////
+
+                        u[(((N * __i0) + N) - 1)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (N - 2); __i0 += 1) {
+                    nested_BinOp_113_2_0_8_6(__state, &__state->__0_p[0], &__state->__0_q[0], &u[0], N, __i0);
+                }
+            }
+
+        }
+
+
+    }
+
+}
+
+DACE_EXPORTED void __program_adi_test_adi_kernel(adi_test_adi_kernel_state_t *__state, double * __restrict__ u, long long N, long long TSTEPS)
+{
+    __program_adi_test_adi_kernel_internal(__state, u, N, TSTEPS);
+}
+
+struct __dace_batch_args_adi_test_adi_kernel {
+    double * u;
+    long long N;
+    long long TSTEPS;
+};
+
+DACE_EXPORTED int __program_adi_test_adi_kernel_batch(adi_test_adi_kernel_state_t *__state, const __dace_batch_args_adi_test_adi_kernel *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_adi_test_adi_kernel_internal(__state, __args[__i].u, __args[__i].N, __args[__i].TSTEPS);
+    }
+    return 0;
+}
+
+DACE_EXPORTED adi_test_adi_kernel_state_t *__dace_init_adi_test_adi_kernel(long long N)
+{
+    int __result = 0;
+    adi_test_adi_kernel_state_t *__state = new adi_test_adi_kernel_state_t;
+
+
+    __state->__0_v = new double DACE_ALIGN(64)[(N * N)];
+    __state->__0_p = new double DACE_ALIGN(64)[(N * N)];
+    __state->__0_q = new double DACE_ALIGN(64)[(N * N)];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_adi_test_adi_kernel(adi_test_adi_kernel_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__0_v;
+    delete[] __state->__0_p;
+    delete[] __state->__0_q;
+    delete __state;
+    return __err;
+}
+
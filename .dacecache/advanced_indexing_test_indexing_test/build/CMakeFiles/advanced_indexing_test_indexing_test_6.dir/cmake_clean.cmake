@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/advanced_indexing_test_indexing_test_6.dir/root/package/.dacecache/advanced_indexing_test_indexing_test/src/cpu/advanced_indexing_test_indexing_test_6.cpp.o"
+  "CMakeFiles/advanced_indexing_test_indexing_test_6.dir/root/package/.dacecache/advanced_indexing_test_indexing_test/src/cpu/advanced_indexing_test_indexing_test_6.cpp.o.d"
+  "libadvanced_indexing_test_indexing_test_6.pdb"
+  "libadvanced_indexing_test_indexing_test_6.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/advanced_indexing_test_indexing_test_6.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_advanced_indexing_test_indexing_test_2.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_advanced_indexing_test_indexing_test_2.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_advanced_indexing_test_indexing_test_2.pdb"
+  "libdacestub_advanced_indexing_test_indexing_test_2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_advanced_indexing_test_indexing_test_2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
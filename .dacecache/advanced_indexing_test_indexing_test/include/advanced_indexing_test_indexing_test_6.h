@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * advanced_indexing_test_indexing_test_6Handle_t;
+extern "C" advanced_indexing_test_indexing_test_6Handle_t __dace_init_advanced_indexing_test_indexing_test_6();
+extern "C" int __dace_exit_advanced_indexing_test_indexing_test_6(advanced_indexing_test_indexing_test_6Handle_t handle);
+extern "C" void __program_advanced_indexing_test_indexing_test_6(advanced_indexing_test_indexing_test_6Handle_t handle, double * __restrict__ A, double * __restrict__ __return);
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * advanced_indexing_test_indexing_test_7Handle_t;
+extern "C" advanced_indexing_test_indexing_test_7Handle_t __dace_init_advanced_indexing_test_indexing_test_7();
+extern "C" int __dace_exit_advanced_indexing_test_indexing_test_7(advanced_indexing_test_indexing_test_7Handle_t handle);
+extern "C" void __program_advanced_indexing_test_indexing_test_7(advanced_indexing_test_indexing_test_7Handle_t handle, double * __restrict__ A, double * __restrict__ __return, int * __restrict__ indices);
@@ -0,0 +1 @@
+#define __HASH_advanced_indexing_test_indexing_test_9 "602fedeb5426709245553828aea219788403428e9643705e3a0320fb79ca356d"
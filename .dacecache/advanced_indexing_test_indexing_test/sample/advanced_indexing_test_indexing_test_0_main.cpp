@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_0.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_0Handle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(600, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(600, sizeof(double));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_0();
+    __program_advanced_indexing_test_indexing_test_0(handle, A, __return);
+    err = __dace_exit_advanced_indexing_test_indexing_test_0(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_3.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_3Handle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(3125, sizeof(double));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_3();
+    __program_advanced_indexing_test_indexing_test_3(handle, A);
+    err = __dace_exit_advanced_indexing_test_indexing_test_3(handle);
+
+    free(A);
+
+
+    return err;
+}
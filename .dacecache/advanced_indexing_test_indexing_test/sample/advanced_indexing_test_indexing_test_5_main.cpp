@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_5.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_5Handle_t handle;
+    int err;
+    int M = 42;
+    double * __restrict__ A = (double*) calloc(N, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(M, sizeof(double));
+    int * __restrict__ indices = (int*) calloc(M, sizeof(int));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_5(M);
+    __program_advanced_indexing_test_indexing_test_5(handle, A, __return, indices, M);
+    err = __dace_exit_advanced_indexing_test_indexing_test_5(handle);
+
+    free(A);
+    free(__return);
+    free(indices);
+
+
+    return err;
+}
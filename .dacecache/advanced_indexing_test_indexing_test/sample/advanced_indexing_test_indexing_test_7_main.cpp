@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_7.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_7Handle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(6000, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(3, sizeof(double));
+    int * __restrict__ indices = (int*) calloc(3, sizeof(int));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_7();
+    __program_advanced_indexing_test_indexing_test_7(handle, A, __return, indices);
+    err = __dace_exit_advanced_indexing_test_indexing_test_7(handle);
+
+    free(A);
+    free(__return);
+    free(indices);
+
+
+    return err;
+}
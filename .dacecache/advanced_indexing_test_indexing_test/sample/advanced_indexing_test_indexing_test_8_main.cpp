@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_8.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_8Handle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(600, sizeof(double));
+    bool * __restrict__ barr = (bool*) calloc(600, sizeof(bool));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_8();
+    __program_advanced_indexing_test_indexing_test_8(handle, A, barr);
+    err = __dace_exit_advanced_indexing_test_indexing_test_8(handle);
+
+    free(A);
+    free(barr);
+
+
+    return err;
+}
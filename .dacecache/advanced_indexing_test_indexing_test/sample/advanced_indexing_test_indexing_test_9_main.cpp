@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/advanced_indexing_test_indexing_test_9.h"
+
+int main(int argc, char **argv) {
+    advanced_indexing_test_indexing_test_9Handle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(600, sizeof(double));
+
+
+    handle = __dace_init_advanced_indexing_test_indexing_test_9();
+    __program_advanced_indexing_test_indexing_test_9(handle, A);
+    err = __dace_exit_advanced_indexing_test_indexing_test_9(handle);
+
+    free(A);
+
+
+    return err;
+}
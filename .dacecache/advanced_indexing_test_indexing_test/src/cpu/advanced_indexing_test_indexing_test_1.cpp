@@ -0,0 +1,61 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct advanced_indexing_test_indexing_test_1_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_1_internal(advanced_indexing_test_indexing_test_1_state_t*__state, double * __restrict__ A, double * __restrict__ __return)
+{
+
+    {
+
+
+        dace::CopyND<double, 1, false, 4, 5, 5, 5>::template ConstDst<125, 25, 5, 1>::Copy(
+        A + 625, __return, 625, 125, 25, 5);
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_1(advanced_indexing_test_indexing_test_1_state_t *__state, double * __restrict__ A, double * __restrict__ __return)
+{
+    __program_advanced_indexing_test_indexing_test_1_internal(__state, A, __return);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_1 {
+    double * __restrict__ A;
+    double * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_1_batch(advanced_indexing_test_indexing_test_1_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_1 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_1_internal(__state, __args[__i].A, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_1_state_t *__dace_init_advanced_indexing_test_indexing_test_1()
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_1_state_t *__state = new advanced_indexing_test_indexing_test_1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_1(advanced_indexing_test_indexing_test_1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
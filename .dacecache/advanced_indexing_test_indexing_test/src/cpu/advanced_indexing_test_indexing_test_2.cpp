@@ -0,0 +1,81 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct advanced_indexing_test_indexing_test_2_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_2_internal(advanced_indexing_test_indexing_test_2_state_t*__state, double * __restrict__ A)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 1; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 5; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 5; __i3 += 1) {
+                            for (auto __i4 = 0; __i4 < 5; __i4 += 1) {
+                                {
+                                    double __in1 = A[(((((625 * __i0) + (125 * __i1)) + (25 * __i2)) + (5 * __i3)) + __i4)];
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (augassign_53_4)
+                                    __out = (__in1 + 5);
+                                    ///////////////////
+
+                                    A[(((((625 * __i0) + (125 * __i1)) + (25 * __i2)) + (5 * __i3)) + __i4)] = __out;
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_2(advanced_indexing_test_indexing_test_2_state_t *__state, double * __restrict__ A)
+{
+    __program_advanced_indexing_test_indexing_test_2_internal(__state, A);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_2 {
+    double * __restrict__ A;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_2_batch(advanced_indexing_test_indexing_test_2_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_2 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_2_internal(__state, __args[__i].A);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_2_state_t *__dace_init_advanced_indexing_test_indexing_test_2()
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_2_state_t *__state = new advanced_indexing_test_indexing_test_2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_2(advanced_indexing_test_indexing_test_2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,77 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct advanced_indexing_test_indexing_test_5_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_5_internal(advanced_indexing_test_indexing_test_5_state_t*__state, double * __restrict__ A, double * __restrict__ __return, int * __restrict__ indices, int M)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < M; __i0 += 1) {
+                {
+                    double* __arr = &A[0];
+                    int __inp0 = indices[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (indirection)
+                    __out = __arr[__inp0];
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_5(advanced_indexing_test_indexing_test_5_state_t *__state, double * __restrict__ A, double * __restrict__ __return, int * __restrict__ indices, int M)
+{
+    __program_advanced_indexing_test_indexing_test_5_internal(__state, A, __return, indices, M);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_5 {
+    double * __restrict__ A;
+    double * __restrict__ __return;
+    int * __restrict__ indices;
+    int M;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_5_batch(advanced_indexing_test_indexing_test_5_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_5 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_5_internal(__state, __args[__i].A, __args[__i].__return, __args[__i].indices, __args[__i].M);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_5_state_t *__dace_init_advanced_indexing_test_indexing_test_5(int M)
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_5_state_t *__state = new advanced_indexing_test_indexing_test_5_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_5(advanced_indexing_test_indexing_test_5_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
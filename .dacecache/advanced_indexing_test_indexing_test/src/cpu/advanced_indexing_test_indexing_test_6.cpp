@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+constexpr long long __ind0_A[3] = {1, 10, 15};
+
+struct advanced_indexing_test_indexing_test_6_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_6_internal(advanced_indexing_test_indexing_test_6_state_t*__state, double * __restrict__ A, double * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                {
+                    double* __arr = &A[0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (indirection)
+                    __out = __arr[__ind0_A[__i0]];
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_6(advanced_indexing_test_indexing_test_6_state_t *__state, double * __restrict__ A, double * __restrict__ __return)
+{
+    __program_advanced_indexing_test_indexing_test_6_internal(__state, A, __return);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_6 {
+    double * __restrict__ A;
+    double * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_6_batch(advanced_indexing_test_indexing_test_6_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_6 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_6_internal(__state, __args[__i].A, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_6_state_t *__dace_init_advanced_indexing_test_indexing_test_6()
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_6_state_t *__state = new advanced_indexing_test_indexing_test_6_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_6(advanced_indexing_test_indexing_test_6_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
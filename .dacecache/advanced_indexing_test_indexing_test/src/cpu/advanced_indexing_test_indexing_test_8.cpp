@@ -0,0 +1,77 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct advanced_indexing_test_indexing_test_8_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_8_internal(advanced_indexing_test_indexing_test_8_state_t*__state, double * __restrict__ A, bool * __restrict__ barr)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 30; __i1 += 1) {
+                    {
+                        const double &__in1 = A[((30 * __i0) + __i1)];
+                        bool __in_cond = barr[((30 * __i0) + __i1)];
+                        double* __out = A + ((30 * __i0) + __i1);
+
+                        ///////////////////
+                        // Tasklet code (augassign_199_4)
+                        if (__in_cond) {A[((30 * __i0) + __i1)] = (__in1 + 5);
+                        }
+                        ///////////////////
+
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_8(advanced_indexing_test_indexing_test_8_state_t *__state, double * __restrict__ A, bool * __restrict__ barr)
+{
+    __program_advanced_indexing_test_indexing_test_8_internal(__state, A, barr);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_8 {
+    double * __restrict__ A;
+    bool * __restrict__ barr;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_8_batch(advanced_indexing_test_indexing_test_8_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_8 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_8_internal(__state, __args[__i].A, __args[__i].barr);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_8_state_t *__dace_init_advanced_indexing_test_indexing_test_8()
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_8_state_t *__state = new advanced_indexing_test_indexing_test_8_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_8(advanced_indexing_test_indexing_test_8_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
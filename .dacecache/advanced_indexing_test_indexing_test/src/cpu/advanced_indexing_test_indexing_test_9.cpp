@@ -0,0 +1,96 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct advanced_indexing_test_indexing_test_9_state_t {
+
+};
+
+void __program_advanced_indexing_test_indexing_test_9_internal(advanced_indexing_test_indexing_test_9_state_t*__state, double * __restrict__ A)
+{
+
+    {
+        bool *__tmp0;
+        __tmp0 = new bool DACE_ALIGN(64)[600];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 30; __i1 += 1) {
+                    {
+                        double __in1 = A[((30 * __i0) + __i1)];
+                        bool __out;
+
+                        ///////////////////
+                        // Tasklet code (_Gt_)
+                        __out = (__in1 > 15);
+                        ///////////////////
+
+                        __tmp0[((30 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 30; __i1 += 1) {
+                    {
+                        bool __in_cond = __tmp0[((30 * __i0) + __i1)];
+                        double* __out = A + ((30 * __i0) + __i1);
+
+                        ///////////////////
+                        // Tasklet code (assign_217_4)
+                        if (__in_cond) {A[((30 * __i0) + __i1)] = 2;
+                        }
+                        ///////////////////
+
+                    }
+                }
+            }
+        }
+        delete[] __tmp0;
+
+    }
+}
+
+DACE_EXPORTED void __program_advanced_indexing_test_indexing_test_9(advanced_indexing_test_indexing_test_9_state_t *__state, double * __restrict__ A)
+{
+    __program_advanced_indexing_test_indexing_test_9_internal(__state, A);
+}
+
+struct __dace_batch_args_advanced_indexing_test_indexing_test_9 {
+    double * __restrict__ A;
+};
+
+DACE_EXPORTED int __program_advanced_indexing_test_indexing_test_9_batch(advanced_indexing_test_indexing_test_9_state_t *__state, const __dace_batch_args_advanced_indexing_test_indexing_test_9 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_advanced_indexing_test_indexing_test_9_internal(__state, __args[__i].A);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED advanced_indexing_test_indexing_test_9_state_t *__dace_init_advanced_indexing_test_indexing_test_9()
+{
+    int __result = 0;
+    advanced_indexing_test_indexing_test_9_state_t *__state = new advanced_indexing_test_indexing_test_9_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_advanced_indexing_test_indexing_test_9(advanced_indexing_test_indexing_test_9_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_perscal_1.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_perscal_1Handle_t handle;
+    int err;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_perscal_1();
+    __program_allocation_lifetime_test_perscal_1(handle, a);
+    err = __dace_exit_allocation_lifetime_test_perscal_1(handle);
+
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_perscal.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_perscalHandle_t handle;
+    int err;
+    double * __restrict__ a = (double*) calloc(400, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_perscal();
+    __program_allocation_lifetime_test_perscal(handle, a);
+    err = __dace_exit_allocation_lifetime_test_perscal(handle);
+
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_perscal_0.dir/root/package/.dacecache/allocation_lifetime_test_perscal_38f6986c14cd82ea09ac933d4abebea6/src/cpu/allocation_lifetime_test_perscal_0.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_perscal_0.dir/root/package/.dacecache/allocation_lifetime_test_perscal_38f6986c14cd82ea09ac933d4abebea6/src/cpu/allocation_lifetime_test_perscal_0.cpp.o.d"
+  "liballocation_lifetime_test_perscal_0.pdb"
+  "liballocation_lifetime_test_perscal_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_perscal_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
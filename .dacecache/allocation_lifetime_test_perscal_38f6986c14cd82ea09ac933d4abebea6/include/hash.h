@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_perscal_1 "25f780b1068dea7d54d0ff12972bacc49c98a38b071164f4e567f71681013a42"
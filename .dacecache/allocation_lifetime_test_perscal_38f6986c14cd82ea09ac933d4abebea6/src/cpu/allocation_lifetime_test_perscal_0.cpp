@@ -0,0 +1,123 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_perscal_0_state_t {
+    int __0_tmp;
+    int __0_tmp2;
+};
+
+void __program_allocation_lifetime_test_perscal_0_internal(allocation_lifetime_test_perscal_0_state_t*__state, double * __restrict__ a)
+{
+
+    {
+        long long __tmp2;
+        long long __tmp3;
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_370_4)
+            __out = 1;
+            ///////////////////
+
+            __state->__0_tmp = __out;
+        }
+        {
+            int __in1 = __state->__0_tmp;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (dace::int64(__in1) + 1);
+            ///////////////////
+
+            __tmp2 = __out;
+        }
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_371_4)
+            __out = 2;
+            ///////////////////
+
+            __state->__0_tmp2 = __out;
+        }
+        {
+            int __in1 = __state->__0_tmp2;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (dace::int64(__in1) + 1);
+            ///////////////////
+
+            __tmp3 = __out;
+        }
+        {
+            long long __map_373_e3 = __tmp3;
+            int __map_373_b2 = __state->__0_tmp2;
+            long long __map_373_e1 = __tmp2;
+            int __map_373_b0 = __state->__0_tmp;
+            #pragma omp parallel for
+            for (auto i = __map_373_b0; i < __map_373_e1; i += 1) {
+                for (auto j = __map_373_b2; j < __map_373_e3; j += 1) {
+                    {
+                        double aa;
+
+                        ///////////////////
+                        // Tasklet code (allocation_lifetime_test_perscal_374)
+                        aa = 5;
+                        ///////////////////
+
+                        a[((20 * i) + j)] = aa;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_perscal_0(allocation_lifetime_test_perscal_0_state_t *__state, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_perscal_0_internal(__state, a);
+}
+
+struct __dace_batch_args_allocation_lifetime_test_perscal_0 {
+    double *a;
+};
+
+DACE_EXPORTED int __program_allocation_lifetime_test_perscal_0_batch(allocation_lifetime_test_perscal_0_state_t *__state, const __dace_batch_args_allocation_lifetime_test_perscal_0 *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_allocation_lifetime_test_perscal_0_internal(__state, __args[__i].a);
+    }
+    return 0;
+}
+
+DACE_EXPORTED allocation_lifetime_test_perscal_0_state_t *__dace_init_allocation_lifetime_test_perscal_0()
+{
+    int __result = 0;
+    allocation_lifetime_test_perscal_0_state_t *__state = new allocation_lifetime_test_perscal_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_perscal_0(allocation_lifetime_test_perscal_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
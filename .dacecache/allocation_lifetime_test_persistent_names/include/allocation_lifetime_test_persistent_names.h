@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_lifetime_test_persistent_namesHandle_t;
+extern "C" allocation_lifetime_test_persistent_namesHandle_t __dace_init_allocation_lifetime_test_persistent_names();
+extern "C" int __dace_exit_allocation_lifetime_test_persistent_names(allocation_lifetime_test_persistent_namesHandle_t handle);
+extern "C" void __program_allocation_lifetime_test_persistent_names(allocation_lifetime_test_persistent_namesHandle_t handle, double * __restrict__ A, double * __restrict__ output);
@@ -0,0 +1,11 @@
+#pragma once
+#include <dace/dace.h>
+
+struct allocation_lifetime_test_persistent_names_state_t {
+
+};
+
+extern double *__1_B;
+#pragma omp threadprivate(__1_B)
+extern double *__2_B;
+#pragma omp threadprivate(__2_B)
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_persistent_names.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_persistent_namesHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(4, sizeof(double));
+    double * __restrict__ output = (double*) calloc(8, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_persistent_names();
+    __program_allocation_lifetime_test_persistent_names(handle, A, output);
+    err = __dace_exit_allocation_lifetime_test_persistent_names(handle);
+
+    free(A);
+    free(output);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_persistent_names "4f9557758bfd45e22a57a716c6e63e5ce2f199130e17d84a0595700e24acd0e4"
@@ -0,0 +1,160 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_persistent_names_state_t {
+
+};
+
+double *__1_B;
+#pragma omp threadprivate(__1_B)
+double *__2_B;
+#pragma omp threadprivate(__2_B)
+inline void allocation_lifetime_test_nested2_0_2_0(allocation_lifetime_test_persistent_names_state_t *__state, double* __restrict__ __tmp2, double* __restrict__ __tmp3) {
+    double *__tmp1;
+    __tmp1 = new double DACE_ALIGN(64)[4];
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 2; __i1 += 1) {
+                    {
+                        double __in1 = __tmp2[((2 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + dace::float64(1));
+                        ///////////////////
+
+                        __tmp1[((2 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __tmp1, __1_B, 1);
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __1_B, __tmp3, 1);
+
+    }
+    delete[] __tmp1;
+    
+}
+
+inline void allocation_lifetime_test_nested1_0_4_0(allocation_lifetime_test_persistent_names_state_t *__state, double* __restrict__ __tmp4, double* __restrict__ __tmp5) {
+
+
+
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __tmp4, __2_B, 1);
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __2_B, __tmp5, 1);
+
+    }
+    
+}
+
+void __program_allocation_lifetime_test_persistent_names_internal(allocation_lifetime_test_persistent_names_state_t*__state, double * __restrict__ A, double * __restrict__ output)
+{
+
+
+
+    {
+        double* output_0;
+        output_0 = &output[4];
+
+        allocation_lifetime_test_nested2_0_2_0(__state, &A[0], &output_0[0]);
+
+    }
+
+    {
+        double* output_1;
+        output_1 = &output[0];
+
+        allocation_lifetime_test_nested1_0_4_0(__state, &A[0], &output_1[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_persistent_names(allocation_lifetime_test_persistent_names_state_t *__state, double * __restrict__ A, double * __restrict__ output)
+{
+    __program_allocation_lifetime_test_persistent_names_internal(__state, A, output);
+}
+
+struct __dace_batch_args_allocation_lifetime_test_persistent_names {
+    double *A;
+    double *output;
+};
+
+DACE_EXPORTED int __program_allocation_lifetime_test_persistent_names_batch(allocation_lifetime_test_persistent_names_state_t *__state, const __dace_batch_args_allocation_lifetime_test_persistent_names *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_allocation_lifetime_test_persistent_names_internal(__state, __args[__i].A, __args[__i].output);
+    }
+    return 0;
+}
+
+DACE_EXPORTED allocation_lifetime_test_persistent_names_state_t *__dace_init_allocation_lifetime_test_persistent_names()
+{
+    int __result = 0;
+    allocation_lifetime_test_persistent_names_state_t *__state = new allocation_lifetime_test_persistent_names_state_t;
+
+
+
+    #pragma omp parallel
+    {
+        __1_B = new double DACE_ALIGN(64)[4];
+    }
+
+    #pragma omp parallel
+    {
+        __2_B = new double DACE_ALIGN(64)[4];
+    }
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_persistent_names(allocation_lifetime_test_persistent_names_state_t *__state)
+{
+    int __err = 0;
+    #pragma omp parallel
+    {
+        delete[] __1_B;
+    }
+    #pragma omp parallel
+    {
+        delete[] __2_B;
+    }
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,20 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem.cpp" "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem.cpp.o" "gcc" "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem.cpp.o.d"
+  "/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem_221_8_0_3_2.cpp" "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem_221_8_0_3_2.cpp.o" "gcc" "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem_221_8_0_3_2.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem.cpp.o.d"
+  "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem_221_8_0_3_2.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_persistentmem.dir/root/package/.dacecache/allocation_lifetime_test_persistentmem/src/cpu/allocation_lifetime_test_persistentmem_221_8_0_3_2.cpp.o.d"
+  "liballocation_lifetime_test_persistentmem.pdb"
+  "liballocation_lifetime_test_persistentmem.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_persistentmem.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
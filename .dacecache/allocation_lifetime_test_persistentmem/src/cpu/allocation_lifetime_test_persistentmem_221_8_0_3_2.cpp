@@ -0,0 +1,33 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct allocation_lifetime_test_persistentmem_state_t;
+void allocation_lifetime_test_persistentmem_221_8_0_3_2(allocation_lifetime_test_persistentmem_state_t *__state, int&  __tmp_222_12_w, int&  __tmp_223_12_w) {
+
+    {
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_222_12)
+            __out = 3;
+            ///////////////////
+
+            dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce(&__tmp_222_12_w, __out);
+        }
+        {
+            int __inp = __tmp_222_12_w;
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_223_12)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_223_12_w = __out;
+        }
+
+    }
+    
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_lifetime_test_persistentmemHandle_t;
+extern "C" allocation_lifetime_test_persistentmemHandle_t __dace_init_allocation_lifetime_test_persistentmem();
+extern "C" int __dace_exit_allocation_lifetime_test_persistentmem(allocation_lifetime_test_persistentmemHandle_t handle);
+extern "C" void __program_allocation_lifetime_test_persistentmem(allocation_lifetime_test_persistentmemHandle_t handle, int * __restrict__ output);
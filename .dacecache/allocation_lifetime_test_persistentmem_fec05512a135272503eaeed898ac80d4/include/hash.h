@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_persistentmem "7b4e206c857a441c110125500ea0dd3f8dc0a130c901b9f210065610b34e3efa"
@@ -0,0 +1,133 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_persistentmem_state_t {
+
+};
+
+int *__0_tmp;
+#pragma omp threadprivate(__0_tmp)
+inline void allocation_lifetime_test_persistentmem_221_8_0_3_2(allocation_lifetime_test_persistentmem_state_t *__state, int&  __tmp_222_12_w, int&  __tmp_223_12_w) {
+
+    {
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_222_12)
+            __out = 3;
+            ///////////////////
+
+            dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce(&__tmp_222_12_w, __out);
+        }
+        {
+            int __inp = __tmp_222_12_w;
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_223_12)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_223_12_w = __out;
+        }
+
+    }
+    
+}
+
+void __program_allocation_lifetime_test_persistentmem_internal(allocation_lifetime_test_persistentmem_state_t*__state, int * __restrict__ output)
+{
+    int __tmp1;
+
+
+    __tmp1 = output[0];
+
+    if ((__tmp1 == 1)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i = 0; i < 2; i += 1) {
+                    {
+                        int __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_219_12)
+                        __out = i;
+                        ///////////////////
+
+                        __0_tmp[i] = __out;
+                    }
+                }
+            }
+
+        }
+
+    } else {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i = 0; i < 2; i += 1) {
+                    allocation_lifetime_test_persistentmem_221_8_0_3_2(__state, __0_tmp[i], output[i]);
+                }
+            }
+
+        }
+
+    }
+
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_persistentmem(allocation_lifetime_test_persistentmem_state_t *__state, int * __restrict__ output)
+{
+    __program_allocation_lifetime_test_persistentmem_internal(__state, output);
+}
+
+struct __dace_batch_args_allocation_lifetime_test_persistentmem {
+    int *output;
+};
+
+DACE_EXPORTED int __program_allocation_lifetime_test_persistentmem_batch(allocation_lifetime_test_persistentmem_state_t *__state, const __dace_batch_args_allocation_lifetime_test_persistentmem *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_allocation_lifetime_test_persistentmem_internal(__state, __args[__i].output);
+    }
+    return 0;
+}
+
+DACE_EXPORTED allocation_lifetime_test_persistentmem_state_t *__dace_init_allocation_lifetime_test_persistentmem()
+{
+    int __result = 0;
+    allocation_lifetime_test_persistentmem_state_t *__state = new allocation_lifetime_test_persistentmem_state_t;
+
+
+
+    #pragma omp parallel
+    {
+        __0_tmp = new int DACE_ALIGN(64)[2];
+    }
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_persistentmem(allocation_lifetime_test_persistentmem_state_t *__state)
+{
+    int __err = 0;
+    #pragma omp parallel
+    {
+        delete[] __0_tmp;
+    }
+    delete __state;
+    return __err;
+}
+
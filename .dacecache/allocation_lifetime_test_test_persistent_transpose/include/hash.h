@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_test_persistent_transpose "b8fdfb598d31707c7844a79a76b0ee1847e19fd1051fe714b3cbfe62c7038a1c"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_test_persistent_transpose.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_test_persistent_transposeHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(15, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(15, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_test_persistent_transpose();
+    __program_allocation_lifetime_test_test_persistent_transpose(handle, A, __return);
+    err = __dace_exit_allocation_lifetime_test_test_persistent_transpose(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
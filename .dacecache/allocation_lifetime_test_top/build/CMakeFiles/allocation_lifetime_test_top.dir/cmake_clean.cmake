@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top/src/cpu/allocation_lifetime_test_incall_0_2_0.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top/src/cpu/allocation_lifetime_test_incall_0_2_0.cpp.o.d"
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top/src/cpu/allocation_lifetime_test_top.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top/src/cpu/allocation_lifetime_test_top.cpp.o.d"
+  "liballocation_lifetime_test_top.pdb"
+  "liballocation_lifetime_test_top.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_top.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
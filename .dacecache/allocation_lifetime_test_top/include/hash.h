@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_top "ffba77d6b25ce0eee9624f9b562cb83b7da506cc53536369d35514a766a2ff36"
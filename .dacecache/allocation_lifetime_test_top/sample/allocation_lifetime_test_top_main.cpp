@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_top.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_topHandle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(20, sizeof(double));
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_top();
+    __program_allocation_lifetime_test_top(handle, __return, a);
+    err = __dace_exit_allocation_lifetime_test_top(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,43 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct allocation_lifetime_test_top_state_t;
+void allocation_lifetime_test_incall_0_2_0(allocation_lifetime_test_top_state_t *__state, double* __restrict__ b, double* __restrict__ __return, double* __restrict__ __tmp1) {
+    double* __tmp1_0;
+    __tmp1_0 = &__tmp1[0];
+    double* tmp;
+    tmp = &__tmp1_0[0];
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 2; __i1 += 1) {
+                    {
+                        double __in1 = tmp[((2 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_313_4)
+                        __out = (__in1 + 1);
+                        ///////////////////
+
+                        tmp[((2 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 20>::template ConstDst<1>::Copy(
+        tmp, __return, 1);
+
+    }
+    
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top_a345e2777bc300dd6f6e86e918ebf5aa/src/cpu/allocation_lifetime_test_top.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_top.dir/root/package/.dacecache/allocation_lifetime_test_top_a345e2777bc300dd6f6e86e918ebf5aa/src/cpu/allocation_lifetime_test_top.cpp.o.d"
+  "liballocation_lifetime_test_top.pdb"
+  "liballocation_lifetime_test_top.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_top.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_toppers.dir/root/package/.dacecache/allocation_lifetime_test_toppers/src/cpu/allocation_lifetime_test_nestpers_0_1_0.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_toppers.dir/root/package/.dacecache/allocation_lifetime_test_toppers/src/cpu/allocation_lifetime_test_nestpers_0_1_0.cpp.o.d"
+  "CMakeFiles/allocation_lifetime_test_toppers.dir/root/package/.dacecache/allocation_lifetime_test_toppers/src/cpu/allocation_lifetime_test_toppers.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_toppers.dir/root/package/.dacecache/allocation_lifetime_test_toppers/src/cpu/allocation_lifetime_test_toppers.cpp.o.d"
+  "liballocation_lifetime_test_toppers.pdb"
+  "liballocation_lifetime_test_toppers.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_toppers.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
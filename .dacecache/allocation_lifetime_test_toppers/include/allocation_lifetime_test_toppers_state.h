@@ -0,0 +1,7 @@
+#pragma once
+#include <dace/dace.h>
+
+struct allocation_lifetime_test_toppers_state_t {
+    double * __restrict__ __1___tmp1;
+};
+
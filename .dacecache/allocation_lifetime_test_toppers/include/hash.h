@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_toppers "3aced702652566a4199109fd87a81b3305de92bfcc3ecb6a734154e7e9a4ed56"
@@ -0,0 +1,37 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/allocation_lifetime_test_toppers_state.h"
+void allocation_lifetime_test_nestpers_0_1_0(allocation_lifetime_test_toppers_state_t *__state, double* __restrict__ __tmp2, double* __restrict__ __return) {
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = __tmp2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __state->__1___tmp1[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 20>::template ConstDst<1>::Copy(
+        __state->__1___tmp1, __return, 1);
+
+    }
+    
+}
+
@@ -0,0 +1,63 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_toppers_state_t {
+    double * __restrict__ __1___tmp1;
+};
+
+void allocation_lifetime_test_nestpers_0_1_0(allocation_lifetime_test_toppers_state_t *__state, double* __restrict__ __tmp2, double* __restrict__ __return);
+void __program_allocation_lifetime_test_toppers_internal(allocation_lifetime_test_toppers_state_t*__state, double * __restrict__ __return, double * __restrict__ a)
+{
+
+
+    {
+
+        allocation_lifetime_test_nestpers_0_1_0(__state, &a[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_toppers(allocation_lifetime_test_toppers_state_t *__state, double * __restrict__ __return, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_toppers_internal(__state, __return, a);
+}
+
+struct __dace_batch_args_allocation_lifetime_test_toppers {
+    double *__return;
+    double *a;
+};
+
+DACE_EXPORTED int __program_allocation_lifetime_test_toppers_batch(allocation_lifetime_test_toppers_state_t *__state, const __dace_batch_args_allocation_lifetime_test_toppers *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_allocation_lifetime_test_toppers_internal(__state, __args[__i].__return, __args[__i].a);
+    }
+    return 0;
+}
+
+DACE_EXPORTED allocation_lifetime_test_toppers_state_t *__dace_init_allocation_lifetime_test_toppers()
+{
+    int __result = 0;
+    allocation_lifetime_test_toppers_state_t *__state = new allocation_lifetime_test_toppers_state_t;
+
+
+    __state->__1___tmp1 = new double DACE_ALIGN(64)[20];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_toppers(allocation_lifetime_test_toppers_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__1___tmp1;
+    delete __state;
+    return __err;
+}
+
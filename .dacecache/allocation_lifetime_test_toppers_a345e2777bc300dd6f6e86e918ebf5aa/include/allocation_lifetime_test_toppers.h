@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_lifetime_test_toppersHandle_t;
+extern "C" allocation_lifetime_test_toppersHandle_t __dace_init_allocation_lifetime_test_toppers();
+extern "C" int __dace_exit_allocation_lifetime_test_toppers(allocation_lifetime_test_toppersHandle_t handle);
+extern "C" void __program_allocation_lifetime_test_toppers(allocation_lifetime_test_toppersHandle_t handle, double * __restrict__ __return, double * __restrict__ a);
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_policy_arrayHandle_t;
+extern "C" allocation_policy_arrayHandle_t __dace_init_allocation_policy_array(int N);
+extern "C" int __dace_exit_allocation_policy_array(allocation_policy_arrayHandle_t handle);
+extern "C" void __program_allocation_policy_array(allocation_policy_arrayHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/allocation_policy_array.h"
+
+int main(int argc, char **argv) {
+    allocation_policy_arrayHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc(N, sizeof(double));
+    double * __restrict__ B = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_allocation_policy_array(N);
+    __program_allocation_policy_array(handle, A, B, N);
+    err = __dace_exit_allocation_policy_array(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
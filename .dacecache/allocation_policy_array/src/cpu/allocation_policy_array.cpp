@@ -0,0 +1,119 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_policy_array_state_t {
+
+};
+
+void __program_allocation_policy_array_internal(allocation_policy_array_state_t*__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+    double *tmp;
+    tmp = dace::allocate_aligned<double>(N, 64, false, true);
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                double allocation_policy_test_scale_12_4___tmp2;
+                {
+                    double __in1 = A[i];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(2));
+                    ///////////////////
+
+                    allocation_policy_test_scale_12_4___tmp2 = __out;
+                }
+                {
+                    double __inp = allocation_policy_test_scale_12_4___tmp2;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_13_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    tmp[i] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                double __tmp2;
+                {
+                    double __in1 = tmp[i];
+                    double __in2 = A[i];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp2 = __out;
+                }
+                {
+                    double __inp = __tmp2;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_15_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    B[i] = __out;
+                }
+            }
+        }
+
+    }
+    dace::deallocate_aligned(tmp);
+}
+
+DACE_EXPORTED void __program_allocation_policy_array(allocation_policy_array_state_t *__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+    __program_allocation_policy_array_internal(__state, A, B, N);
+}
+
+struct __dace_batch_args_allocation_policy_array {
+    double *A;
+    double *B;
+    int N;
+};
+
+DACE_EXPORTED int __program_allocation_policy_array_batch(allocation_policy_array_state_t *__state, const __dace_batch_args_allocation_policy_array *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_allocation_policy_array_internal(__state, __args[__i].A, __args[__i].B, __args[__i].N);
+    }
+    return 0;
+}
+
+DACE_EXPORTED allocation_policy_array_state_t *__dace_init_allocation_policy_array(int N)
+{
+    int __result = 0;
+    allocation_policy_array_state_t *__state = new allocation_policy_array_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_policy_array(allocation_policy_array_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_policy_array.dir/root/package/.dacecache/allocation_policy_array_fec05512a135272503eaeed898ac80d4/src/cpu/allocation_policy_array.cpp.o"
+  "CMakeFiles/allocation_policy_array.dir/root/package/.dacecache/allocation_policy_array_fec05512a135272503eaeed898ac80d4/src/cpu/allocation_policy_array.cpp.o.d"
+  "liballocation_policy_array.pdb"
+  "liballocation_policy_array.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_policy_array.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_allocation_policy_array "ec8475d55514fe67abd37b2f59fac834beb99ee0463bdb62b755abba5ca09d4f"
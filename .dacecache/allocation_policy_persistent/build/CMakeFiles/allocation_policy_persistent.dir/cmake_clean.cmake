@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_policy_persistent.dir/root/package/.dacecache/allocation_policy_persistent/src/cpu/allocation_policy_persistent.cpp.o"
+  "CMakeFiles/allocation_policy_persistent.dir/root/package/.dacecache/allocation_policy_persistent/src/cpu/allocation_policy_persistent.cpp.o.d"
+  "liballocation_policy_persistent.pdb"
+  "liballocation_policy_persistent.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_policy_persistent.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
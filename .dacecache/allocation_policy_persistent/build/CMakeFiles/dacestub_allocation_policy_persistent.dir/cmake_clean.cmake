@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_allocation_policy_persistent.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_allocation_policy_persistent.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_allocation_policy_persistent.pdb"
+  "libdacestub_allocation_policy_persistent.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_allocation_policy_persistent.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
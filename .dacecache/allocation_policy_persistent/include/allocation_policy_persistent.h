@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_policy_persistentHandle_t;
+extern "C" allocation_policy_persistentHandle_t __dace_init_allocation_policy_persistent(int N);
+extern "C" int __dace_exit_allocation_policy_persistent(allocation_policy_persistentHandle_t handle);
+extern "C" void __program_allocation_policy_persistent(allocation_policy_persistentHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
@@ -0,0 +1 @@
+#define __HASH_allocation_policy_persistent "f08cdc312812b3d5d3576145c3dcf5ad34b48edc5877540cee445ecb9962858c"
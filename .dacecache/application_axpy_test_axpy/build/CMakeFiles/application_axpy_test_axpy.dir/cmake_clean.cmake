@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/application_axpy_test_axpy.dir/root/package/.dacecache/application_axpy_test_axpy/src/cpu/application_axpy_test_axpy.cpp.o"
+  "CMakeFiles/application_axpy_test_axpy.dir/root/package/.dacecache/application_axpy_test_axpy/src/cpu/application_axpy_test_axpy.cpp.o.d"
+  "libapplication_axpy_test_axpy.pdb"
+  "libapplication_axpy_test_axpy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/application_axpy_test_axpy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
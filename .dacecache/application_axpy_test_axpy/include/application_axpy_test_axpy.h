@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * application_axpy_test_axpyHandle_t;
+extern "C" application_axpy_test_axpyHandle_t __dace_init_application_axpy_test_axpy(int N);
+extern "C" int __dace_exit_application_axpy_test_axpy(application_axpy_test_axpyHandle_t handle);
+extern "C" void __program_application_axpy_test_axpy(application_axpy_test_axpyHandle_t handle, double * __restrict__ X, double * __restrict__ Y, double A, int N);
@@ -0,0 +1 @@
+#define __HASH_application_axpy_test_axpy "735a54cbfdb6abdbee06b4cd7b508d8cecf88fbb98a6dedf44e0248702e8ecdf"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/application_axpy_test_axpy.h"
+
+int main(int argc, char **argv) {
+    application_axpy_test_axpyHandle_t handle;
+    int err;
+    double A = 42;
+    int N = 42;
+    double * __restrict__ X = (double*) calloc(N, sizeof(double));
+    double * __restrict__ Y = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_application_axpy_test_axpy(N);
+    __program_application_axpy_test_axpy(handle, X, Y, A, N);
+    err = __dace_exit_application_axpy_test_axpy(handle);
+
+    free(X);
+    free(Y);
+
+
+    return err;
+}
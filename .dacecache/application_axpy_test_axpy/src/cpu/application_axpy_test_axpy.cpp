@@ -0,0 +1,84 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct application_axpy_test_axpy_state_t {
+
+};
+
+#include <arm_sve.h>
+#define __SVE_REGISTER_BYTES 64
+void __program_application_axpy_test_axpy_internal(application_axpy_test_axpy_state_t*__state, double * __restrict__ X, double * __restrict__ Y, double A, int N)
+{
+
+    {
+
+        {
+            int64_t i = 0;
+            int64_t __i_to = (N - 1);
+            svbool_t __pg_i = svwhilele_b64(i, __i_to);
+            while(svptest_any(svptrue_b64(), __pg_i)) {
+                {
+                    double in_A = A;
+                    svfloat64_t in_X = svld1(__pg_i, X + i);
+                    svfloat64_t in_Y = svld1(__pg_i, Y + i);
+                    svfloat64_t out;
+
+                    ///////////////////
+                    // Tasklet code (multiplication)
+                    out = svmad_f64_x(__pg_i, svdup_f64(in_A), in_X, in_Y);
+                    ///////////////////
+
+                    svst1(__pg_i, Y + i, out);
+                }
+                i += svcntd() * 1;
+                __pg_i = svwhilele_b64(i, __i_to);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_application_axpy_test_axpy(application_axpy_test_axpy_state_t *__state, double * __restrict__ X, double * __restrict__ Y, double A, int N)
+{
+    __program_application_axpy_test_axpy_internal(__state, X, Y, A, N);
+}
+
+struct __dace_batch_args_application_axpy_test_axpy {
+    double *X;
+    double *Y;
+    double A;
+    int N;
+};
+
+DACE_EXPORTED int __program_application_axpy_test_axpy_batch(application_axpy_test_axpy_state_t *__state, const __dace_batch_args_application_axpy_test_axpy *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_application_axpy_test_axpy_internal(__state, __args[__i].X, __args[__i].Y, __args[__i].A, __args[__i].N);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED application_axpy_test_axpy_state_t *__dace_init_application_axpy_test_axpy(int N)
+{
+    int __result = 0;
+    application_axpy_test_axpy_state_t *__state = new application_axpy_test_axpy_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_application_axpy_test_axpy(application_axpy_test_axpy_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/application_filter_test_pbf.dir/root/package/.dacecache/application_filter_test_pbf/src/cpu/application_filter_test_pbf.cpp.o"
+  "CMakeFiles/application_filter_test_pbf.dir/root/package/.dacecache/application_filter_test_pbf/src/cpu/application_filter_test_pbf.cpp.o.d"
+  "libapplication_filter_test_pbf.pdb"
+  "libapplication_filter_test_pbf.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/application_filter_test_pbf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
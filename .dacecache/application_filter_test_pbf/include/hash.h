@@ -0,0 +1 @@
+#define __HASH_application_filter_test_pbf "4381f2539415ac7d6fc44c684d8b155565ed199328bbfef845a1884dbb8e0485"
@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/application_filter_test_pbf.h"
+
+int main(int argc, char **argv) {
+    application_filter_test_pbfHandle_t handle;
+    int err;
+    int N = 42;
+    float ratio = 42;
+    float * __restrict__ A = (float*) calloc(N, sizeof(float));
+    float * __restrict__ out = (float*) calloc(N, sizeof(float));
+    unsigned int * __restrict__ outsz = (unsigned int*) calloc(1, sizeof(unsigned int));
+
+
+    handle = __dace_init_application_filter_test_pbf(N);
+    __program_application_filter_test_pbf(handle, A, out, outsz, N, ratio);
+    err = __dace_exit_application_filter_test_pbf(handle);
+
+    free(A);
+    free(out);
+    free(outsz);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/application_spmv_test_spmv.dir/root/package/.dacecache/application_spmv_test_spmv/src/cpu/application_spmv_test_spmv.cpp.o"
+  "CMakeFiles/application_spmv_test_spmv.dir/root/package/.dacecache/application_spmv_test_spmv/src/cpu/application_spmv_test_spmv.cpp.o.d"
+  "libapplication_spmv_test_spmv.pdb"
+  "libapplication_spmv_test_spmv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/application_spmv_test_spmv.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_application_spmv_test_spmv.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_application_spmv_test_spmv.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_application_spmv_test_spmv.pdb"
+  "libdacestub_application_spmv_test_spmv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_application_spmv_test_spmv.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * application_spmv_test_spmvHandle_t;
+extern "C" application_spmv_test_spmvHandle_t __dace_init_application_spmv_test_spmv(int H);
+extern "C" int __dace_exit_application_spmv_test_spmv(application_spmv_test_spmvHandle_t handle);
+extern "C" void __program_application_spmv_test_spmv(application_spmv_test_spmvHandle_t handle, unsigned int * __restrict__ A_col, unsigned int * __restrict__ A_row, float * __restrict__ A_val, float * __restrict__ b, float * __restrict__ x, int H);
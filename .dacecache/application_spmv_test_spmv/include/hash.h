@@ -0,0 +1 @@
+#define __HASH_application_spmv_test_spmv "3859f49b4f6d55507b05b7c1f0a51af12c8226657db0fc89e983b8e5a58f7fae"
@@ -0,0 +1,27 @@
+#include <cstdlib>
+#include "../include/application_spmv_test_spmv.h"
+
+int main(int argc, char **argv) {
+    application_spmv_test_spmvHandle_t handle;
+    int err;
+    int H = 42;
+    unsigned int * __restrict__ A_col = (unsigned int*) calloc(nnz, sizeof(unsigned int));
+    unsigned int * __restrict__ A_row = (unsigned int*) calloc((H + 1), sizeof(unsigned int));
+    float * __restrict__ A_val = (float*) calloc(nnz, sizeof(float));
+    float * __restrict__ b = (float*) calloc(H, sizeof(float));
+    float * __restrict__ x = (float*) calloc(W, sizeof(float));
+
+
+    handle = __dace_init_application_spmv_test_spmv(H);
+    __program_application_spmv_test_spmv(handle, A_col, A_row, A_val, b, x, H);
+    err = __dace_exit_application_spmv_test_spmv(handle);
+
+    free(A_col);
+    free(A_row);
+    free(A_val);
+    free(b);
+    free(x);
+
+
+    return err;
+}
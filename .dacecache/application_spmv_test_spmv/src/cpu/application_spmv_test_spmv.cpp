@@ -0,0 +1,103 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct application_spmv_test_spmv_state_t {
+
+};
+
+#include <arm_sve.h>
+#define __SVE_REGISTER_BYTES 64
+void __program_application_spmv_test_spmv_internal(application_spmv_test_spmv_state_t*__state, unsigned int * __restrict__ A_col, unsigned int * __restrict__ A_row, float * __restrict__ A_val, float * __restrict__ b, float * __restrict__ x, int H)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < H; i += 1) {
+                {
+                    unsigned int __compute_b0 = A_row[i];
+                    unsigned int __compute_e1 = A_row[(i + 1)];
+                    int j = __compute_b0;
+                    int __j_to = (__compute_e1 - 1);
+                    svbool_t __pg_j = svwhilele_b32(j, __j_to);
+                    while(svptest_any(svptrue_b32(), __pg_j)) {
+                        svfloat32_t __in_x_value;
+                        {
+                            float* __ind_in_x = x;
+                            svuint32_t index_A_col_0 = svld1(__pg_j, A_col + j);
+                            svfloat32_t lookup;
+
+                            ///////////////////
+                            // Tasklet code (Indirection)
+                            lookup = svld1_gather_index(__pg_j, __ind_in_x, index_A_col_0);
+                            ///////////////////
+
+                            __in_x_value = lookup;
+                        }
+                        {
+                            svfloat32_t in_x = __in_x_value;
+                            svfloat32_t a = svld1(__pg_j, A_val + j);
+
+                            ///////////////////
+                            // Tasklet code (compute)
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(b + i, svaddv(__pg_j, svmul_x(__pg_j, a, in_x)));
+                            ///////////////////
+
+                        }
+                        j += svcntw() * 1;
+                        __pg_j = svwhilele_b32(j, __j_to);
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_application_spmv_test_spmv(application_spmv_test_spmv_state_t *__state, unsigned int * __restrict__ A_col, unsigned int * __restrict__ A_row, float * __restrict__ A_val, float * __restrict__ b, float * __restrict__ x, int H)
+{
+    __program_application_spmv_test_spmv_internal(__state, A_col, A_row, A_val, b, x, H);
+}
+
+struct __dace_batch_args_application_spmv_test_spmv {
+    unsigned int *A_col;
+    unsigned int *A_row;
+    float *A_val;
+    float *b;
+    float *x;
+    int H;
+};
+
+DACE_EXPORTED int __program_application_spmv_test_spmv_batch(application_spmv_test_spmv_state_t *__state, const __dace_batch_args_application_spmv_test_spmv *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_application_spmv_test_spmv_internal(__state, __args[__i].A_col, __args[__i].A_row, __args[__i].A_val, __args[__i].b, __args[__i].x, __args[__i].H);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED application_spmv_test_spmv_state_t *__dace_init_application_spmv_test_spmv(int H)
+{
+    int __result = 0;
+    application_spmv_test_spmv_state_t *__state = new application_spmv_test_spmv_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_application_spmv_test_spmv(application_spmv_test_spmv_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/arc_distance_test_arc_distance/src/cpu/arc_distance_test_arc_distance.cpp" "CMakeFiles/arc_distance_test_arc_distance.dir/root/package/.dacecache/arc_distance_test_arc_distance/src/cpu/arc_distance_test_arc_distance.cpp.o" "gcc" "CMakeFiles/arc_distance_test_arc_distance.dir/root/package/.dacecache/arc_distance_test_arc_distance/src/cpu/arc_distance_test_arc_distance.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arc_distance_test_arc_distance.dir/root/package/.dacecache/arc_distance_test_arc_distance/src/cpu/arc_distance_test_arc_distance.cpp.o"
+  "CMakeFiles/arc_distance_test_arc_distance.dir/root/package/.dacecache/arc_distance_test_arc_distance/src/cpu/arc_distance_test_arc_distance.cpp.o.d"
+  "libarc_distance_test_arc_distance.pdb"
+  "libarc_distance_test_arc_distance.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arc_distance_test_arc_distance.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * arc_distance_test_arc_distanceHandle_t;
+extern "C" arc_distance_test_arc_distanceHandle_t __dace_init_arc_distance_test_arc_distance(long long N);
+extern "C" int __dace_exit_arc_distance_test_arc_distance(arc_distance_test_arc_distanceHandle_t handle);
+extern "C" void __program_arc_distance_test_arc_distance(arc_distance_test_arc_distanceHandle_t handle, double * __restrict__ __return, double * __restrict__ phi_1, double * __restrict__ phi_2, double * __restrict__ theta_1, double * __restrict__ theta_2, long long N);
@@ -0,0 +1 @@
+#define __HASH_arc_distance_test_arc_distance "76803ddd0af1d0ba5442ef07f855f6549867109794fe739940d055210f4b4667"
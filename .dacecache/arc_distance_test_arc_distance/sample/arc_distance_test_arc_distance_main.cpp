@@ -0,0 +1,27 @@
+#include <cstdlib>
+#include "../include/arc_distance_test_arc_distance.h"
+
+int main(int argc, char **argv) {
+    arc_distance_test_arc_distanceHandle_t handle;
+    int err;
+    long long N = 42;
+    double * __restrict__ __return = (double*) calloc(N, sizeof(double));
+    double * __restrict__ phi_1 = (double*) calloc(N, sizeof(double));
+    double * __restrict__ phi_2 = (double*) calloc(N, sizeof(double));
+    double * __restrict__ theta_1 = (double*) calloc(N, sizeof(double));
+    double * __restrict__ theta_2 = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_arc_distance_test_arc_distance(N);
+    __program_arc_distance_test_arc_distance(handle, __return, phi_1, phi_2, theta_1, theta_2, N);
+    err = __dace_exit_arc_distance_test_arc_distance(handle);
+
+    free(__return);
+    free(phi_1);
+    free(phi_2);
+    free(theta_1);
+    free(theta_2);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_argument_test_tester "f613223bbcccc28f02f4f49d6c63231d72c2e3ceda92a95d66a958dbc72fe765"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/argument_test_tester.h"
+
+int main(int argc, char **argv) {
+    argument_test_testerHandle_t handle;
+    int err;
+    double * __restrict__ x = (double*) calloc(400, sizeof(double));
+
+
+    handle = __dace_init_argument_test_tester();
+    __program_argument_test_tester(handle, x);
+    err = __dace_exit_argument_test_tester(handle);
+
+    free(x);
+
+
+    return err;
+}
@@ -0,0 +1,65 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct argument_test_tester_state_t;
+void argument_test_nester_23_4_0_1_4(argument_test_tester_state_t *__state, double* __restrict__ __tmp_30_24_r, double&  __tmp_32_8_w, long long __tmp2) {
+    double elem;
+    long long ii;
+
+    {
+
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_27_8)
+            __out = 0;
+            ///////////////////
+
+            elem = __out;
+        }
+
+    }
+
+
+    for (ii = 0; (ii < min(__tmp2, 6)); ii = (ii + 1)) {
+
+        if (((ii % 2) == 0)) {
+            {
+
+                {
+                    double __in1 = elem;
+                    double __in2 = __tmp_30_24_r[ii];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_30_16)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    elem = __out;
+                }
+
+            }
+
+        }
+
+
+    }
+    {
+
+        {
+            double __inp = elem;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_32_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_32_8_w = __out;
+        }
+
+    }
+    
+}
+
@@ -0,0 +1,95 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct argument_test_tester_state_t {
+
+};
+
+void argument_test_nester_23_4_0_1_4(argument_test_tester_state_t *__state, double* __restrict__ __tmp_30_24_r, double&  __tmp_32_8_w, long long __tmp2);
+void __program_argument_test_tester_internal(argument_test_tester_state_t*__state, double * __restrict__ x)
+{
+    double *gdx;
+    gdx = new double DACE_ALIGN(64)[10];
+    long long T;
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_full_)
+                    __out = 1.0;
+                    ///////////////////
+
+                    gdx[__i0] = __out;
+                }
+            }
+        }
+
+    }
+
+
+    for (T = 0; (T < 2); T = (T + 1)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i = 0; i < 20; i += 1) {
+                    for (auto j = 0; j < 20; j += 1) {
+                        argument_test_nester_23_4_0_1_4(__state, &gdx[0], x[(i + (20 * j))], T);
+                    }
+                }
+            }
+
+        }
+
+    }
+
+    delete[] gdx;
+}
+
+DACE_EXPORTED void __program_argument_test_tester(argument_test_tester_state_t *__state, double * __restrict__ x)
+{
+    __program_argument_test_tester_internal(__state, x);
+}
+
+struct __dace_batch_args_argument_test_tester {
+    double *x;
+};
+
+DACE_EXPORTED int __program_argument_test_tester_batch(argument_test_tester_state_t *__state, const __dace_batch_args_argument_test_tester *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_argument_test_tester_internal(__state, __args[__i].x);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED argument_test_tester_state_t *__dace_init_argument_test_tester()
+{
+    int __result = 0;
+    argument_test_tester_state_t *__state = new argument_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_argument_test_tester(argument_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
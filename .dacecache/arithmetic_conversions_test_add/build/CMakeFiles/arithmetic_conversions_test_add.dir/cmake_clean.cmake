@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arithmetic_conversions_test_add.dir/root/package/.dacecache/arithmetic_conversions_test_add/src/cpu/arithmetic_conversions_test_add.cpp.o"
+  "CMakeFiles/arithmetic_conversions_test_add.dir/root/package/.dacecache/arithmetic_conversions_test_add/src/cpu/arithmetic_conversions_test_add.cpp.o.d"
+  "libarithmetic_conversions_test_add.pdb"
+  "libarithmetic_conversions_test_add.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arithmetic_conversions_test_add.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_arithmetic_conversions_test_add.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_arithmetic_conversions_test_add.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_arithmetic_conversions_test_add.pdb"
+  "libdacestub_arithmetic_conversions_test_add.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_arithmetic_conversions_test_add.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_add "67b9666ad957e1d8ad0bdc84e00626ecc84f5280a9aa0f8317407d9a38dacc63"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/arithmetic_conversions_test_add.h"
+
+int main(int argc, char **argv) {
+    arithmetic_conversions_test_addHandle_t handle;
+    int err;
+    dace::complex64 * __restrict__ A = (dace::complex64*) calloc(25, sizeof(dace::complex64));
+    double * __restrict__ B = (double*) calloc(25, sizeof(double));
+    dace::complex128 * __restrict__ __return = (dace::complex128*) calloc(25, sizeof(dace::complex128));
+
+
+    handle = __dace_init_arithmetic_conversions_test_add();
+    __program_arithmetic_conversions_test_add(handle, A, B, __return);
+    err = __dace_exit_arithmetic_conversions_test_add(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
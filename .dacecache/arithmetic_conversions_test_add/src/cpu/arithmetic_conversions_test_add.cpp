@@ -0,0 +1,78 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arithmetic_conversions_test_add_state_t {
+
+};
+
+void __program_arithmetic_conversions_test_add_internal(arithmetic_conversions_test_add_state_t*__state, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        dace::complex64 __in1 = A[((5 * __i0) + __i1)];
+                        double __in2 = B[((5 * __i0) + __i1)];
+                        dace::complex128 __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (dace::complex128(__in1) + dace::complex128(__in2));
+                        ///////////////////
+
+                        __return[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arithmetic_conversions_test_add(arithmetic_conversions_test_add_state_t *__state, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return)
+{
+    __program_arithmetic_conversions_test_add_internal(__state, A, B, __return);
+}
+
+struct __dace_batch_args_arithmetic_conversions_test_add {
+    dace::complex64 *A;
+    double *B;
+    dace::complex128 *__return;
+};
+
+DACE_EXPORTED int __program_arithmetic_conversions_test_add_batch(arithmetic_conversions_test_add_state_t *__state, const __dace_batch_args_arithmetic_conversions_test_add *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_arithmetic_conversions_test_add_internal(__state, __args[__i].A, __args[__i].B, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED arithmetic_conversions_test_add_state_t *__dace_init_arithmetic_conversions_test_add()
+{
+    int __result = 0;
+    arithmetic_conversions_test_add_state_t *__state = new arithmetic_conversions_test_add_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arithmetic_conversions_test_add(arithmetic_conversions_test_add_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
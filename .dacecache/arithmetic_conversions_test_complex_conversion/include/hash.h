@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_complex_conversion "e4cd2099853fc33281d00ac48855548de4fefd9582819e69d627acaf065f7aa4"
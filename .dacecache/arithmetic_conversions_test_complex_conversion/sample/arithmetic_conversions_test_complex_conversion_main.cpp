@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/arithmetic_conversions_test_complex_conversion.h"
+
+int main(int argc, char **argv) {
+    arithmetic_conversions_test_complex_conversionHandle_t handle;
+    int err;
+    int b = 42;
+    dace::complex128 * __restrict__ __return = (dace::complex128*) calloc(1, sizeof(dace::complex128));
+    dace::complex128 * __restrict__ a = (dace::complex128*) calloc(1, sizeof(dace::complex128));
+
+
+    handle = __dace_init_arithmetic_conversions_test_complex_conversion();
+    __program_arithmetic_conversions_test_complex_conversion(handle, __return, a, b);
+    err = __dace_exit_arithmetic_conversions_test_complex_conversion(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
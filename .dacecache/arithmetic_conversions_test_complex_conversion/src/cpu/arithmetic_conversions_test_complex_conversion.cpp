@@ -0,0 +1,87 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arithmetic_conversions_test_complex_conversion_state_t {
+
+};
+
+void __program_arithmetic_conversions_test_complex_conversion_internal(arithmetic_conversions_test_complex_conversion_state_t*__state, dace::complex128 * __restrict__ __return, dace::complex128 * __restrict__ a, int b)
+{
+
+    {
+        dace::complex128 __tmp0;
+        dace::complex128 __tmp1;
+
+
+        dace::CopyND<dace::complex128, 1, false, 1>::template ConstDst<1>::Copy(
+        a, &__tmp0, 1);
+        {
+            int __in2 = b;
+            dace::complex128 __in1 = __tmp0;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(__in2));
+            ///////////////////
+
+            __tmp1 = __out;
+        }
+        {
+            dace::complex128 __inp = __tmp1;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (assign_20_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arithmetic_conversions_test_complex_conversion(arithmetic_conversions_test_complex_conversion_state_t *__state, dace::complex128 * __restrict__ __return, dace::complex128 * __restrict__ a, int b)
+{
+    __program_arithmetic_conversions_test_complex_conversion_internal(__state, __return, a, b);
+}
+
+struct __dace_batch_args_arithmetic_conversions_test_complex_conversion {
+    dace::complex128 *__return;
+    dace::complex128 *a;
+    int b;
+};
+
+DACE_EXPORTED int __program_arithmetic_conversions_test_complex_conversion_batch(arithmetic_conversions_test_complex_conversion_state_t *__state, const __dace_batch_args_arithmetic_conversions_test_complex_conversion *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_arithmetic_conversions_test_complex_conversion_internal(__state, __args[__i].__return, __args[__i].a, __args[__i].b);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED arithmetic_conversions_test_complex_conversion_state_t *__dace_init_arithmetic_conversions_test_complex_conversion()
+{
+    int __result = 0;
+    arithmetic_conversions_test_complex_conversion_state_t *__state = new arithmetic_conversions_test_complex_conversion_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arithmetic_conversions_test_complex_conversion(arithmetic_conversions_test_complex_conversion_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * arithmetic_conversions_test_float_conversionHandle_t;
+extern "C" arithmetic_conversions_test_float_conversionHandle_t __dace_init_arithmetic_conversions_test_float_conversion();
+extern "C" int __dace_exit_arithmetic_conversions_test_float_conversion(arithmetic_conversions_test_float_conversionHandle_t handle);
+extern "C" void __program_arithmetic_conversions_test_float_conversion(arithmetic_conversions_test_float_conversionHandle_t handle, double * __restrict__ __return, float a, long long b);
@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_float_conversion "a713d100c1ccaef2541cdaba6fbe760db50aa5c494b5592037b4f95cb19f02d8"
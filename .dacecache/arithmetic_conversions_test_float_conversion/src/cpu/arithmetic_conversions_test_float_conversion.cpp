@@ -0,0 +1,83 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arithmetic_conversions_test_float_conversion_state_t {
+
+};
+
+void __program_arithmetic_conversions_test_float_conversion_internal(arithmetic_conversions_test_float_conversion_state_t*__state, double * __restrict__ __return, float a, long long b)
+{
+
+    {
+        double __tmp0;
+
+        {
+            float __in1 = a;
+            long long __in2 = b;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (dace::float64(__in1) + dace::float64(__in2));
+            ///////////////////
+
+            __tmp0 = __out;
+        }
+        {
+            double __inp = __tmp0;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_33_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arithmetic_conversions_test_float_conversion(arithmetic_conversions_test_float_conversion_state_t *__state, double * __restrict__ __return, float a, long long b)
+{
+    __program_arithmetic_conversions_test_float_conversion_internal(__state, __return, a, b);
+}
+
+struct __dace_batch_args_arithmetic_conversions_test_float_conversion {
+    double *__return;
+    float a;
+    long long b;
+};
+
+DACE_EXPORTED int __program_arithmetic_conversions_test_float_conversion_batch(arithmetic_conversions_test_float_conversion_state_t *__state, const __dace_batch_args_arithmetic_conversions_test_float_conversion *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_arithmetic_conversions_test_float_conversion_internal(__state, __args[__i].__return, __args[__i].a, __args[__i].b);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED arithmetic_conversions_test_float_conversion_state_t *__dace_init_arithmetic_conversions_test_float_conversion()
+{
+    int __result = 0;
+    arithmetic_conversions_test_float_conversion_state_t *__state = new arithmetic_conversions_test_float_conversion_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arithmetic_conversions_test_float_conversion(arithmetic_conversions_test_float_conversion_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
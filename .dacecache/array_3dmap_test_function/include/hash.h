@@ -0,0 +1 @@
+#define __HASH_array_3dmap_test_function "6d5da0e2938ba49537f684389d1b62a1b9811b4bb5b818966ea3618490b22ef3"
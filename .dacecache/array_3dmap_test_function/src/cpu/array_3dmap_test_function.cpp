@@ -0,0 +1,76 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_3dmap_test_function_state_t {
+
+};
+
+void __program_array_3dmap_test_function_internal(array_3dmap_test_function_state_t*__state, double * __restrict__ d)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto tmp_parfor_2 = 1; tmp_parfor_2 < 5; tmp_parfor_2 += 1) {
+                for (auto tmp_parfor_1 = 1; tmp_parfor_1 < 5; tmp_parfor_1 += 1) {
+                    for (auto tmp_parfor_0 = 1; tmp_parfor_0 < 5; tmp_parfor_0 += 1) {
+                        {
+                            double d_out_1;
+
+                            ///////////////////
+                            // Tasklet code (T_l11_c11)
+                            d_out_1 = 7;
+                            ///////////////////
+
+                            d[(((tmp_parfor_0 + (4 * tmp_parfor_1)) + (16 * tmp_parfor_2)) - 21)] = d_out_1;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_array_3dmap_test_function(array_3dmap_test_function_state_t *__state, double * __restrict__ d)
+{
+    __program_array_3dmap_test_function_internal(__state, d);
+}
+
+struct __dace_batch_args_array_3dmap_test_function {
+    double * d;
+};
+
+DACE_EXPORTED int __program_array_3dmap_test_function_batch(array_3dmap_test_function_state_t *__state, const __dace_batch_args_array_3dmap_test_function *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_3dmap_test_function_internal(__state, __args[__i].d);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_3dmap_test_function_state_t *__dace_init_array_3dmap_test_function()
+{
+    int __result = 0;
+    array_3dmap_test_function_state_t *__state = new array_3dmap_test_function_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_3dmap_test_function(array_3dmap_test_function_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
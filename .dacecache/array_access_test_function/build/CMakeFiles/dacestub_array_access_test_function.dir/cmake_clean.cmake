@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_access_test_function.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_access_test_function.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_access_test_function.pdb"
+  "libdacestub_array_access_test_function.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_access_test_function.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_access_test_function "d4808b9205adbcae472d176145fd6136e55ec8f58160ee97ac43f6cf6afc9c46"
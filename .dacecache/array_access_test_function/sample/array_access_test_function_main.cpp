@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_access_test_function.h"
+
+int main(int argc, char **argv) {
+    array_access_test_functionHandle_t handle;
+    int err;
+    double * __restrict__ d = (double*) calloc(4, sizeof(double));
+
+
+    handle = __dace_init_array_access_test_function();
+    __program_array_access_test_function(handle, d);
+    err = __dace_exit_array_access_test_function(handle);
+
+    free(d);
+
+
+    return err;
+}
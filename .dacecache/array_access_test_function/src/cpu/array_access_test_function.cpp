@@ -0,0 +1,67 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_access_test_function_state_t {
+
+};
+
+void __program_array_access_test_function_internal(array_access_test_function_state_t*__state, double * __restrict__ d)
+{
+
+    {
+
+        {
+            double d_out_1;
+
+            ///////////////////
+            // Tasklet code (T_l11_c11)
+            d_out_1 = 5.5;
+            ///////////////////
+
+            d[1] = d_out_1;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_array_access_test_function(array_access_test_function_state_t *__state, double * __restrict__ d)
+{
+    __program_array_access_test_function_internal(__state, d);
+}
+
+struct __dace_batch_args_array_access_test_function {
+    double * d;
+};
+
+DACE_EXPORTED int __program_array_access_test_function_batch(array_access_test_function_state_t *__state, const __dace_batch_args_array_access_test_function *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_access_test_function_internal(__state, __args[__i].d);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_access_test_function_state_t *__dace_init_array_access_test_function()
+{
+    int __result = 0;
+    array_access_test_function_state_t *__state = new array_access_test_function_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_access_test_function(array_access_test_function_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
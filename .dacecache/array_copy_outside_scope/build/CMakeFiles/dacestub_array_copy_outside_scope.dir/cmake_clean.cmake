@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_copy_outside_scope.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_copy_outside_scope.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_copy_outside_scope.pdb"
+  "libdacestub_array_copy_outside_scope.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_copy_outside_scope.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_copy_outside_scope "0bf6581875a56466a4722b28fbb04bda461b2fd5f60fb990ec1724dd0e2aca44"
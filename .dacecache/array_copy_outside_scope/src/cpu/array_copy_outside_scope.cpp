@@ -0,0 +1,90 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_copy_outside_scope_state_t {
+
+};
+
+inline void nested_sdfg_0_0_2(array_copy_outside_scope_state_t *__state, int* __restrict__ ninp, int* __restrict__ nout) {
+
+    {
+        int *ntmp;
+        ntmp = new int DACE_ALIGN(64)[10];
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 10; i += 1) {
+                {
+                    int __inp = ninp[i];
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (tasklet)
+                    __out = (__inp + 1);
+                    ///////////////////
+
+                    ntmp[i] = __out;
+                }
+            }
+        }
+
+        dace::CopyND<int, 1, false, 10>::template ConstDst<1>::Copy(
+        ntmp, nout, 1);
+        delete[] ntmp;
+
+    }
+    
+}
+
+void __program_array_copy_outside_scope_internal(array_copy_outside_scope_state_t*__state, int * __restrict__ inp, int * __restrict__ out)
+{
+
+    {
+
+        nested_sdfg_0_0_2(__state, &inp[0], &out[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_array_copy_outside_scope(array_copy_outside_scope_state_t *__state, int * __restrict__ inp, int * __restrict__ out)
+{
+    __program_array_copy_outside_scope_internal(__state, inp, out);
+}
+
+struct __dace_batch_args_array_copy_outside_scope {
+    int * inp;
+    int * out;
+};
+
+DACE_EXPORTED int __program_array_copy_outside_scope_batch(array_copy_outside_scope_state_t *__state, const __dace_batch_args_array_copy_outside_scope *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_copy_outside_scope_internal(__state, __args[__i].inp, __args[__i].out);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_copy_outside_scope_state_t *__dace_init_array_copy_outside_scope()
+{
+    int __result = 0;
+    array_copy_outside_scope_state_t *__state = new array_copy_outside_scope_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_copy_outside_scope(array_copy_outside_scope_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
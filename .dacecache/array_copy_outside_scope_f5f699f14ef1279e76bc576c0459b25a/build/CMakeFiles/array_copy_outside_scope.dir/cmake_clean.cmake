@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_copy_outside_scope.dir/root/package/.dacecache/array_copy_outside_scope_f5f699f14ef1279e76bc576c0459b25a/src/cpu/array_copy_outside_scope.cpp.o"
+  "CMakeFiles/array_copy_outside_scope.dir/root/package/.dacecache/array_copy_outside_scope_f5f699f14ef1279e76bc576c0459b25a/src/cpu/array_copy_outside_scope.cpp.o.d"
+  "libarray_copy_outside_scope.pdb"
+  "libarray_copy_outside_scope.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_copy_outside_scope.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
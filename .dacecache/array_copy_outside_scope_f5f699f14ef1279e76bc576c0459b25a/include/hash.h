@@ -0,0 +1 @@
+#define __HASH_array_copy_outside_scope "f5ff0d63eb7e067a16a5a4d46fe630c5b6d5e82d5761a019caa3e1c5a8f7fe11"
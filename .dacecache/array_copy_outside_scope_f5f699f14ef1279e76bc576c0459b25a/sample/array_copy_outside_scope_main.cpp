@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/array_copy_outside_scope.h"
+
+int main(int argc, char **argv) {
+    array_copy_outside_scopeHandle_t handle;
+    int err;
+    int * __restrict__ inp = (int*) calloc(10, sizeof(int));
+    int * __restrict__ out = (int*) calloc(10, sizeof(int));
+
+
+    handle = __dace_init_array_copy_outside_scope();
+    __program_array_copy_outside_scope(handle, inp, out);
+    err = __dace_exit_array_copy_outside_scope(handle);
+
+    free(inp);
+    free(out);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_empty.dir/root/package/.dacecache/array_creation_test_empty/src/cpu/array_creation_test_empty.cpp.o"
+  "CMakeFiles/array_creation_test_empty.dir/root/package/.dacecache/array_creation_test_empty/src/cpu/array_creation_test_empty.cpp.o.d"
+  "libarray_creation_test_empty.pdb"
+  "libarray_creation_test_empty.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_empty.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_creation_test_empty.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_creation_test_empty.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_creation_test_empty.pdb"
+  "libdacestub_array_creation_test_empty.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_creation_test_empty.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_emptyHandle_t;
+extern "C" array_creation_test_emptyHandle_t __dace_init_array_creation_test_empty();
+extern "C" int __dace_exit_array_creation_test_empty(array_creation_test_emptyHandle_t handle);
+extern "C" void __program_array_creation_test_empty(array_creation_test_emptyHandle_t handle, unsigned int * __restrict__ __return);
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_empty "5b1d5ba16bcb8e9715267e387adfbb0fe74307d3d493c3c823eeb88f68170060"
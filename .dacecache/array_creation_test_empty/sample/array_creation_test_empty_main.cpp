@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_empty.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_emptyHandle_t handle;
+    int err;
+    unsigned int * __restrict__ __return = (unsigned int*) calloc(200, sizeof(unsigned int));
+
+
+    handle = __dace_init_array_creation_test_empty();
+    __program_array_creation_test_empty(handle, __return);
+    err = __dace_exit_array_creation_test_empty(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_empty_like1 "87f12715510d8eb5b443d4600716d7a6ce6b881ffd5c8204e7489d8cb500c3b8"
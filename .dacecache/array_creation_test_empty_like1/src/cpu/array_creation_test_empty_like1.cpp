@@ -0,0 +1,55 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_creation_test_empty_like1_state_t {
+
+};
+
+void __program_array_creation_test_empty_like1_internal(array_creation_test_empty_like1_state_t*__state, dace::complex64 * __restrict__ A, dace::complex64 * __restrict__ __return)
+{
+
+
+}
+
+DACE_EXPORTED void __program_array_creation_test_empty_like1(array_creation_test_empty_like1_state_t *__state, dace::complex64 * __restrict__ A, dace::complex64 * __restrict__ __return)
+{
+    __program_array_creation_test_empty_like1_internal(__state, A, __return);
+}
+
+struct __dace_batch_args_array_creation_test_empty_like1 {
+    dace::complex64 * __restrict__ A;
+    dace::complex64 * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_array_creation_test_empty_like1_batch(array_creation_test_empty_like1_state_t *__state, const __dace_batch_args_array_creation_test_empty_like1 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_creation_test_empty_like1_internal(__state, __args[__i].A, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_creation_test_empty_like1_state_t *__dace_init_array_creation_test_empty_like1()
+{
+    int __result = 0;
+    array_creation_test_empty_like1_state_t *__state = new array_creation_test_empty_like1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_creation_test_empty_like1(array_creation_test_empty_like1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
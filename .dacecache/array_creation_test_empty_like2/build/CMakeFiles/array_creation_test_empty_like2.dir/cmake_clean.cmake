@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_empty_like2.dir/root/package/.dacecache/array_creation_test_empty_like2/src/cpu/array_creation_test_empty_like2.cpp.o"
+  "CMakeFiles/array_creation_test_empty_like2.dir/root/package/.dacecache/array_creation_test_empty_like2/src/cpu/array_creation_test_empty_like2.cpp.o.d"
+  "libarray_creation_test_empty_like2.pdb"
+  "libarray_creation_test_empty_like2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_empty_like2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_empty_like2Handle_t;
+extern "C" array_creation_test_empty_like2Handle_t __dace_init_array_creation_test_empty_like2();
+extern "C" int __dace_exit_array_creation_test_empty_like2(array_creation_test_empty_like2Handle_t handle);
+extern "C" void __program_array_creation_test_empty_like2(array_creation_test_empty_like2Handle_t handle, dace::complex64 * __restrict__ A, dace::complex64 * __restrict__ __return);
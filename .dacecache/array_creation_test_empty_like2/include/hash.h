@@ -0,0 +1 @@
+#define __HASH_array_creation_test_empty_like2 "b0e9133b42ebbd2c71dfd8be7dac065d17d49b6d6427a4fa1cd613be68a3d69b"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_empty_like3.dir/root/package/.dacecache/array_creation_test_empty_like3/src/cpu/array_creation_test_empty_like3.cpp.o"
+  "CMakeFiles/array_creation_test_empty_like3.dir/root/package/.dacecache/array_creation_test_empty_like3/src/cpu/array_creation_test_empty_like3.cpp.o.d"
+  "libarray_creation_test_empty_like3.pdb"
+  "libarray_creation_test_empty_like3.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_empty_like3.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_empty_like3 "4b5db6eef8c37a26c8aeeaeb317f0612f94fa966404111cd215f70e0f17db104"
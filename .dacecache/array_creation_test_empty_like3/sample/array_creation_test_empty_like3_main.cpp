@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/array_creation_test_empty_like3.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_empty_like3Handle_t handle;
+    int err;
+    dace::complex64 * __restrict__ A = (dace::complex64*) calloc(400, sizeof(dace::complex64));
+    unsigned char * __restrict__ __return = (unsigned char*) calloc(400, sizeof(unsigned char));
+
+
+    handle = __dace_init_array_creation_test_empty_like3();
+    __program_array_creation_test_empty_like3(handle, A, __return);
+    err = __dace_exit_array_creation_test_empty_like3(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
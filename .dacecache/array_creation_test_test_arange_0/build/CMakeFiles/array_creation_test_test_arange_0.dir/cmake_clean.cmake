@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_arange_0.dir/root/package/.dacecache/array_creation_test_test_arange_0/src/cpu/array_creation_test_test_arange_0.cpp.o"
+  "CMakeFiles/array_creation_test_test_arange_0.dir/root/package/.dacecache/array_creation_test_test_arange_0/src/cpu/array_creation_test_test_arange_0.cpp.o.d"
+  "libarray_creation_test_test_arange_0.pdb"
+  "libarray_creation_test_test_arange_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_arange_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
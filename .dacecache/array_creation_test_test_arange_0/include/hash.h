@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_0 "cc573a3e12fb378fca84fd71ce239ae3bd0daa355db2958f88a60252c486e457"
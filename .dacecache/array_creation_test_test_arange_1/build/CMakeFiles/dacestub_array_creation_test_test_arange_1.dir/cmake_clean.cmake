@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_creation_test_test_arange_1.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_creation_test_test_arange_1.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_creation_test_test_arange_1.pdb"
+  "libdacestub_array_creation_test_test_arange_1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_creation_test_test_arange_1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
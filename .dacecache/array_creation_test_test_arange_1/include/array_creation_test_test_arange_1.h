@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_test_arange_1Handle_t;
+extern "C" array_creation_test_test_arange_1Handle_t __dace_init_array_creation_test_test_arange_1();
+extern "C" int __dace_exit_array_creation_test_test_arange_1(array_creation_test_test_arange_1Handle_t handle);
+extern "C" void __program_array_creation_test_test_arange_1(array_creation_test_test_arange_1Handle_t handle, int * __restrict__ __return);
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_1 "e2d92d3977d7ed4e2012d3094ab190cebb22f45f3baf00f17ece84a440b1d285"
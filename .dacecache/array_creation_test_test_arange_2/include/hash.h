@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_2 "23de2dbc2494a40d5d01ba5c8dfc62faafe8c5ac4becbcbced61df675eac4bc8"
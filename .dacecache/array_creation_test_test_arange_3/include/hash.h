@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_3 "86cc1870e11985563d0e94fc968a2492a86eb9ebe22af4fa3e7d0fe82ca12034"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_arange_3.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_arange_3Handle_t handle;
+    int err;
+    float * __restrict__ __return = (float*) calloc(3, sizeof(float));
+
+
+    handle = __dace_init_array_creation_test_test_arange_3();
+    __program_array_creation_test_test_arange_3(handle, __return);
+    err = __dace_exit_array_creation_test_test_arange_3(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_creation_test_test_arange_4.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_creation_test_test_arange_4.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_creation_test_test_arange_4.pdb"
+  "libdacestub_array_creation_test_test_arange_4.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_creation_test_test_arange_4.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
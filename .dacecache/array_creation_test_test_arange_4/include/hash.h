@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_4 "663893d50a3f10408f885187e0216517c6c3627239821b98ae6753c69e909dd8"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_arange_4.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_arange_4Handle_t handle;
+    int err;
+    int * __restrict__ __return = (int*) calloc(3, sizeof(int));
+
+
+    handle = __dace_init_array_creation_test_test_arange_4();
+    __program_array_creation_test_test_arange_4(handle, __return);
+    err = __dace_exit_array_creation_test_test_arange_4(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_arange_5.dir/root/package/.dacecache/array_creation_test_test_arange_5/src/cpu/array_creation_test_test_arange_5.cpp.o"
+  "CMakeFiles/array_creation_test_test_arange_5.dir/root/package/.dacecache/array_creation_test_test_arange_5/src/cpu/array_creation_test_test_arange_5.cpp.o.d"
+  "libarray_creation_test_test_arange_5.pdb"
+  "libarray_creation_test_test_arange_5.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_arange_5.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_5 "93b43e7e0716ef57f6fd484b0b1c19514d3dd4e4e854cfc9bd4d49650149629c"
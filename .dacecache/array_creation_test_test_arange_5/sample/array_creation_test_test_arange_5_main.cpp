@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_arange_5.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_arange_5Handle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(3, sizeof(double));
+
+
+    handle = __dace_init_array_creation_test_test_arange_5();
+    __program_array_creation_test_test_arange_5(handle, __return);
+    err = __dace_exit_array_creation_test_test_arange_5(handle);
+
+    free(__return);
+
+
+    return err;
+}
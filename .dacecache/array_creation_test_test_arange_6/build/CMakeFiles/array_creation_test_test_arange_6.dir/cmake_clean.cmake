@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_arange_6.dir/root/package/.dacecache/array_creation_test_test_arange_6/src/cpu/array_creation_test_test_arange_6.cpp.o"
+  "CMakeFiles/array_creation_test_test_arange_6.dir/root/package/.dacecache/array_creation_test_test_arange_6/src/cpu/array_creation_test_test_arange_6.cpp.o.d"
+  "libarray_creation_test_test_arange_6.pdb"
+  "libarray_creation_test_test_arange_6.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_arange_6.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
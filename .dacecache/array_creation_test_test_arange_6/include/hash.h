@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_arange_6 "9fbeec18d972a7448e1d5a9370e11224b60edc58b6e3b1a5aef12f45fe3cbc75"
@@ -0,0 +1,72 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_creation_test_test_arange_6_state_t {
+
+};
+
+void __program_array_creation_test_test_arange_6_internal(array_creation_test_test_arange_6_state_t*__state, double * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i = 0; __i < 3; __i += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_arange_)
+                    __out = (2.5 + (__i * 3.0));
+                    ///////////////////
+
+                    __return[__i] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_array_creation_test_test_arange_6(array_creation_test_test_arange_6_state_t *__state, double * __restrict__ __return)
+{
+    __program_array_creation_test_test_arange_6_internal(__state, __return);
+}
+
+struct __dace_batch_args_array_creation_test_test_arange_6 {
+    double * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_array_creation_test_test_arange_6_batch(array_creation_test_test_arange_6_state_t *__state, const __dace_batch_args_array_creation_test_test_arange_6 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_creation_test_test_arange_6_internal(__state, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_creation_test_test_arange_6_state_t *__dace_init_array_creation_test_test_arange_6()
+{
+    int __result = 0;
+    array_creation_test_test_arange_6_state_t *__state = new array_creation_test_test_arange_6_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_creation_test_test_arange_6(array_creation_test_test_arange_6_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
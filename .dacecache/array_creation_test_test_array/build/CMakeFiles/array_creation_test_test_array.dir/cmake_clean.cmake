@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_array.dir/root/package/.dacecache/array_creation_test_test_array/src/cpu/array_creation_test_test_array.cpp.o"
+  "CMakeFiles/array_creation_test_test_array.dir/root/package/.dacecache/array_creation_test_test_array/src/cpu/array_creation_test_test_array.cpp.o.d"
+  "libarray_creation_test_test_array.pdb"
+  "libarray_creation_test_test_array.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_array.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_test_arrayHandle_t;
+extern "C" array_creation_test_test_arrayHandle_t __dace_init_array_creation_test_test_array();
+extern "C" int __dace_exit_array_creation_test_test_array(array_creation_test_test_arrayHandle_t handle);
+extern "C" void __program_array_creation_test_test_array(array_creation_test_test_arrayHandle_t handle, double * __restrict__ A, double * __restrict__ __return);
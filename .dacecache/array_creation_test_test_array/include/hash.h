@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_array "48884d70a058f529fe22e0a09d70989e11afb91f7a0bbd66bdd911599921f2e6"
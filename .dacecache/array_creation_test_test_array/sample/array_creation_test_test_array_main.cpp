@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_array.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_arrayHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(200, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(200, sizeof(double));
+
+
+    handle = __dace_init_array_creation_test_test_array();
+    __program_array_creation_test_test_array(handle, A, __return);
+    err = __dace_exit_array_creation_test_test_array(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_array_constant.dir/root/package/.dacecache/array_creation_test_test_array_constant/src/cpu/array_creation_test_test_array_constant.cpp.o"
+  "CMakeFiles/array_creation_test_test_array_constant.dir/root/package/.dacecache/array_creation_test_test_array_constant/src/cpu/array_creation_test_test_array_constant.cpp.o.d"
+  "libarray_creation_test_test_array_constant.pdb"
+  "libarray_creation_test_test_array_constant.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_array_constant.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
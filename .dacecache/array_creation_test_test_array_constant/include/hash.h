@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_array_constant "580e79d825d48ee11af7ea22c75eb99c61bbb33b77e2f6890f8235cd56e6d0f0"
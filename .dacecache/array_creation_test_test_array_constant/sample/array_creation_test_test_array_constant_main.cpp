@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_array_constant.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_array_constantHandle_t handle;
+    int err;
+    float * __restrict__ __g_cst = (float*) calloc(100, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(100, sizeof(float));
+
+
+    handle = __dace_init_array_creation_test_test_array_constant();
+    __program_array_creation_test_test_array_constant(handle, __g_cst, __return);
+    err = __dace_exit_array_creation_test_test_array_constant(handle);
+
+    free(__g_cst);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_array_literal.dir/root/package/.dacecache/array_creation_test_test_array_literal/src/cpu/array_creation_test_test_array_literal.cpp.o"
+  "CMakeFiles/array_creation_test_test_array_literal.dir/root/package/.dacecache/array_creation_test_test_array_literal/src/cpu/array_creation_test_test_array_literal.cpp.o.d"
+  "libarray_creation_test_test_array_literal.pdb"
+  "libarray_creation_test_test_array_literal.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_array_literal.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
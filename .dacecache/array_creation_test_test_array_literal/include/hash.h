@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_array_literal "922bf5e8c338c52f32d7ff273c5fbf650d9bd51660d88fd3c35d75965ea7b851"
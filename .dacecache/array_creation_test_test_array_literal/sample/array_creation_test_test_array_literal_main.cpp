@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_array_literal.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_array_literalHandle_t handle;
+    int err;
+    float * __restrict__ __return = (float*) calloc(4, sizeof(float));
+
+
+    handle = __dace_init_array_creation_test_test_array_literal();
+    __program_array_creation_test_test_array_literal(handle, __return);
+    err = __dace_exit_array_creation_test_test_array_literal(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,61 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+constexpr float __tmp0[4] = {1.0, 2.0, 3.0, 4.0};
+
+struct array_creation_test_test_array_literal_state_t {
+
+};
+
+void __program_array_creation_test_test_array_literal_internal(array_creation_test_test_array_literal_state_t*__state, float * __restrict__ __return)
+{
+
+    {
+
+
+        dace::CopyND<float, 1, false, 4>::template ConstDst<1>::Copy(
+        __tmp0, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_array_creation_test_test_array_literal(array_creation_test_test_array_literal_state_t *__state, float * __restrict__ __return)
+{
+    __program_array_creation_test_test_array_literal_internal(__state, __return);
+}
+
+struct __dace_batch_args_array_creation_test_test_array_literal {
+    float * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_array_creation_test_test_array_literal_batch(array_creation_test_test_array_literal_state_t *__state, const __dace_batch_args_array_creation_test_test_array_literal *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_creation_test_test_array_literal_internal(__state, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_creation_test_test_array_literal_state_t *__dace_init_array_creation_test_test_array_literal()
+{
+    int __result = 0;
+    array_creation_test_test_array_literal_state_t *__state = new array_creation_test_test_array_literal_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_creation_test_test_array_literal(array_creation_test_test_array_literal_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_copy.dir/root/package/.dacecache/array_creation_test_test_copy/src/cpu/array_creation_test_test_copy.cpp.o"
+  "CMakeFiles/array_creation_test_test_copy.dir/root/package/.dacecache/array_creation_test_test_copy/src/cpu/array_creation_test_test_copy.cpp.o.d"
+  "libarray_creation_test_test_copy.pdb"
+  "libarray_creation_test_test_copy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_copy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_test_copyHandle_t;
+extern "C" array_creation_test_test_copyHandle_t __dace_init_array_creation_test_test_copy();
+extern "C" int __dace_exit_array_creation_test_test_copy(array_creation_test_test_copyHandle_t handle);
+extern "C" void __program_array_creation_test_test_copy(array_creation_test_test_copyHandle_t handle, dace::complex64 * __restrict__ A, dace::complex64 * __restrict__ __return);
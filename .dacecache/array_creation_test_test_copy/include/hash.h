@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_copy "a04d287cefded74ca7584b7218ac0841f41baf970807778ae42696f45febf58a"
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_full_like "6143ae1854b6375966dc6a0c9daa867ad01c7f68a0dc151bc3cfac00f0849e99"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_identity.dir/root/package/.dacecache/array_creation_test_test_identity/src/cpu/array_creation_test_test_identity.cpp.o"
+  "CMakeFiles/array_creation_test_test_identity.dir/root/package/.dacecache/array_creation_test_test_identity/src/cpu/array_creation_test_test_identity.cpp.o.d"
+  "libarray_creation_test_test_identity.pdb"
+  "libarray_creation_test_test_identity.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_identity.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
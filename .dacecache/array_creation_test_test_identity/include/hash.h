@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_identity "c036dc6d2b090a4c453c62ce85f9311fbc30b149a3c1c3002a4b3a43627b6efa"
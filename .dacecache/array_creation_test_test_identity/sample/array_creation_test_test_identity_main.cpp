@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_identity.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_identityHandle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(100, sizeof(double));
+
+
+    handle = __dace_init_array_creation_test_test_identity();
+    __program_array_creation_test_test_identity(handle, __return);
+    err = __dace_exit_array_creation_test_test_identity(handle);
+
+    free(__return);
+
+
+    return err;
+}
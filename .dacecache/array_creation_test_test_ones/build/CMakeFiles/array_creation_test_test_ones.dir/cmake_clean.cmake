@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_ones.dir/root/package/.dacecache/array_creation_test_test_ones/src/cpu/array_creation_test_test_ones.cpp.o"
+  "CMakeFiles/array_creation_test_test_ones.dir/root/package/.dacecache/array_creation_test_test_ones/src/cpu/array_creation_test_test_ones.cpp.o.d"
+  "libarray_creation_test_test_ones.pdb"
+  "libarray_creation_test_test_ones.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_ones.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_ones "95eff9ce22c456e021253305930ce3ae26476f51fc63804f2e45afd68dfce632"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_ones_like.dir/root/package/.dacecache/array_creation_test_test_ones_like/src/cpu/array_creation_test_test_ones_like.cpp.o"
+  "CMakeFiles/array_creation_test_test_ones_like.dir/root/package/.dacecache/array_creation_test_test_ones_like/src/cpu/array_creation_test_test_ones_like.cpp.o.d"
+  "libarray_creation_test_test_ones_like.pdb"
+  "libarray_creation_test_test_ones_like.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_ones_like.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_ones_like "93358efc757b6b42c375b4d2a020f416a265259b062407f77083b1b92cbd9393"
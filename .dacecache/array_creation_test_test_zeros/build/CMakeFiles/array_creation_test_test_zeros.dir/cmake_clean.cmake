@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_creation_test_test_zeros.dir/root/package/.dacecache/array_creation_test_test_zeros/src/cpu/array_creation_test_test_zeros.cpp.o"
+  "CMakeFiles/array_creation_test_test_zeros.dir/root/package/.dacecache/array_creation_test_test_zeros/src/cpu/array_creation_test_test_zeros.cpp.o.d"
+  "libarray_creation_test_test_zeros.pdb"
+  "libarray_creation_test_test_zeros.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_creation_test_test_zeros.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
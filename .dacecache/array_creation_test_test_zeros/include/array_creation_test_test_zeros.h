@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_test_zerosHandle_t;
+extern "C" array_creation_test_test_zerosHandle_t __dace_init_array_creation_test_test_zeros();
+extern "C" int __dace_exit_array_creation_test_test_zeros(array_creation_test_test_zerosHandle_t handle);
+extern "C" void __program_array_creation_test_test_zeros(array_creation_test_test_zerosHandle_t handle, float * __restrict__ __return);
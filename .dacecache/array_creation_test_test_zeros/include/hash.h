@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_zeros "ab1f2b244400a6c977cb53f5c1289f6fc001c277c3c508163cafd0dfbd3e90ad"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_zeros.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_zerosHandle_t handle;
+    int err;
+    float * __restrict__ __return = (float*) calloc(400, sizeof(float));
+
+
+    handle = __dace_init_array_creation_test_test_zeros();
+    __program_array_creation_test_test_zeros(handle, __return);
+    err = __dace_exit_array_creation_test_test_zeros(handle);
+
+    free(__return);
+
+
+    return err;
+}
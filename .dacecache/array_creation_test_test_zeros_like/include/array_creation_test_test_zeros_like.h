@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_creation_test_test_zeros_likeHandle_t;
+extern "C" array_creation_test_test_zeros_likeHandle_t __dace_init_array_creation_test_test_zeros_like();
+extern "C" int __dace_exit_array_creation_test_test_zeros_like(array_creation_test_test_zeros_likeHandle_t handle);
+extern "C" void __program_array_creation_test_test_zeros_like(array_creation_test_test_zeros_likeHandle_t handle, dace::complex64 * __restrict__ A, dace::complex64 * __restrict__ __return);
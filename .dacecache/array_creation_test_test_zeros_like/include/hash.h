@@ -0,0 +1 @@
+#define __HASH_array_creation_test_test_zeros_like "b16b661514906dc0fb584c032aea2a9373776b4848c05f69dbc67157ea96b729"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/array_creation_test_test_zeros_like.h"
+
+int main(int argc, char **argv) {
+    array_creation_test_test_zeros_likeHandle_t handle;
+    int err;
+    dace::complex64 * __restrict__ A = (dace::complex64*) calloc(400, sizeof(dace::complex64));
+    dace::complex64 * __restrict__ __return = (dace::complex64*) calloc(400, sizeof(dace::complex64));
+
+
+    handle = __dace_init_array_creation_test_test_zeros_like();
+    __program_array_creation_test_test_zeros_like(handle, A, __return);
+    err = __dace_exit_array_creation_test_test_zeros_like(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
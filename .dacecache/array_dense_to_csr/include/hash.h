@@ -0,0 +1 @@
+#define __HASH_array_dense_to_csr "ec2a4ba60c9dcf707db6a0161da3cb5c7d301eae355ccd10daf782f6addf1e81"
@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/array_dense_to_csr.h"
+
+int main(int argc, char **argv) {
+    array_dense_to_csrHandle_t handle;
+    int err;
+    int L = 42;
+    int M = 42;
+    int N = 42;
+    int nnz = 42;
+    float * __restrict__ A = (float*) calloc(((L * M) * N), sizeof(float));
+    CSRMatrix* * __restrict__ B = (CSRMatrix**) calloc(L, sizeof(CSRMatrix*));
+
+
+    handle = __dace_init_array_dense_to_csr(L, M, N, nnz);
+    __program_array_dense_to_csr(handle, A, B, L, M, N, nnz);
+    err = __dace_exit_array_dense_to_csr(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
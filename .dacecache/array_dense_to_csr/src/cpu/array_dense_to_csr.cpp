@@ -0,0 +1,162 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+struct CSRMatrix {
+    int* indptr;
+    int* indices;
+    float* data;
+};
+
+struct array_dense_to_csr_state_t {
+
+};
+
+void __program_array_dense_to_csr_internal(array_dense_to_csr_state_t*__state, float * __restrict__ A, CSRMatrix* * __restrict__ B, int L, int M, int N, int nnz)
+{
+    long long k;
+    long long i;
+    long long idx;
+    long long j;
+
+
+
+
+    for (k = 0; (k < L); k = k + 1) {
+
+        i = 0;
+        idx = 0;
+        __state_0_guard_0:;
+        {
+            CSRMatrix* vcsr;
+            vcsr = B[k];
+            int* vindptr;
+            vindptr = &vcsr->indptr[0];
+
+            {
+                int __out;
+
+                ///////////////////
+                // Tasklet code (set_indptr)
+                __out = idx;
+                ///////////////////
+
+                vindptr[i] = __out;
+            }
+
+        }
+        if ((i < M)) {
+            goto __state_0_state;
+        }
+        if ((! (i < M))) {
+            goto __state_0_state_2;
+        }
+        __state_0_state_2:;
+        {
+            CSRMatrix* vcsr;
+            vcsr = B[k];
+            int* vindptr;
+            vindptr = &vcsr->indptr[0];
+
+            {
+                int __out;
+
+                ///////////////////
+                // Tasklet code (set_indptr)
+                __out = nnz;
+                ///////////////////
+
+                vindptr[M] = __out;
+            }
+
+        }
+        continue;
+        __state_0_state:;
+
+
+
+        for (j = 0; (j < N); j = j + 1) {
+
+
+            if ((A[((((M * N) * k) + (N * i)) + j)] != 0)) {
+                {
+                    CSRMatrix* vcsr;
+                    vcsr = B[k];
+                    int* vindices;
+                    vindices = &vcsr->indices[0];
+                    float* vdata;
+                    vdata = &vcsr->data[0];
+
+
+                    dace::CopyND<float, 1, false, 1>::template ConstDst<1>::Copy(
+                    A + ((((M * N) * k) + (N * i)) + j), vdata + idx, 1);
+                    {
+                        int __out;
+
+                        ///////////////////
+                        // Tasklet code (set_indices)
+                        __out = j;
+                        ///////////////////
+
+                        vindices[idx] = __out;
+                    }
+
+                }
+                idx = (idx + 1);
+
+            }
+
+
+        }
+
+        i = (i + 1);
+        goto __state_0_guard_0;
+
+    }
+
+}
+
+DACE_EXPORTED void __program_array_dense_to_csr(array_dense_to_csr_state_t *__state, float * __restrict__ A, CSRMatrix* * __restrict__ B, int L, int M, int N, int nnz)
+{
+    __program_array_dense_to_csr_internal(__state, A, B, L, M, N, nnz);
+}
+
+struct __dace_batch_args_array_dense_to_csr {
+    float * A;
+    CSRMatrix* * B;
+    int L;
+    int M;
+    int N;
+    int nnz;
+};
+
+DACE_EXPORTED int __program_array_dense_to_csr_batch(array_dense_to_csr_state_t *__state, const __dace_batch_args_array_dense_to_csr *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_dense_to_csr_internal(__state, __args[__i].A, __args[__i].B, __args[__i].L, __args[__i].M, __args[__i].N, __args[__i].nnz);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_dense_to_csr_state_t *__dace_init_array_dense_to_csr(int L, int M, int N, int nnz)
+{
+    int __result = 0;
+    array_dense_to_csr_state_t *__state = new array_dense_to_csr_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_dense_to_csr(array_dense_to_csr_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
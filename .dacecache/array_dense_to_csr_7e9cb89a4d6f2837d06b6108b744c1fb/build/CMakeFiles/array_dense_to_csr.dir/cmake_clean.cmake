@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_dense_to_csr.dir/root/package/.dacecache/array_dense_to_csr_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/array_dense_to_csr.cpp.o"
+  "CMakeFiles/array_dense_to_csr.dir/root/package/.dacecache/array_dense_to_csr_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/array_dense_to_csr.cpp.o.d"
+  "libarray_dense_to_csr.pdb"
+  "libarray_dense_to_csr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_dense_to_csr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_dense_to_csr.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_dense_to_csr.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_dense_to_csr.pdb"
+  "libdacestub_array_dense_to_csr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_dense_to_csr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_dense_to_csrHandle_t;
+extern "C" array_dense_to_csrHandle_t __dace_init_array_dense_to_csr(int L, int M, int N, int nnz);
+extern "C" int __dace_exit_array_dense_to_csr(array_dense_to_csrHandle_t handle);
+extern "C" void __program_array_dense_to_csr(array_dense_to_csrHandle_t handle, float * __restrict__ A, CSRMatrix* * __restrict__ B, int L, int M, int N, int nnz);
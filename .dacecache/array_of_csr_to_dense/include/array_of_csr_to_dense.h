@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_of_csr_to_denseHandle_t;
+extern "C" array_of_csr_to_denseHandle_t __dace_init_array_of_csr_to_dense(int L, int M, int N, int nnz);
+extern "C" int __dace_exit_array_of_csr_to_dense(array_of_csr_to_denseHandle_t handle);
+extern "C" void __program_array_of_csr_to_dense(array_of_csr_to_denseHandle_t handle, CSRMatrix* * __restrict__ A, float * __restrict__ B, int L, int M, int N, int nnz);
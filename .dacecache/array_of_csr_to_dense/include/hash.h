@@ -0,0 +1 @@
+#define __HASH_array_of_csr_to_dense "e1b80b647505a40aab1f754202cb286cb94625782a355bf19b4486c98c1b9126"
@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/array_of_csr_to_dense.h"
+
+int main(int argc, char **argv) {
+    array_of_csr_to_denseHandle_t handle;
+    int err;
+    int L = 42;
+    int M = 42;
+    int N = 42;
+    int nnz = 42;
+    CSRMatrix* * __restrict__ A = (CSRMatrix**) calloc(L, sizeof(CSRMatrix*));
+    float * __restrict__ B = (float*) calloc(((L * M) * N), sizeof(float));
+
+
+    handle = __dace_init_array_of_csr_to_dense(L, M, N, nnz);
+    __program_array_of_csr_to_dense(handle, A, B, L, M, N, nnz);
+    err = __dace_exit_array_of_csr_to_dense(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
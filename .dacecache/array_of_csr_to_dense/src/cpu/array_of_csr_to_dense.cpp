@@ -0,0 +1,100 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+struct CSRMatrix {
+    int* indptr;
+    int* indices;
+    float* data;
+};
+
+struct array_of_csr_to_dense_state_t {
+
+};
+
+void __program_array_of_csr_to_dense_internal(array_of_csr_to_dense_state_t*__state, CSRMatrix* * __restrict__ A, float * __restrict__ B, int L, int M, int N, int nnz)
+{
+
+    {
+
+        {
+            for (auto b = 0; b < L; b += 1) {
+                CSRMatrix* vcsr;
+                vcsr = A[b];
+                int* vindptr;
+                vindptr = &vcsr->indptr[0];
+                int* vindices;
+                vindices = &vcsr->indices[0];
+                float* vdata;
+                vdata = &vcsr->data[0];
+                {
+                    for (auto i = 0; i < M; i += 1) {
+                        {
+                            int start = vindptr[i];
+                            int stop = vindptr[(i + 1)];
+                            for (auto idx = start; idx < stop; idx += 1) {
+                                {
+                                    int j = vindices[idx];
+                                    float __val = vdata[idx];
+                                    float* __out = B + ((M * N) * b);
+
+                                    ///////////////////
+                                    // Tasklet code (indirection)
+                                    __out[((N * i) + j)] = __val;
+                                    ///////////////////
+
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_array_of_csr_to_dense(array_of_csr_to_dense_state_t *__state, CSRMatrix* * __restrict__ A, float * __restrict__ B, int L, int M, int N, int nnz)
+{
+    __program_array_of_csr_to_dense_internal(__state, A, B, L, M, N, nnz);
+}
+
+struct __dace_batch_args_array_of_csr_to_dense {
+    CSRMatrix* * A;
+    float * B;
+    int L;
+    int M;
+    int N;
+    int nnz;
+};
+
+DACE_EXPORTED int __program_array_of_csr_to_dense_batch(array_of_csr_to_dense_state_t *__state, const __dace_batch_args_array_of_csr_to_dense *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_of_csr_to_dense_internal(__state, __args[__i].A, __args[__i].B, __args[__i].L, __args[__i].M, __args[__i].N, __args[__i].nnz);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_of_csr_to_dense_state_t *__dace_init_array_of_csr_to_dense(int L, int M, int N, int nnz)
+{
+    int __result = 0;
+    array_of_csr_to_dense_state_t *__state = new array_of_csr_to_dense_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_of_csr_to_dense(array_of_csr_to_dense_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
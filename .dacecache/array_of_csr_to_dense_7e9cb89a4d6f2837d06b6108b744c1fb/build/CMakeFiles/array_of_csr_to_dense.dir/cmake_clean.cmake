@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_of_csr_to_dense.dir/root/package/.dacecache/array_of_csr_to_dense_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/array_of_csr_to_dense.cpp.o"
+  "CMakeFiles/array_of_csr_to_dense.dir/root/package/.dacecache/array_of_csr_to_dense_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/array_of_csr_to_dense.cpp.o.d"
+  "libarray_of_csr_to_dense.pdb"
+  "libarray_of_csr_to_dense.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_of_csr_to_dense.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_array_of_csr_to_dense.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_array_of_csr_to_dense.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_array_of_csr_to_dense.pdb"
+  "libdacestub_array_of_csr_to_dense.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_array_of_csr_to_dense.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
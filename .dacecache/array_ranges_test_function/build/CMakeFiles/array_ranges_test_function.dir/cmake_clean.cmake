@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/array_ranges_test_function.dir/root/package/.dacecache/array_ranges_test_function/src/cpu/array_ranges_test_function.cpp.o"
+  "CMakeFiles/array_ranges_test_function.dir/root/package/.dacecache/array_ranges_test_function/src/cpu/array_ranges_test_function.cpp.o.d"
+  "libarray_ranges_test_function.pdb"
+  "libarray_ranges_test_function.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/array_ranges_test_function.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
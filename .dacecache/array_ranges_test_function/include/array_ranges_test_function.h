@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_ranges_test_functionHandle_t;
+extern "C" array_ranges_test_functionHandle_t __dace_init_array_ranges_test_function();
+extern "C" int __dace_exit_array_ranges_test_function(array_ranges_test_functionHandle_t handle);
+extern "C" void __program_array_ranges_test_function(array_ranges_test_functionHandle_t handle, double * __restrict__ d);
@@ -0,0 +1 @@
+#define __HASH_array_ranges_test_function "9f7b3c6aed4f4f419f04ef73566f2cb435dbcd426d06d236b000d7ebff6d49b6"
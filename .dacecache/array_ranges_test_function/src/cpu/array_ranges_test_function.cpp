@@ -0,0 +1,310 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct array_ranges_test_function_state_t {
+
+};
+
+void __program_array_ranges_test_function_internal(array_ranges_test_function_state_t*__state, double * __restrict__ d)
+{
+    double *e;
+    e = new double DACE_ALIGN(64)[60];
+    double *f;
+    f = new double DACE_ALIGN(64)[60];
+    double tmp_call_0;
+    int tmp_parfor_2;
+    int tmp_parfor_1;
+    int tmp_parfor_0;
+    int tmp_parfor_5;
+    int tmp_parfor_4;
+    int tmp_parfor_3;
+    int tmp_parfor_8;
+    int tmp_parfor_7;
+    int tmp_parfor_6;
+    int tmp_parfor_9;
+    int tmp_parfor_12;
+    int tmp_parfor_11;
+    int tmp_parfor_10;
+    int tmp_parfor_13;
+
+
+
+
+    for (tmp_parfor_2 = 1; (tmp_parfor_2 <= 5); tmp_parfor_2 = (tmp_parfor_2+1)) {
+
+
+
+        for (tmp_parfor_1 = 1; (tmp_parfor_1 <= 4); tmp_parfor_1 = (tmp_parfor_1 + 1)) {
+
+
+
+            for (tmp_parfor_0 = 1; (tmp_parfor_0 <= 3); tmp_parfor_0 = (tmp_parfor_0 + 1)) {
+                {
+
+                    {
+                        double e_out_1;
+
+                        ///////////////////
+                        // Tasklet code (T_l11_c11)
+                        e_out_1 = 1.0;
+                        ///////////////////
+
+                        e[(((tmp_parfor_0 + (3 * tmp_parfor_1)) + (12 * tmp_parfor_2)) - 16)] = e_out_1;
+                    }
+
+                }
+
+            }
+
+
+        }
+
+
+    }
+
+
+
+    for (tmp_parfor_5 = 1; (tmp_parfor_5 <= 5); tmp_parfor_5 = (tmp_parfor_5 + 1)) {
+
+
+
+        for (tmp_parfor_4 = 1; (tmp_parfor_4 <= 4); tmp_parfor_4 = (tmp_parfor_4 + 1)) {
+
+
+
+            for (tmp_parfor_3 = 1; (tmp_parfor_3 <= 3); tmp_parfor_3 = (tmp_parfor_3 + 1)) {
+                {
+
+                    {
+                        double f_out_1;
+
+                        ///////////////////
+                        // Tasklet code (T_l12_c12)
+                        f_out_1 = 2.0;
+                        ///////////////////
+
+                        f[(((tmp_parfor_3 + (3 * tmp_parfor_4)) + (12 * tmp_parfor_5)) - 16)] = f_out_1;
+                    }
+
+                }
+
+            }
+
+
+        }
+
+
+    }
+
+
+
+    for (tmp_parfor_8 = 1; (tmp_parfor_8 <= 5); tmp_parfor_8 = (tmp_parfor_8 + 1)) {
+
+
+
+        for (tmp_parfor_7 = 2; (tmp_parfor_7 <= 4); tmp_parfor_7 = (tmp_parfor_7 + 1)) {
+
+
+
+            for (tmp_parfor_6 = 1; (tmp_parfor_6 <= 3); tmp_parfor_6 = (tmp_parfor_6 + 1)) {
+                {
+
+                    {
+                        double f_out_1;
+
+                        ///////////////////
+                        // Tasklet code (T_l13_c13)
+                        f_out_1 = 3.0;
+                        ///////////////////
+
+                        f[(((tmp_parfor_6 + (3 * tmp_parfor_7)) + (12 * tmp_parfor_8)) - 16)] = f_out_1;
+                    }
+
+                }
+
+            }
+
+
+        }
+
+
+    }
+
+
+
+    for (tmp_parfor_9 = 1; (tmp_parfor_9 <= 5); tmp_parfor_9 = (tmp_parfor_9 + 1)) {
+        {
+
+            {
+                double f_out_1;
+
+                ///////////////////
+                // Tasklet code (T_l14_c14)
+                f_out_1 = 4.0;
+                ///////////////////
+
+                f[((12 * tmp_parfor_9) - 12)] = f_out_1;
+            }
+
+        }
+
+    }
+
+
+
+    for (tmp_parfor_12 = 1; (tmp_parfor_12 <= 5); tmp_parfor_12 = (tmp_parfor_12 + 1)) {
+
+
+
+        for (tmp_parfor_11 = 1; (tmp_parfor_11 <= 4); tmp_parfor_11 = (tmp_parfor_11 + 1)) {
+
+
+
+            for (tmp_parfor_10 = 1; (tmp_parfor_10 <= 3); tmp_parfor_10 = (tmp_parfor_10 + 1)) {
+                {
+
+                    {
+                        double e_0_in_1 = e[(((tmp_parfor_10 + (3 * tmp_parfor_11)) + (12 * tmp_parfor_12)) - 16)];
+                        double f_0_in_1 = f[(((tmp_parfor_10 + (3 * tmp_parfor_11)) + (12 * tmp_parfor_12)) - 16)];
+                        double d_out_1;
+
+                        ///////////////////
+                        // Tasklet code (T_l15_c15)
+                        d_out_1 = (e_0_in_1 + f_0_in_1);
+                        ///////////////////
+
+                        d[(((tmp_parfor_10 + (3 * tmp_parfor_11)) + (12 * tmp_parfor_12)) - 16)] = d_out_1;
+                    }
+
+                }
+
+            }
+
+
+        }
+
+
+    }
+
+
+
+    for (tmp_parfor_13 = 2; (tmp_parfor_13 <= 4); tmp_parfor_13 = (tmp_parfor_13 + 1)) {
+        {
+
+            {
+                double e_0_in_1 = e[((3 * tmp_parfor_13) - 3)];
+                double d_out_1;
+
+                ///////////////////
+                // Tasklet code (T_l16_c16)
+                d_out_1 = (e_0_in_1 * 10.0);
+                ///////////////////
+
+                d[((3 * tmp_parfor_13) - 3)] = d_out_1;
+            }
+
+        }
+
+    }
+    {
+
+        {
+            double tmp_call_0_out;
+
+            ///////////////////
+            // Tasklet code (T_l17_c17)
+            tmp_call_0_out = 0;
+            ///////////////////
+
+            tmp_call_0 = tmp_call_0_out;
+        }
+
+    }
+
+
+    for (tmp_parfor_1 = 1; (tmp_parfor_1 <= 5); tmp_parfor_1 = (tmp_parfor_1 + 1)) {
+
+
+
+        for (tmp_parfor_0 = 1; (tmp_parfor_0 <= 3); tmp_parfor_0 = (tmp_parfor_0 + 1)) {
+            {
+
+                {
+                    double tmp_call_0_0_in = tmp_call_0;
+                    double e_0_in_1 = e[((tmp_parfor_0 + (12 * tmp_parfor_1)) - 13)];
+                    double tmp_call_0_out;
+
+                    ///////////////////
+                    // Tasklet code (T_l17_c17)
+                    tmp_call_0_out = (tmp_call_0_0_in + e_0_in_1);
+                    ///////////////////
+
+                    tmp_call_0 = tmp_call_0_out;
+                }
+
+            }
+
+        }
+
+
+    }
+    {
+
+        {
+            double tmp_call_0_0_in = tmp_call_0;
+            double d_out_1;
+
+            ///////////////////
+            // Tasklet code (T_l17_c17)
+            d_out_1 = tmp_call_0_0_in;
+            ///////////////////
+
+            d[0] = d_out_1;
+        }
+
+    }
+    delete[] e;
+    delete[] f;
+}
+
+DACE_EXPORTED void __program_array_ranges_test_function(array_ranges_test_function_state_t *__state, double * __restrict__ d)
+{
+    __program_array_ranges_test_function_internal(__state, d);
+}
+
+struct __dace_batch_args_array_ranges_test_function {
+    double * d;
+};
+
+DACE_EXPORTED int __program_array_ranges_test_function_batch(array_ranges_test_function_state_t *__state, const __dace_batch_args_array_ranges_test_function *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_array_ranges_test_function_internal(__state, __args[__i].d);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED array_ranges_test_function_state_t *__dace_init_array_ranges_test_function()
+{
+    int __result = 0;
+    array_ranges_test_function_state_t *__state = new array_ranges_test_function_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_array_ranges_test_function(array_ranges_test_function_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arraywrite_result_test_writeresult_state_t {
+
+};
+
+void __program_arraywrite_result_test_writeresult_internal(arraywrite_result_test_writeresult_state_t*__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    double* o = output;
+                    double v;
+
+                    ///////////////////
+                    // Tasklet code (arraywrite_result_test_writeresult_11)
+                    v = dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(output + 5, 1);;
+                    ///////////////////
+
+                    values[i] = v;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arraywrite_result_test_writeresult(arraywrite_result_test_writeresult_state_t *__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+    __program_arraywrite_result_test_writeresult_internal(__state, output, values, N);
+}
+
+struct __dace_batch_args_arraywrite_result_test_writeresult {
+    double *output;
+    double *values;
+    int N;
+};
+
+DACE_EXPORTED int __program_arraywrite_result_test_writeresult_batch(arraywrite_result_test_writeresult_state_t *__state, const __dace_batch_args_arraywrite_result_test_writeresult *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_arraywrite_result_test_writeresult_internal(__state, __args[__i].output, __args[__i].values, __args[__i].N);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED arraywrite_result_test_writeresult_state_t *__dace_init_arraywrite_result_test_writeresult(int N)
+{
+    int __result = 0;
+    arraywrite_result_test_writeresult_state_t *__state = new arraywrite_result_test_writeresult_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arraywrite_result_test_writeresult(arraywrite_result_test_writeresult_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
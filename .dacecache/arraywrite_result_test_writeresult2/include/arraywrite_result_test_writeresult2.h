@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * arraywrite_result_test_writeresult2Handle_t;
+extern "C" arraywrite_result_test_writeresult2Handle_t __dace_init_arraywrite_result_test_writeresult2(int N);
+extern "C" int __dace_exit_arraywrite_result_test_writeresult2(arraywrite_result_test_writeresult2Handle_t handle);
+extern "C" void __program_arraywrite_result_test_writeresult2(arraywrite_result_test_writeresult2Handle_t handle, double * __restrict__ output, double * __restrict__ values, int N);
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/arraywrite_result_test_writeresult2.h"
+
+int main(int argc, char **argv) {
+    arraywrite_result_test_writeresult2Handle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ output = (double*) calloc(2, sizeof(double));
+    double * __restrict__ values = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_arraywrite_result_test_writeresult2(N);
+    __program_arraywrite_result_test_writeresult2(handle, output, values, N);
+    err = __dace_exit_arraywrite_result_test_writeresult2(handle);
+
+    free(output);
+    free(values);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arraywrite_result_test_writeresult2.dir/root/package/.dacecache/arraywrite_result_test_writeresult2_573c38be55d418774b5efc274bb36461/src/cpu/arraywrite_result_test_writeresult2.cpp.o"
+  "CMakeFiles/arraywrite_result_test_writeresult2.dir/root/package/.dacecache/arraywrite_result_test_writeresult2_573c38be55d418774b5efc274bb36461/src/cpu/arraywrite_result_test_writeresult2.cpp.o.d"
+  "libarraywrite_result_test_writeresult2.pdb"
+  "libarraywrite_result_test_writeresult2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arraywrite_result_test_writeresult2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_arraywrite_result_test_writeresult2.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_arraywrite_result_test_writeresult2.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_arraywrite_result_test_writeresult2.pdb"
+  "libdacestub_arraywrite_result_test_writeresult2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_arraywrite_result_test_writeresult2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_arraywrite_result_test_writeresult2 "46ca374df57202bc2f05b7c52a7896ad73429706d8003406097ec3c41d1d55d7"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_arraywrite_result_test_writeresult.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_arraywrite_result_test_writeresult.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_arraywrite_result_test_writeresult.pdb"
+  "libdacestub_arraywrite_result_test_writeresult.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_arraywrite_result_test_writeresult.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_arraywrite_result_test_writeresult "77358f80fbdceeeb15c43b1507d18645619169d6131858399d9bfa5df765c9e2"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assert_test_prog_runtime.dir/root/package/.dacecache/assert_test_prog_runtime/src/cpu/assert_test_prog_runtime.cpp.o"
+  "CMakeFiles/assert_test_prog_runtime.dir/root/package/.dacecache/assert_test_prog_runtime/src/cpu/assert_test_prog_runtime.cpp.o.d"
+  "libassert_test_prog_runtime.pdb"
+  "libassert_test_prog_runtime.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assert_test_prog_runtime.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
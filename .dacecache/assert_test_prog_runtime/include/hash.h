@@ -0,0 +1 @@
+#define __HASH_assert_test_prog_runtime "8fbbdf5e672863c7890dd68021a791d4c1b5a9cc30099108637d02c4b370ba0d"
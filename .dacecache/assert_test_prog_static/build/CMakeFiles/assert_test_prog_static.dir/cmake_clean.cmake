@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assert_test_prog_static.dir/root/package/.dacecache/assert_test_prog_static/src/cpu/assert_test_prog_static.cpp.o"
+  "CMakeFiles/assert_test_prog_static.dir/root/package/.dacecache/assert_test_prog_static/src/cpu/assert_test_prog_static.cpp.o.d"
+  "libassert_test_prog_static.pdb"
+  "libassert_test_prog_static.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assert_test_prog_static.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
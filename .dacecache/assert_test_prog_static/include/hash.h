@@ -0,0 +1 @@
+#define __HASH_assert_test_prog_static "8c985828bc619d547617d60e58f887c02bc72c7e158e1fd9f61b09e4fee98508"
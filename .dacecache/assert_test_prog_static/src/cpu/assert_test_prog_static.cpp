@@ -0,0 +1,54 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assert_test_prog_static_state_t {
+
+};
+
+void __program_assert_test_prog_static_internal(assert_test_prog_static_state_t*__state, double * __restrict__ A)
+{
+
+
+}
+
+DACE_EXPORTED void __program_assert_test_prog_static(assert_test_prog_static_state_t *__state, double * __restrict__ A)
+{
+    __program_assert_test_prog_static_internal(__state, A);
+}
+
+struct __dace_batch_args_assert_test_prog_static {
+    double *A;
+};
+
+DACE_EXPORTED int __program_assert_test_prog_static_batch(assert_test_prog_static_state_t *__state, const __dace_batch_args_assert_test_prog_static *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assert_test_prog_static_internal(__state, __args[__i].A);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assert_test_prog_static_state_t *__dace_init_assert_test_prog_static()
+{
+    int __result = 0;
+    assert_test_prog_static_state_t *__state = new assert_test_prog_static_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assert_test_prog_static(assert_test_prog_static_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assign_in_map_test_my_func.dir/root/package/.dacecache/assign_in_map_test_my_func/src/cpu/assign_in_map_test_my_func.cpp.o"
+  "CMakeFiles/assign_in_map_test_my_func.dir/root/package/.dacecache/assign_in_map_test_my_func/src/cpu/assign_in_map_test_my_func.cpp.o.d"
+  "libassign_in_map_test_my_func.pdb"
+  "libassign_in_map_test_my_func.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assign_in_map_test_my_func.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
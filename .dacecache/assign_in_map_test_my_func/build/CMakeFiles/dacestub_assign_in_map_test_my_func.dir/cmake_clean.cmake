@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assign_in_map_test_my_func.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assign_in_map_test_my_func.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assign_in_map_test_my_func.pdb"
+  "libdacestub_assign_in_map_test_my_func.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assign_in_map_test_my_func.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assign_in_map_test_my_funcHandle_t;
+extern "C" assign_in_map_test_my_funcHandle_t __dace_init_assign_in_map_test_my_func(int K, int M);
+extern "C" int __dace_exit_assign_in_map_test_my_func(assign_in_map_test_my_funcHandle_t handle);
+extern "C" void __program_assign_in_map_test_my_func(assign_in_map_test_my_funcHandle_t handle, float * __restrict__ a, float * __restrict__ b, int K, int M);
@@ -0,0 +1 @@
+#define __HASH_assign_in_map_test_my_func "0eee086817fdd801774e6ee9a22c49da675ca47235880aa5a58c124565768b02"
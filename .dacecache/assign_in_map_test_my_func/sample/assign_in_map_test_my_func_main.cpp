@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/assign_in_map_test_my_func.h"
+
+int main(int argc, char **argv) {
+    assign_in_map_test_my_funcHandle_t handle;
+    int err;
+    int K = 42;
+    int M = 42;
+    float * __restrict__ a = (float*) calloc(K, sizeof(float));
+    float * __restrict__ b = (float*) calloc((K * M), sizeof(float));
+
+
+    handle = __dace_init_assign_in_map_test_my_func(K, M);
+    __program_assign_in_map_test_my_func(handle, a, b, K, M);
+    err = __dace_exit_assign_in_map_test_my_func(handle);
+
+    free(a);
+    free(b);
+
+
+    return err;
+}
@@ -0,0 +1,78 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assign_in_map_test_my_func_state_t {
+
+};
+
+inline void assign_in_map_test_my_func_17_4_0_0_2(assign_in_map_test_my_func_state_t *__state, float* __restrict__ __tmp_18_18_r, float* __restrict__ __tmp_18_21_w, int K) {
+
+    {
+
+
+        dace::CopyNDDynamic<float, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp_18_18_r, __tmp_18_21_w, K, 1);
+
+    }
+    
+}
+
+void __program_assign_in_map_test_my_func_internal(assign_in_map_test_my_func_state_t*__state, float * __restrict__ a, float * __restrict__ b, int K, int M)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto j = 0; j < M; j += 1) {
+                assign_in_map_test_my_func_17_4_0_0_2(__state, &a[0], &b[(K * j)], K);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assign_in_map_test_my_func(assign_in_map_test_my_func_state_t *__state, float * __restrict__ a, float * __restrict__ b, int K, int M)
+{
+    __program_assign_in_map_test_my_func_internal(__state, a, b, K, M);
+}
+
+struct __dace_batch_args_assign_in_map_test_my_func {
+    float * __restrict__ a;
+    float * __restrict__ b;
+    int K;
+    int M;
+};
+
+DACE_EXPORTED int __program_assign_in_map_test_my_func_batch(assign_in_map_test_my_func_state_t *__state, const __dace_batch_args_assign_in_map_test_my_func *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assign_in_map_test_my_func_internal(__state, __args[__i].a, __args[__i].b, __args[__i].K, __args[__i].M);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assign_in_map_test_my_func_state_t *__dace_init_assign_in_map_test_my_func(int K, int M)
+{
+    int __result = 0;
+    assign_in_map_test_my_func_state_t *__state = new assign_in_map_test_my_func_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assign_in_map_test_my_func(assign_in_map_test_my_func_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
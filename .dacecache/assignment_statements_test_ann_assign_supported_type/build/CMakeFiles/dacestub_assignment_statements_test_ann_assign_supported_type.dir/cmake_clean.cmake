@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assignment_statements_test_ann_assign_supported_type.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assignment_statements_test_ann_assign_supported_type.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assignment_statements_test_ann_assign_supported_type.pdb"
+  "libdacestub_assignment_statements_test_ann_assign_supported_type.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assignment_statements_test_ann_assign_supported_type.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_ann_assign_supported_type "0d407724e7cb2031fbd2fa8991b4f0aecd6843256e5bb2bbda42c5ad0eee0114"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/assignment_statements_test_ann_assign_supported_type.h"
+
+int main(int argc, char **argv) {
+    assignment_statements_test_ann_assign_supported_typeHandle_t handle;
+    int err;
+    unsigned short * __restrict__ __return = (unsigned short*) calloc(1, sizeof(unsigned short));
+
+
+    handle = __dace_init_assignment_statements_test_ann_assign_supported_type();
+    __program_assignment_statements_test_ann_assign_supported_type(handle, __return);
+    err = __dace_exit_assignment_statements_test_ann_assign_supported_type(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,67 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_statements_test_ann_assign_supported_type_state_t {
+
+};
+
+void __program_assignment_statements_test_ann_assign_supported_type_internal(assignment_statements_test_ann_assign_supported_type_state_t*__state, unsigned short * __restrict__ __return)
+{
+
+    {
+
+        {
+            unsigned short __out;
+
+            ///////////////////
+            // Tasklet code (assign_108_4)
+            __out = 5;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_type_state_t *__state, unsigned short * __restrict__ __return)
+{
+    __program_assignment_statements_test_ann_assign_supported_type_internal(__state, __return);
+}
+
+struct __dace_batch_args_assignment_statements_test_ann_assign_supported_type {
+    unsigned short *__return;
+};
+
+DACE_EXPORTED int __program_assignment_statements_test_ann_assign_supported_type_batch(assignment_statements_test_ann_assign_supported_type_state_t *__state, const __dace_batch_args_assignment_statements_test_ann_assign_supported_type *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_statements_test_ann_assign_supported_type_internal(__state, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_statements_test_ann_assign_supported_type_state_t *__dace_init_assignment_statements_test_ann_assign_supported_type()
+{
+    int __result = 0;
+    assignment_statements_test_ann_assign_supported_type_state_t *__state = new assignment_statements_test_ann_assign_supported_type_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_type_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
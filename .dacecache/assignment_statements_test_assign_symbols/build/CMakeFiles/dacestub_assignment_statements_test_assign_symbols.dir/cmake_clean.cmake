@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assignment_statements_test_assign_symbols.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assignment_statements_test_assign_symbols.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assignment_statements_test_assign_symbols.pdb"
+  "libdacestub_assignment_statements_test_assign_symbols.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assignment_statements_test_assign_symbols.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
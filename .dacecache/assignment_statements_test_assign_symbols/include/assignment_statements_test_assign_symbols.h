@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_statements_test_assign_symbolsHandle_t;
+extern "C" assignment_statements_test_assign_symbolsHandle_t __dace_init_assignment_statements_test_assign_symbols();
+extern "C" int __dace_exit_assignment_statements_test_assign_symbols(assignment_statements_test_assign_symbolsHandle_t handle);
+extern "C" void __program_assignment_statements_test_assign_symbols(assignment_statements_test_assign_symbolsHandle_t handle, long long * __restrict__ __return_0, long long * __restrict__ __return_1);
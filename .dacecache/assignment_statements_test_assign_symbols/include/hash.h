@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_assign_symbols "2539eab29da1b36011cedd1574fa2e3f99022f9b5ceb8c67750312c25279bbb1"
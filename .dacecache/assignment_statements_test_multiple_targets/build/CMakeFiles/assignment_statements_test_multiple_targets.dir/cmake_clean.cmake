@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_statements_test_multiple_targets.dir/root/package/.dacecache/assignment_statements_test_multiple_targets/src/cpu/assignment_statements_test_multiple_targets.cpp.o"
+  "CMakeFiles/assignment_statements_test_multiple_targets.dir/root/package/.dacecache/assignment_statements_test_multiple_targets/src/cpu/assignment_statements_test_multiple_targets.cpp.o.d"
+  "libassignment_statements_test_multiple_targets.pdb"
+  "libassignment_statements_test_multiple_targets.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_statements_test_multiple_targets.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
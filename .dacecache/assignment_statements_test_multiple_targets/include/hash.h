@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_multiple_targets "aa419d9b9780922a327e5fa440872e8c871d171b971be6808f3dfc6e3ec33579"
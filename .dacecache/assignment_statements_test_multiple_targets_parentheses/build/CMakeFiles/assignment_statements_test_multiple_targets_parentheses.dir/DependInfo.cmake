@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/assignment_statements_test_multiple_targets_parentheses/src/cpu/assignment_statements_test_multiple_targets_parentheses.cpp" "CMakeFiles/assignment_statements_test_multiple_targets_parentheses.dir/root/package/.dacecache/assignment_statements_test_multiple_targets_parentheses/src/cpu/assignment_statements_test_multiple_targets_parentheses.cpp.o" "gcc" "CMakeFiles/assignment_statements_test_multiple_targets_parentheses.dir/root/package/.dacecache/assignment_statements_test_multiple_targets_parentheses/src/cpu/assignment_statements_test_multiple_targets_parentheses.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
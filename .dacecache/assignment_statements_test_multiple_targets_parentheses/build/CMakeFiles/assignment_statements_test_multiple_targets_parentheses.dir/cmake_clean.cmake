@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_statements_test_multiple_targets_parentheses.dir/root/package/.dacecache/assignment_statements_test_multiple_targets_parentheses/src/cpu/assignment_statements_test_multiple_targets_parentheses.cpp.o"
+  "CMakeFiles/assignment_statements_test_multiple_targets_parentheses.dir/root/package/.dacecache/assignment_statements_test_multiple_targets_parentheses/src/cpu/assignment_statements_test_multiple_targets_parentheses.cpp.o.d"
+  "libassignment_statements_test_multiple_targets_parentheses.pdb"
+  "libassignment_statements_test_multiple_targets_parentheses.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_statements_test_multiple_targets_parentheses.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
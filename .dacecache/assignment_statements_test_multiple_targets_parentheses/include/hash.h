@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_multiple_targets_parentheses "0d062da1964223683a0bcb9b4a1347858dea0a648b1a991762444d38a81271a7"
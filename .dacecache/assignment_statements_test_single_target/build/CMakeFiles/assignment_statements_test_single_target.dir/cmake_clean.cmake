@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_statements_test_single_target.dir/root/package/.dacecache/assignment_statements_test_single_target/src/cpu/assignment_statements_test_single_target.cpp.o"
+  "CMakeFiles/assignment_statements_test_single_target.dir/root/package/.dacecache/assignment_statements_test_single_target/src/cpu/assignment_statements_test_single_target.cpp.o.d"
+  "libassignment_statements_test_single_target.pdb"
+  "libassignment_statements_test_single_target.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_statements_test_single_target.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_single_target "dab5bd9385afa0a8e681127d5a7a3ee8e3152ef3ade9b3618473ddff93e9826a"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/assignment_statements_test_single_target.h"
+
+int main(int argc, char **argv) {
+    assignment_statements_test_single_targetHandle_t handle;
+    int err;
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+    float * __restrict__ a = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_assignment_statements_test_single_target();
+    __program_assignment_statements_test_single_target(handle, __return, a);
+    err = __dace_exit_assignment_statements_test_single_target(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
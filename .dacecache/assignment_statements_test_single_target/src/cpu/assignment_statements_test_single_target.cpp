@@ -0,0 +1,117 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_statements_test_single_target_state_t {
+
+};
+
+void __program_assignment_statements_test_single_target_internal(assignment_statements_test_single_target_state_t*__state, float * __restrict__ __return, float * __restrict__ a)
+{
+    float __tmp1;
+    float __tmp3;
+
+
+    __tmp1 = a[0];
+
+    if ((__tmp1 < 0)) {
+        {
+
+            {
+                float __out;
+
+                ///////////////////
+                // Tasklet code (assign_13_8)
+                __out = 0;
+                ///////////////////
+
+                __return[0] = __out;
+            }
+
+        }
+
+    } else {
+
+        __tmp3 = a[0];
+
+        if ((__tmp3 < 1)) {
+            {
+
+                {
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_15_8)
+                    __out = 1;
+                    ///////////////////
+
+                    __return[0] = __out;
+                }
+
+            }
+
+        } else {
+            {
+
+                {
+                    float __inp = a[0];
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_17_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    __return[0] = __out;
+                }
+
+            }
+
+        }
+
+
+    }
+
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_single_target(assignment_statements_test_single_target_state_t *__state, float * __restrict__ __return, float * __restrict__ a)
+{
+    __program_assignment_statements_test_single_target_internal(__state, __return, a);
+}
+
+struct __dace_batch_args_assignment_statements_test_single_target {
+    float *__return;
+    float *a;
+};
+
+DACE_EXPORTED int __program_assignment_statements_test_single_target_batch(assignment_statements_test_single_target_state_t *__state, const __dace_batch_args_assignment_statements_test_single_target *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_statements_test_single_target_internal(__state, __args[__i].__return, __args[__i].a);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_statements_test_single_target_state_t *__dace_init_assignment_statements_test_single_target()
+{
+    int __result = 0;
+    assignment_statements_test_single_target_state_t *__state = new assignment_statements_test_single_target_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_statements_test_single_target(assignment_statements_test_single_target_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
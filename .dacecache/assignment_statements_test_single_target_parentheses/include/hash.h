@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_single_target_parentheses "e4bcd11ab999b5b25e4d56baa3ce371a791a4ba6acca9b9537233f289ba654dd"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_annassign.dir/root/package/.dacecache/assignment_test_annassign/src/cpu/assignment_test_annassign.cpp.o"
+  "CMakeFiles/assignment_test_annassign.dir/root/package/.dacecache/assignment_test_annassign/src/cpu/assignment_test_annassign.cpp.o.d"
+  "libassignment_test_annassign.pdb"
+  "libassignment_test_annassign.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_annassign.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
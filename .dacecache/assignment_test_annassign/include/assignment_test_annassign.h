@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_annassignHandle_t;
+extern "C" assignment_test_annassignHandle_t __dace_init_assignment_test_annassign();
+extern "C" int __dace_exit_assignment_test_annassign(assignment_test_annassignHandle_t handle);
+extern "C" void __program_assignment_test_annassign(assignment_test_annassignHandle_t handle, double * __restrict__ a, long long t);
@@ -0,0 +1 @@
+#define __HASH_assignment_test_annassign "0414e5242ab907512a8ba8694d77cce5b24f6ce6fa1711e7210e0e4eb06efd10"
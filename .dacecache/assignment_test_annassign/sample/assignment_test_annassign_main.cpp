@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/assignment_test_annassign.h"
+
+int main(int argc, char **argv) {
+    assignment_test_annassignHandle_t handle;
+    int err;
+    long long t = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_assignment_test_annassign();
+    __program_assignment_test_annassign(handle, a, t);
+    err = __dace_exit_assignment_test_annassign(handle);
+
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,87 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_annassign_state_t {
+
+};
+
+void __program_assignment_test_annassign_internal(assignment_test_annassign_state_t*__state, double * __restrict__ a, long long t)
+{
+
+    {
+
+        {
+            long long __map_126_e0 = t;
+            #pragma omp parallel for
+            for (auto i = 0; i < __map_126_e0; i += 1) {
+                double b;
+                {
+                    long long __inp = t;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_127_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    b = __out;
+                }
+                {
+                    double __inp = b;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_128_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    a[i] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_annassign(assignment_test_annassign_state_t *__state, double * __restrict__ a, long long t)
+{
+    __program_assignment_test_annassign_internal(__state, a, t);
+}
+
+struct __dace_batch_args_assignment_test_annassign {
+    double * __restrict__ a;
+    long long t;
+};
+
+DACE_EXPORTED int __program_assignment_test_annassign_batch(assignment_test_annassign_state_t *__state, const __dace_batch_args_assignment_test_annassign *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_annassign_internal(__state, __args[__i].a, __args[__i].t);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_annassign_state_t *__dace_init_assignment_test_annassign()
+{
+    int __result = 0;
+    assignment_test_annassign_state_t *__state = new assignment_test_annassign_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_annassign(assignment_test_annassign_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_multiassign.dir/root/package/.dacecache/assignment_test_multiassign/src/cpu/assignment_test_multiassign.cpp.o"
+  "CMakeFiles/assignment_test_multiassign.dir/root/package/.dacecache/assignment_test_multiassign/src/cpu/assignment_test_multiassign.cpp.o.d"
+  "libassignment_test_multiassign.pdb"
+  "libassignment_test_multiassign.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_multiassign.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
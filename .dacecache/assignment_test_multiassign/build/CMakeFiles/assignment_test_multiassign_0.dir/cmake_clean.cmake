@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_multiassign_0.dir/root/package/.dacecache/assignment_test_multiassign/src/cpu/assignment_test_multiassign_0.cpp.o"
+  "CMakeFiles/assignment_test_multiassign_0.dir/root/package/.dacecache/assignment_test_multiassign/src/cpu/assignment_test_multiassign_0.cpp.o.d"
+  "libassignment_test_multiassign_0.pdb"
+  "libassignment_test_multiassign_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_multiassign_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assignment_test_multiassign_0.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assignment_test_multiassign_0.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assignment_test_multiassign_0.pdb"
+  "libdacestub_assignment_test_multiassign_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assignment_test_multiassign_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
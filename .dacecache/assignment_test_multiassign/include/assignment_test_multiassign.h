@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_multiassignHandle_t;
+extern "C" assignment_test_multiassignHandle_t __dace_init_assignment_test_multiassign();
+extern "C" int __dace_exit_assignment_test_multiassign(assignment_test_multiassignHandle_t handle);
+extern "C" void __program_assignment_test_multiassign(assignment_test_multiassignHandle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C);
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_multiassign_0Handle_t;
+extern "C" assignment_test_multiassign_0Handle_t __dace_init_assignment_test_multiassign_0();
+extern "C" int __dace_exit_assignment_test_multiassign_0(assignment_test_multiassign_0Handle_t handle);
+extern "C" void __program_assignment_test_multiassign_0(assignment_test_multiassign_0Handle_t handle, double * __restrict__ B, double * __restrict__ C);
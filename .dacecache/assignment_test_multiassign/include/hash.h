@@ -0,0 +1 @@
+#define __HASH_assignment_test_multiassign_0 "6198804ddfbe8943031dc27daf215ed5c116d5920e043694ae1da707331bd7e6"
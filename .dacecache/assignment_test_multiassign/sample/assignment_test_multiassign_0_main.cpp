@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/assignment_test_multiassign_0.h"
+
+int main(int argc, char **argv) {
+    assignment_test_multiassign_0Handle_t handle;
+    int err;
+    double * __restrict__ B = (double*) calloc(1, sizeof(double));
+    double * __restrict__ C = (double*) calloc(2, sizeof(double));
+
+
+    handle = __dace_init_assignment_test_multiassign_0();
+    __program_assignment_test_multiassign_0(handle, B, C);
+    err = __dace_exit_assignment_test_multiassign_0(handle);
+
+    free(B);
+    free(C);
+
+
+    return err;
+}
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/assignment_test_multiassign.h"
+
+int main(int argc, char **argv) {
+    assignment_test_multiassignHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+    double * __restrict__ B = (double*) calloc(1, sizeof(double));
+    double * __restrict__ C = (double*) calloc(2, sizeof(double));
+
+
+    handle = __dace_init_assignment_test_multiassign();
+    __program_assignment_test_multiassign(handle, A, B, C);
+    err = __dace_exit_assignment_test_multiassign(handle);
+
+    free(A);
+    free(B);
+    free(C);
+
+
+    return err;
+}
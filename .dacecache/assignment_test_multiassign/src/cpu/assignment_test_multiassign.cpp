@@ -0,0 +1,85 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_multiassign_state_t {
+
+};
+
+void __program_assignment_test_multiassign_internal(assignment_test_multiassign_state_t*__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C)
+{
+
+    {
+        double tmp;
+
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        A + 5, &tmp, 1);
+        {
+            double __inp = tmp;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_11_4)
+            __out = __inp;
+            ///////////////////
+
+            C[0] = __out;
+        }
+        {
+            double __inp = tmp;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_12_4)
+            __out = __inp;
+            ///////////////////
+
+            B[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_multiassign(assignment_test_multiassign_state_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C)
+{
+    __program_assignment_test_multiassign_internal(__state, A, B, C);
+}
+
+struct __dace_batch_args_assignment_test_multiassign {
+    double * __restrict__ A;
+    double * __restrict__ B;
+    double * __restrict__ C;
+};
+
+DACE_EXPORTED int __program_assignment_test_multiassign_batch(assignment_test_multiassign_state_t *__state, const __dace_batch_args_assignment_test_multiassign *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_multiassign_internal(__state, __args[__i].A, __args[__i].B, __args[__i].C);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_multiassign_state_t *__dace_init_assignment_test_multiassign()
+{
+    int __result = 0;
+    assignment_test_multiassign_state_t *__state = new assignment_test_multiassign_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_multiassign(assignment_test_multiassign_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,109 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_multiassign_0_state_t {
+
+};
+
+void __program_assignment_test_multiassign_0_internal(assignment_test_multiassign_0_state_t*__state, double * __restrict__ B, double * __restrict__ C)
+{
+
+    {
+        double *tmp;
+        tmp = new double DACE_ALIGN(64)[1];
+        double __tmp0;
+
+        {
+            double __in1 = C[0];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (augassign_25_4)
+            __out = (__in1 + 1);
+            ///////////////////
+
+            C[0] = __out;
+        }
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        C, &__tmp0, 1);
+        {
+            double __inp = __tmp0;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_26_4)
+            __out = __inp;
+            ///////////////////
+
+            tmp[0] = __out;
+        }
+        {
+            double __inp = tmp[0];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_30_4)
+            __out = __inp;
+            ///////////////////
+
+            C[1] = __out;
+        }
+        {
+            double __inp = tmp[0];
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_31_4)
+            __out = __inp;
+            ///////////////////
+
+            B[0] = __out;
+        }
+        delete[] tmp;
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_multiassign_0(assignment_test_multiassign_0_state_t *__state, double * __restrict__ B, double * __restrict__ C)
+{
+    __program_assignment_test_multiassign_0_internal(__state, B, C);
+}
+
+struct __dace_batch_args_assignment_test_multiassign_0 {
+    double * __restrict__ B;
+    double * __restrict__ C;
+};
+
+DACE_EXPORTED int __program_assignment_test_multiassign_0_batch(assignment_test_multiassign_0_state_t *__state, const __dace_batch_args_assignment_test_multiassign_0 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_multiassign_0_internal(__state, __args[__i].B, __args[__i].C);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_multiassign_0_state_t *__dace_init_assignment_test_multiassign_0()
+{
+    int __result = 0;
+    assignment_test_multiassign_0_state_t *__state = new assignment_test_multiassign_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_multiassign_0(assignment_test_multiassign_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_reduce_by_key.dir/root/package/.dacecache/assignment_test_reduce_by_key/src/cpu/assignment_test_reduce_by_key.cpp.o"
+  "CMakeFiles/assignment_test_reduce_by_key.dir/root/package/.dacecache/assignment_test_reduce_by_key/src/cpu/assignment_test_reduce_by_key.cpp.o.d"
+  "libassignment_test_reduce_by_key.pdb"
+  "libassignment_test_reduce_by_key.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_reduce_by_key.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
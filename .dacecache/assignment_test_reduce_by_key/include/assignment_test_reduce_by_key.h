@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_reduce_by_keyHandle_t;
+extern "C" assignment_test_reduce_by_keyHandle_t __dace_init_assignment_test_reduce_by_key();
+extern "C" int __dace_exit_assignment_test_reduce_by_key(assignment_test_reduce_by_keyHandle_t handle);
+extern "C" void __program_assignment_test_reduce_by_key(assignment_test_reduce_by_keyHandle_t handle, float * __restrict__ x, float * __restrict__ y);
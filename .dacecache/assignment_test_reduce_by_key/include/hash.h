@@ -0,0 +1 @@
+#define __HASH_assignment_test_reduce_by_key "5173e2b7b39cc8c7a7bbf1f59c1fbb2c8524fdf31c41bd482ff153029b0871af"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/assignment_test_reduce_by_key.h"
+
+int main(int argc, char **argv) {
+    assignment_test_reduce_by_keyHandle_t handle;
+    int err;
+    float * __restrict__ x = (float*) calloc(400, sizeof(float));
+    float * __restrict__ y = (float*) calloc(20, sizeof(float));
+
+
+    handle = __dace_init_assignment_test_reduce_by_key();
+    __program_assignment_test_reduce_by_key(handle, x, y);
+    err = __dace_exit_assignment_test_reduce_by_key(handle);
+
+    free(x);
+    free(y);
+
+
+    return err;
+}
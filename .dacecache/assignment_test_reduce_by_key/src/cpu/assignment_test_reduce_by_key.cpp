@@ -0,0 +1,114 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_reduce_by_key_state_t {
+
+};
+
+inline void assignment_test_reduce_by_key_149_4_0_0_2(assignment_test_reduce_by_key_state_t *__state, float* __restrict__ __tmp_152_20_r_in_from_2_0, float&  __tmp_154_8_w) {
+    float ytmp;
+
+    {
+
+        {
+            float __out;
+
+            ///////////////////
+            // Tasklet code (assign_150_8)
+            __out = 0;
+            ///////////////////
+
+            ytmp = __out;
+        }
+
+    }
+    {
+
+        {
+            for (auto j = 0; j < 20; j += 1) {
+                {
+                    float __inp = __tmp_152_20_r_in_from_2_0[j];
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_152_12)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(&ytmp, __out);
+                }
+            }
+        }
+        {
+            float __inp = ytmp;
+            float __out;
+
+            ///////////////////
+            // Tasklet code (assign_154_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_154_8_w = __out;
+        }
+
+    }
+    
+}
+
+void __program_assignment_test_reduce_by_key_internal(assignment_test_reduce_by_key_state_t*__state, float * __restrict__ x, float * __restrict__ y)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 20; i += 1) {
+                assignment_test_reduce_by_key_149_4_0_0_2(__state, &x[(20 * i)], y[i]);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_reduce_by_key(assignment_test_reduce_by_key_state_t *__state, float * __restrict__ x, float * __restrict__ y)
+{
+    __program_assignment_test_reduce_by_key_internal(__state, x, y);
+}
+
+struct __dace_batch_args_assignment_test_reduce_by_key {
+    float * __restrict__ x;
+    float * __restrict__ y;
+};
+
+DACE_EXPORTED int __program_assignment_test_reduce_by_key_batch(assignment_test_reduce_by_key_state_t *__state, const __dace_batch_args_assignment_test_reduce_by_key *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_reduce_by_key_internal(__state, __args[__i].x, __args[__i].y);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_reduce_by_key_state_t *__dace_init_assignment_test_reduce_by_key()
+{
+    int __result = 0;
+    assignment_test_reduce_by_key_state_t *__state = new assignment_test_reduce_by_key_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_reduce_by_key(assignment_test_reduce_by_key_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_assign.dir/root/package/.dacecache/assignment_test_test_assign/src/cpu/assignment_test_test_assign.cpp.o"
+  "CMakeFiles/assignment_test_test_assign.dir/root/package/.dacecache/assignment_test_test_assign/src/cpu/assignment_test_test_assign.cpp.o.d"
+  "libassignment_test_test_assign.pdb"
+  "libassignment_test_test_assign.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_assign.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
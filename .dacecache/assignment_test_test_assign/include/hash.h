@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_assign "fbdb83974fd0419990578f87f506ed40f9f9098cd649c4a7f51aad03e6c14fb8"
@@ -0,0 +1,65 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_test_assign_state_t {
+
+};
+
+void __program_assignment_test_test_assign_internal(assignment_test_test_assign_state_t*__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+
+    {
+
+
+        dace::CopyND<float, 1, false, 2, 2>::template ConstDst<5, 1>::Copy(
+        B, A + 7, 2, 1);
+
+        dace::CopyND<float, 1, false, 15>::template ConstDst<1>::Copy(
+        A, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_test_assign(assignment_test_test_assign_state_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+    __program_assignment_test_test_assign_internal(__state, A, B, __return);
+}
+
+struct __dace_batch_args_assignment_test_test_assign {
+    float * __restrict__ A;
+    float * __restrict__ B;
+    float * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_assignment_test_test_assign_batch(assignment_test_test_assign_state_t *__state, const __dace_batch_args_assignment_test_test_assign *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_test_assign_internal(__state, __args[__i].A, __args[__i].B, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_test_assign_state_t *__dace_init_assignment_test_test_assign()
+{
+    int __result = 0;
+    assignment_test_test_assign_state_t *__state = new assignment_test_test_assign_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_test_assign(assignment_test_test_assign_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
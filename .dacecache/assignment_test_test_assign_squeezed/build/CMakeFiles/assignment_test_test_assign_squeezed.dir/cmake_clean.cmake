@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_assign_squeezed.dir/root/package/.dacecache/assignment_test_test_assign_squeezed/src/cpu/assignment_test_test_assign_squeezed.cpp.o"
+  "CMakeFiles/assignment_test_test_assign_squeezed.dir/root/package/.dacecache/assignment_test_test_assign_squeezed/src/cpu/assignment_test_test_assign_squeezed.cpp.o.d"
+  "libassignment_test_test_assign_squeezed.pdb"
+  "libassignment_test_test_assign_squeezed.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_assign_squeezed.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_assign_squeezed "6ca34f5f2a300804a9ebc94eea3ba9f44b4ee30f6f392bbd95fc7b9c0ac1d601"
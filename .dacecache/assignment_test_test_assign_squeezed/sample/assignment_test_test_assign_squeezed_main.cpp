@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/assignment_test_test_assign_squeezed.h"
+
+int main(int argc, char **argv) {
+    assignment_test_test_assign_squeezedHandle_t handle;
+    int err;
+    float * __restrict__ A = (float*) calloc(39000, sizeof(float));
+    float * __restrict__ B = (float*) calloc(8, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(39000, sizeof(float));
+
+
+    handle = __dace_init_assignment_test_test_assign_squeezed();
+    __program_assignment_test_test_assign_squeezed(handle, A, B, __return);
+    err = __dace_exit_assignment_test_test_assign_squeezed(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,82 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_test_assign_squeezed_state_t {
+
+};
+
+void __program_assignment_test_test_assign_squeezed_internal(assignment_test_test_assign_squeezed_state_t*__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 2; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 10; __i1 += 1) {
+                    for (auto __i2 = 8; __i2 < 12; __i2 += 1) {
+                        {
+                            float __inp = B[(((4 * __i0) + __i2) - 16)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (assign_117_4)
+                            __out = __inp;
+                            ///////////////////
+
+                            A[((((2600 * __i0) + (260 * __i1)) + __i2) + 26013)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+
+        dace::CopyND<float, 1, false, 39000>::template ConstDst<1>::Copy(
+        A, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_test_assign_squeezed(assignment_test_test_assign_squeezed_state_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+    __program_assignment_test_test_assign_squeezed_internal(__state, A, B, __return);
+}
+
+struct __dace_batch_args_assignment_test_test_assign_squeezed {
+    float * __restrict__ A;
+    float * __restrict__ B;
+    float * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_assignment_test_test_assign_squeezed_batch(assignment_test_test_assign_squeezed_state_t *__state, const __dace_batch_args_assignment_test_test_assign_squeezed *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_test_assign_squeezed_internal(__state, __args[__i].A, __args[__i].B, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_test_assign_squeezed_state_t *__dace_init_assignment_test_test_assign_squeezed()
+{
+    int __result = 0;
+    assignment_test_test_assign_squeezed_state_t *__state = new assignment_test_test_assign_squeezed_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_test_assign_squeezed(assignment_test_test_assign_squeezed_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
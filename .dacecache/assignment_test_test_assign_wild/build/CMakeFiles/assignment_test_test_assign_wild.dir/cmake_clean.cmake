@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_assign_wild.dir/root/package/.dacecache/assignment_test_test_assign_wild/src/cpu/assignment_test_test_assign_wild.cpp.o"
+  "CMakeFiles/assignment_test_test_assign_wild.dir/root/package/.dacecache/assignment_test_test_assign_wild/src/cpu/assignment_test_test_assign_wild.cpp.o.d"
+  "libassignment_test_test_assign_wild.pdb"
+  "libassignment_test_test_assign_wild.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_assign_wild.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
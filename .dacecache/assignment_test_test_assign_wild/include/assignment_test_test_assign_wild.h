@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_test_assign_wildHandle_t;
+extern "C" assignment_test_test_assign_wildHandle_t __dace_init_assignment_test_test_assign_wild();
+extern "C" int __dace_exit_assignment_test_test_assign_wild(assignment_test_test_assign_wildHandle_t handle);
+extern "C" void __program_assignment_test_test_assign_wild(assignment_test_test_assign_wildHandle_t handle, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return);
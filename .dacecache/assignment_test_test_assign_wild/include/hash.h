@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_assign_wild "786b22cb79da6564d29f7dc6788a6c7c78ac9764f52d396d941fac1c72fc7ad9"
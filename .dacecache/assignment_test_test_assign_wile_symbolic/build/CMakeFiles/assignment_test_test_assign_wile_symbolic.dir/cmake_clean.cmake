@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_assign_wile_symbolic.dir/root/package/.dacecache/assignment_test_test_assign_wile_symbolic/src/cpu/assignment_test_test_assign_wile_symbolic.cpp.o"
+  "CMakeFiles/assignment_test_test_assign_wile_symbolic.dir/root/package/.dacecache/assignment_test_test_assign_wile_symbolic/src/cpu/assignment_test_test_assign_wile_symbolic.cpp.o.d"
+  "libassignment_test_test_assign_wile_symbolic.pdb"
+  "libassignment_test_test_assign_wile_symbolic.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_assign_wile_symbolic.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
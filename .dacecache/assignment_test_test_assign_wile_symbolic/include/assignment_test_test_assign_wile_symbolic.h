@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_test_assign_wile_symbolicHandle_t;
+extern "C" assignment_test_test_assign_wile_symbolicHandle_t __dace_init_assignment_test_test_assign_wile_symbolic(int N);
+extern "C" int __dace_exit_assignment_test_test_assign_wile_symbolic(assignment_test_test_assign_wile_symbolicHandle_t handle);
+extern "C" void __program_assignment_test_test_assign_wile_symbolic(assignment_test_test_assign_wile_symbolicHandle_t handle, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return, int N);
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_assign_wile_symbolic "0b7e55ee580b130ca0928720f1c067d3a4645830a5fc1684b5fa07746b0a3bf5"
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/assignment_test_test_assign_wile_symbolic.h"
+
+int main(int argc, char **argv) {
+    assignment_test_test_assign_wile_symbolicHandle_t handle;
+    int err;
+    int N = 42;
+    float * __restrict__ A = (float*) calloc((390 * N), sizeof(float));
+    float * __restrict__ B = (float*) calloc((((-4 * I) * N) + ((4 * N) * (I + 1))), sizeof(float));
+    float * __restrict__ __return = (float*) calloc((390 * N), sizeof(float));
+
+
+    handle = __dace_init_assignment_test_test_assign_wile_symbolic(N);
+    __program_assignment_test_test_assign_wile_symbolic(handle, A, B, __return, N);
+    err = __dace_exit_assignment_test_test_assign_wile_symbolic(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
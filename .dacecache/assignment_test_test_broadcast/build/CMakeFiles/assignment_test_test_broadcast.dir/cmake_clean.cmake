@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_broadcast.dir/root/package/.dacecache/assignment_test_test_broadcast/src/cpu/assignment_test_test_broadcast.cpp.o"
+  "CMakeFiles/assignment_test_test_broadcast.dir/root/package/.dacecache/assignment_test_test_broadcast/src/cpu/assignment_test_test_broadcast.cpp.o.d"
+  "libassignment_test_test_broadcast.pdb"
+  "libassignment_test_test_broadcast.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_broadcast.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_broadcast "b19d49cf06b5bc84be53db7bf20c61f08b587d1039e9d4c5f8fa37b9de2eae60"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_broadcast2.dir/root/package/.dacecache/assignment_test_test_broadcast2/src/cpu/assignment_test_test_broadcast2.cpp.o"
+  "CMakeFiles/assignment_test_test_broadcast2.dir/root/package/.dacecache/assignment_test_test_broadcast2/src/cpu/assignment_test_test_broadcast2.cpp.o.d"
+  "libassignment_test_test_broadcast2.pdb"
+  "libassignment_test_test_broadcast2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_broadcast2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_broadcast2 "1130d6f39ba8d74a65ed0741309e6d3059c75aca28e17d84b68739ae39181dde"
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_broadcast3 "e6241d9c77cb34fd76bfa4374fbe217f16178412c80c1edb9ca12132d1e4e984"
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_broadcast4 "83579c2558b08d350c41004c7efa11c0f4306da324037edbdcf47850bcf69d55"
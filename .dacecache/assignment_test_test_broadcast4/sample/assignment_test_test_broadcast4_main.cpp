@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/assignment_test_test_broadcast4.h"
+
+int main(int argc, char **argv) {
+    assignment_test_test_broadcast4Handle_t handle;
+    int err;
+    float * __restrict__ A = (float*) calloc(15, sizeof(float));
+    float * __restrict__ B = (float*) calloc(2, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(15, sizeof(float));
+
+
+    handle = __dace_init_assignment_test_test_broadcast4();
+    __program_assignment_test_test_broadcast4(handle, A, B, __return);
+    err = __dace_exit_assignment_test_test_broadcast4(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
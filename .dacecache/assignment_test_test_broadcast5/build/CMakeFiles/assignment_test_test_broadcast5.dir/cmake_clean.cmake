@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_broadcast5.dir/root/package/.dacecache/assignment_test_test_broadcast5/src/cpu/assignment_test_test_broadcast5.cpp.o"
+  "CMakeFiles/assignment_test_test_broadcast5.dir/root/package/.dacecache/assignment_test_test_broadcast5/src/cpu/assignment_test_test_broadcast5.cpp.o.d"
+  "libassignment_test_test_broadcast5.pdb"
+  "libassignment_test_test_broadcast5.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_broadcast5.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_test_test_broadcast5Handle_t;
+extern "C" assignment_test_test_broadcast5Handle_t __dace_init_assignment_test_test_broadcast5();
+extern "C" int __dace_exit_assignment_test_test_broadcast5(assignment_test_test_broadcast5Handle_t handle);
+extern "C" void __program_assignment_test_test_broadcast5(assignment_test_test_broadcast5Handle_t handle, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return);
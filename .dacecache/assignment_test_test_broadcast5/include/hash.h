@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_broadcast5 "4d6bb83f1c8df6074c5f4ade332b327494c6d3be1fd17abb0bcd4962e7ea5993"
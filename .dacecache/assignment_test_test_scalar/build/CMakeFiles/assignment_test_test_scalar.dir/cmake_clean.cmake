@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_scalar.dir/root/package/.dacecache/assignment_test_test_scalar/src/cpu/assignment_test_test_scalar.cpp.o"
+  "CMakeFiles/assignment_test_test_scalar.dir/root/package/.dacecache/assignment_test_test_scalar/src/cpu/assignment_test_test_scalar.cpp.o.d"
+  "libassignment_test_test_scalar.pdb"
+  "libassignment_test_test_scalar.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_scalar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assignment_test_test_scalar.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assignment_test_test_scalar.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assignment_test_test_scalar.pdb"
+  "libdacestub_assignment_test_test_scalar.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assignment_test_test_scalar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
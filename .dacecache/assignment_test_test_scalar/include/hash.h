@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_scalar "d4e7a7a8b232f93fa8d2f27afaaa9062737bd34849b84281792bae1bc0b00d52"
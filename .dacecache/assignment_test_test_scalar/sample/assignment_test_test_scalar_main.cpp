@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/assignment_test_test_scalar.h"
+
+int main(int argc, char **argv) {
+    assignment_test_test_scalarHandle_t handle;
+    int err;
+    float B = 42;
+    float * __restrict__ A = (float*) calloc(15, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(15, sizeof(float));
+
+
+    handle = __dace_init_assignment_test_test_scalar();
+    __program_assignment_test_test_scalar(handle, A, __return, B);
+    err = __dace_exit_assignment_test_test_scalar(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
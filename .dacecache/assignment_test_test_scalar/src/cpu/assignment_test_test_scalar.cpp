@@ -0,0 +1,80 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_test_test_scalar_state_t {
+
+};
+
+void __program_assignment_test_test_scalar_internal(assignment_test_test_scalar_state_t*__state, float * __restrict__ A, float * __restrict__ __return, float B)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __inp = B;
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_48_4)
+                        __out = __inp;
+                        ///////////////////
+
+                        A[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+        dace::CopyND<float, 1, false, 15>::template ConstDst<1>::Copy(
+        A, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_test_test_scalar(assignment_test_test_scalar_state_t *__state, float * __restrict__ A, float * __restrict__ __return, float B)
+{
+    __program_assignment_test_test_scalar_internal(__state, A, __return, B);
+}
+
+struct __dace_batch_args_assignment_test_test_scalar {
+    float * __restrict__ A;
+    float * __restrict__ __return;
+    float B;
+};
+
+DACE_EXPORTED int __program_assignment_test_test_scalar_batch(assignment_test_test_scalar_state_t *__state, const __dace_batch_args_assignment_test_test_scalar *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_assignment_test_test_scalar_internal(__state, __args[__i].A, __args[__i].__return, __args[__i].B);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED assignment_test_test_scalar_state_t *__dace_init_assignment_test_test_scalar()
+{
+    int __result = 0;
+    assignment_test_test_scalar_state_t *__state = new assignment_test_test_scalar_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_test_test_scalar(assignment_test_test_scalar_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
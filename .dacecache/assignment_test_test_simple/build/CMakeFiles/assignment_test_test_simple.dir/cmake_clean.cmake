@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_test_test_simple.dir/root/package/.dacecache/assignment_test_test_simple/src/cpu/assignment_test_test_simple.cpp.o"
+  "CMakeFiles/assignment_test_test_simple.dir/root/package/.dacecache/assignment_test_test_simple/src/cpu/assignment_test_test_simple.cpp.o.d"
+  "libassignment_test_test_simple.pdb"
+  "libassignment_test_test_simple.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_test_test_simple.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_test_test_simple "9d3603e7385b12a9ee3ef16448231c55c107da00690354bc042525ff5d31c306"
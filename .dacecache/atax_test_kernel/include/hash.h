@@ -0,0 +1 @@
+#define __HASH_atax_test_kernel "d8f5f71438c0c06a118567a22fb03203fa298f705103f89899f111ff667ea78a"
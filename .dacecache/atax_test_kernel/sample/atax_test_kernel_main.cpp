@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/atax_test_kernel.h"
+
+int main(int argc, char **argv) {
+    atax_test_kernelHandle_t handle;
+    int err;
+    int M = 42;
+    int N = 42;
+    float * __restrict__ A = (float*) calloc((M * N), sizeof(float));
+    float * __restrict__ __return = (float*) calloc(N, sizeof(float));
+    float * __restrict__ x = (float*) calloc(N, sizeof(float));
+
+
+    handle = __dace_init_atax_test_kernel(M, N);
+    __program_atax_test_kernel(handle, A, __return, x, M, N);
+    err = __dace_exit_atax_test_kernel(handle);
+
+    free(A);
+    free(__return);
+    free(x);
+
+
+    return err;
+}
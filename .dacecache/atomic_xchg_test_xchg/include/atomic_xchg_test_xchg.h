@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * atomic_xchg_test_xchgHandle_t;
+extern "C" atomic_xchg_test_xchgHandle_t __dace_init_atomic_xchg_test_xchg();
+extern "C" int __dace_exit_atomic_xchg_test_xchg(atomic_xchg_test_xchgHandle_t handle);
+extern "C" void __program_atomic_xchg_test_xchg(atomic_xchg_test_xchgHandle_t handle, int * __restrict__ locked, int * __restrict__ output);
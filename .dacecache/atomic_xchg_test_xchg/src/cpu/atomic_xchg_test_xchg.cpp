@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct atomic_xchg_test_xchg_state_t {
+
+};
+
+void __program_atomic_xchg_test_xchg_internal(atomic_xchg_test_xchg_state_t*__state, int * __restrict__ locked, int * __restrict__ output)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 20; i += 1) {
+                {
+                    int l;
+                    int out;
+
+                    ///////////////////
+                    // Tasklet code (atomic_xchg_test_xchg_9)
+                    l = dace::wcr_fixed<dace::ReductionType::Exchange, int>::reduce_atomic(locked, 4);
+                    out = l;
+                    ///////////////////
+
+                    output[i] = out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_atomic_xchg_test_xchg(atomic_xchg_test_xchg_state_t *__state, int * __restrict__ locked, int * __restrict__ output)
+{
+    __program_atomic_xchg_test_xchg_internal(__state, locked, output);
+}
+
+struct __dace_batch_args_atomic_xchg_test_xchg {
+    int *locked;
+    int *output;
+};
+
+DACE_EXPORTED int __program_atomic_xchg_test_xchg_batch(atomic_xchg_test_xchg_state_t *__state, const __dace_batch_args_atomic_xchg_test_xchg *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_atomic_xchg_test_xchg_internal(__state, __args[__i].locked, __args[__i].output);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED atomic_xchg_test_xchg_state_t *__dace_init_atomic_xchg_test_xchg()
+{
+    int __result = 0;
+    atomic_xchg_test_xchg_state_t *__state = new atomic_xchg_test_xchg_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_atomic_xchg_test_xchg(atomic_xchg_test_xchg_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
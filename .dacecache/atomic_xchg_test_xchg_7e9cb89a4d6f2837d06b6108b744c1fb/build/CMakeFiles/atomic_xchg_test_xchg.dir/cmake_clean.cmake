@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/atomic_xchg_test_xchg.dir/root/package/.dacecache/atomic_xchg_test_xchg_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/atomic_xchg_test_xchg.cpp.o"
+  "CMakeFiles/atomic_xchg_test_xchg.dir/root/package/.dacecache/atomic_xchg_test_xchg_7e9cb89a4d6f2837d06b6108b744c1fb/src/cpu/atomic_xchg_test_xchg.cpp.o.d"
+  "libatomic_xchg_test_xchg.pdb"
+  "libatomic_xchg_test_xchg.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/atomic_xchg_test_xchg.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
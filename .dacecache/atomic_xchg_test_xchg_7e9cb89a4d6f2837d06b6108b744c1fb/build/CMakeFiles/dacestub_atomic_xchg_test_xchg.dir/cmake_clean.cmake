@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_atomic_xchg_test_xchg.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_atomic_xchg_test_xchg.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_atomic_xchg_test_xchg.pdb"
+  "libdacestub_atomic_xchg_test_xchg.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_atomic_xchg_test_xchg.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_atomic_xchg_test_xchg "0cbb8f9d609b1c4b295c22f262968705e1cd00ceb85ffd3345d8a1e24b5ccaef"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/atomic_xchg_test_xchg.h"
+
+int main(int argc, char **argv) {
+    atomic_xchg_test_xchgHandle_t handle;
+    int err;
+    int * __restrict__ locked = (int*) calloc(1, sizeof(int));
+    int * __restrict__ output = (int*) calloc(20, sizeof(int));
+
+
+    handle = __dace_init_atomic_xchg_test_xchg();
+    __program_atomic_xchg_test_xchg(handle, locked, output);
+    err = __dace_exit_atomic_xchg_test_xchg(handle);
+
+    free(locked);
+    free(output);
+
+
+    return err;
+}
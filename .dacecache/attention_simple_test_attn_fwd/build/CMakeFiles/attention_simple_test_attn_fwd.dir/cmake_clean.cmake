@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/attention_simple_test_attn_fwd.dir/root/package/.dacecache/attention_simple_test_attn_fwd/src/cpu/attention_simple_test_attn_fwd.cpp.o"
+  "CMakeFiles/attention_simple_test_attn_fwd.dir/root/package/.dacecache/attention_simple_test_attn_fwd/src/cpu/attention_simple_test_attn_fwd.cpp.o.d"
+  "libattention_simple_test_attn_fwd.pdb"
+  "libattention_simple_test_attn_fwd.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/attention_simple_test_attn_fwd.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_attention_simple_test_attn_fwd "4832eab50f9e7a2639c0735a44f882eeae36be408e1cdc60b8a4283fbe9437ac"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/attention_test_attn_fwd.dir/root/package/.dacecache/attention_test_attn_fwd/src/cpu/attention_test_attn_fwd.cpp.o"
+  "CMakeFiles/attention_test_attn_fwd.dir/root/package/.dacecache/attention_test_attn_fwd/src/cpu/attention_test_attn_fwd.cpp.o.d"
+  "libattention_test_attn_fwd.pdb"
+  "libattention_test_attn_fwd.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/attention_test_attn_fwd.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
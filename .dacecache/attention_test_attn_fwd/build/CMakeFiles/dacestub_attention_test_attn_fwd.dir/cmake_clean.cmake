@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_attention_test_attn_fwd.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_attention_test_attn_fwd.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_attention_test_attn_fwd.pdb"
+  "libdacestub_attention_test_attn_fwd.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_attention_test_attn_fwd.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
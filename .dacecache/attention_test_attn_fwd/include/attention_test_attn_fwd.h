@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * attention_test_attn_fwdHandle_t;
+extern "C" attention_test_attn_fwdHandle_t __dace_init_attention_test_attn_fwd(int Qsize, int batchSize, int numHeads, int projQsize, int seqLenK, int seqLenQ);
+extern "C" int __dace_exit_attention_test_attn_fwd(attention_test_attn_fwdHandle_t handle);
+extern "C" void __program_attention_test_attn_fwd(attention_test_attn_fwdHandle_t handle, float * __restrict__ k, float * __restrict__ out, float * __restrict__ q, float * __restrict__ v, float * __restrict__ wk, float * __restrict__ wo, float * __restrict__ wq, float * __restrict__ wv, int Qsize, int batchSize, int numHeads, int projQsize, int seqLenK, int seqLenQ);
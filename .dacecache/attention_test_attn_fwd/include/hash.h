@@ -0,0 +1 @@
+#define __HASH_attention_test_attn_fwd "3ec0b7e6e3d913d00c89e43a969f32ce4403d45b86eaa45baa7d49cb5aac564b"
@@ -0,0 +1,38 @@
+#include <cstdlib>
+#include "../include/attention_test_attn_fwd.h"
+
+int main(int argc, char **argv) {
+    attention_test_attn_fwdHandle_t handle;
+    int err;
+    int Qsize = 42;
+    int batchSize = 42;
+    int numHeads = 42;
+    int projQsize = 42;
+    int seqLenK = 42;
+    int seqLenQ = 42;
+    float * __restrict__ k = (float*) calloc(((Qsize * batchSize) * seqLenK), sizeof(float));
+    float * __restrict__ out = (float*) calloc(((Qsize * batchSize) * seqLenQ), sizeof(float));
+    float * __restrict__ q = (float*) calloc(((Qsize * batchSize) * seqLenQ), sizeof(float));
+    float * __restrict__ v = (float*) calloc(((Qsize * batchSize) * seqLenK), sizeof(float));
+    float * __restrict__ wk = (float*) calloc(((Qsize * numHeads) * projQsize), sizeof(float));
+    float * __restrict__ wo = (float*) calloc(((Qsize * numHeads) * projQsize), sizeof(float));
+    float * __restrict__ wq = (float*) calloc(((Qsize * numHeads) * projQsize), sizeof(float));
+    float * __restrict__ wv = (float*) calloc(((Qsize * numHeads) * projQsize), sizeof(float));
+
+
+    handle = __dace_init_attention_test_attn_fwd(Qsize, batchSize, numHeads, projQsize, seqLenK, seqLenQ);
+    __program_attention_test_attn_fwd(handle, k, out, q, v, wk, wo, wq, wv, Qsize, batchSize, numHeads, projQsize, seqLenK, seqLenQ);
+    err = __dace_exit_attention_test_attn_fwd(handle);
+
+    free(k);
+    free(out);
+    free(q);
+    free(v);
+    free(wk);
+    free(wo);
+    free(wq);
+    free(wv);
+
+
+    return err;
+}
@@ -0,0 +1,522 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct attention_test_attn_fwd_state_t {
+
+};
+
+inline void _MatMult_gemm_sdfg_0_0_29(attention_test_attn_fwd_state_t *__state, float* __restrict__ _a, float* __restrict__ _b, float* __restrict__ _c, int Qsize, int projQsize, int seqLenQ) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < projQsize; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenQ; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((_o0 * seqLenQ) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto __i0 = 0; __i0 < projQsize; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < seqLenQ; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < Qsize; __i2 += 1) {
+                        {
+                            float __a = _a[((Qsize * __i0) + __i2)];
+                            float __b = _b[(__i1 + (__i2 * seqLenQ))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_c + ((__i0 * seqLenQ) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_30(attention_test_attn_fwd_state_t *__state, float* __restrict__ _a, float* __restrict__ _b, float* __restrict__ _c, int Qsize, int projQsize, int seqLenK) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < projQsize; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenK; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((_o0 * seqLenK) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto __i0 = 0; __i0 < projQsize; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < seqLenK; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < Qsize; __i2 += 1) {
+                        {
+                            float __a = _a[((Qsize * __i0) + __i2)];
+                            float __b = _b[(__i1 + (__i2 * seqLenK))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_c + ((__i0 * seqLenK) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_32(attention_test_attn_fwd_state_t *__state, float* __restrict__ _a, float* __restrict__ _b, float* __restrict__ _c, int projQsize, int seqLenK, int seqLenQ) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < seqLenK; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenQ; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((_o0 * seqLenQ) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto __i0 = 0; __i0 < seqLenK; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < seqLenQ; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < projQsize; __i2 += 1) {
+                        {
+                            float __a = _a[((__i0 * projQsize) + __i2)];
+                            float __b = _b[(__i1 + (__i2 * seqLenQ))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_c + ((__i0 * seqLenQ) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_1_1_7(attention_test_attn_fwd_state_t *__state, float* __restrict__ _in, float* __restrict__ _out, int N) {
+
+    {
+
+        {
+            for (auto _i0 = 0; _i0 < N; _i0 += 1) {
+                {
+                    float __inp = _in[_i0];
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Max, float>::reduce(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_1_1_8(attention_test_attn_fwd_state_t *__state, float* __restrict__ _in, float* __restrict__ _out, int N) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 0;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto _i0 = 0; _i0 < N; _i0 += 1) {
+                {
+                    float __inp = _in[_i0];
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void attention_test_dace_softmax_0_0_27(attention_test_attn_fwd_state_t *__state, float* __restrict__ X_in, float* __restrict__ X_out, int N) {
+    float tmp_sum[1]  DACE_ALIGN(64);
+
+    {
+        float tmp_max[1]  DACE_ALIGN(64);
+
+        reduce_1_1_7(__state, &X_in[0], &tmp_max[0], N);
+        {
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    float x_in = X_in[i];
+                    float x_max = tmp_max[0];
+                    float x_out;
+
+                    ///////////////////
+                    // Tasklet code (softmax_tasklet_sub)
+                    x_out = exp((x_in - x_max));
+                    ///////////////////
+
+                    X_out[i] = x_out;
+                }
+            }
+        }
+        reduce_1_1_8(__state, &X_out[0], &tmp_sum[0], N);
+
+    }
+    {
+
+        {
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    float x_in = X_out[i];
+                    float x_sum = tmp_sum[0];
+                    float x_out;
+
+                    ///////////////////
+                    // Tasklet code (softmax_tasklet_div)
+                    x_out = (x_in / x_sum);
+                    ///////////////////
+
+                    X_out[i] = x_out;
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_33(attention_test_attn_fwd_state_t *__state, float* __restrict__ _a, float* __restrict__ _b, float* __restrict__ _c, int projQsize, int seqLenK, int seqLenQ) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < projQsize; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenQ; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((_o0 * seqLenQ) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto __i0 = 0; __i0 < projQsize; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < seqLenQ; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < seqLenK; __i2 += 1) {
+                        {
+                            float __a = _a[((__i0 * seqLenK) + __i2)];
+                            float __b = _b[(__i1 + (__i2 * seqLenQ))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_c + ((__i0 * seqLenQ) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_34(attention_test_attn_fwd_state_t *__state, float* __restrict__ _a, float* __restrict__ _b, float* __restrict__ _c, int Qsize, int projQsize, int seqLenQ) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < Qsize; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenQ; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((_o0 * seqLenQ) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            for (auto __i0 = 0; __i0 < Qsize; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < seqLenQ; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < projQsize; __i2 += 1) {
+                        {
+                            float __a = _a[((__i0 * projQsize) + __i2)];
+                            float __b = _b[(__i1 + (__i2 * seqLenQ))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_c + ((__i0 * seqLenQ) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_0_0_28(attention_test_attn_fwd_state_t *__state, float* __restrict__ _in, float* __restrict__ _out, int Qsize, int numHeads, int seqLenQ) {
+
+    {
+
+        {
+            for (auto _o0 = 0; _o0 < Qsize; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < seqLenQ; _o1 += 1) {
+                    for (auto _i0 = 0; _i0 < numHeads; _i0 += 1) {
+                        {
+                            float __inp = _in[((((Qsize * _i0) * seqLenQ) + (_o0 * seqLenQ)) + _o1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (identity)
+                            __out = __inp;
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(_out + ((_o0 * seqLenQ) + _o1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_attention_test_attn_fwd_internal(attention_test_attn_fwd_state_t*__state, float * __restrict__ k, float * __restrict__ out, float * __restrict__ q, float * __restrict__ v, float * __restrict__ wk, float * __restrict__ wo, float * __restrict__ wq, float * __restrict__ wv, int Qsize, int batchSize, int numHeads, int projQsize, int seqLenK, int seqLenQ)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto b = 0; b < batchSize; b += 1) {
+                float *outs;
+                outs = new float DACE_ALIGN(64)[((Qsize * numHeads) * seqLenQ)];
+                float* __tmp2;
+                __tmp2 = &out[((Qsize * b) * seqLenQ)];
+                {
+                    for (auto h = 0; h < numHeads; h += 1) {
+                        float *q_bar;
+                        q_bar = new float DACE_ALIGN(64)[(projQsize * seqLenQ)];
+                        float *__tmp9;
+                        __tmp9 = new float DACE_ALIGN(64)[(projQsize * seqLenK)];
+                        float *__tmp10;
+                        __tmp10 = new float DACE_ALIGN(64)[(projQsize * seqLenK)];
+                        float *k_bar_t;
+                        k_bar_t = new float DACE_ALIGN(64)[(projQsize * seqLenK)];
+                        float *__tmp5;
+                        __tmp5 = new float DACE_ALIGN(64)[(seqLenK * seqLenQ)];
+                        float *alpha;
+                        alpha = new float DACE_ALIGN(64)[(seqLenK * seqLenQ)];
+                        float *h_bar;
+                        h_bar = new float DACE_ALIGN(64)[(projQsize * seqLenQ)];
+                        _MatMult_gemm_sdfg_0_0_29(__state, &wq[((Qsize * h) * projQsize)], &q[((Qsize * b) * seqLenQ)], &q_bar[0], Qsize, projQsize, seqLenQ);
+                        _MatMult_gemm_sdfg_0_0_30(__state, &wk[((Qsize * h) * projQsize)], &k[((Qsize * b) * seqLenK)], &__tmp9[0], Qsize, projQsize, seqLenK);
+                        {
+                            for (auto i = 0; i < projQsize; i += 1) {
+                                for (auto j = 0; j < seqLenK; j += 1) {
+                                    {
+                                        float __inp = __tmp9[((i * seqLenK) + j)];
+                                        float __out;
+
+                                        ///////////////////
+                                        // Tasklet code (assign_50_8)
+                                        __out = __inp;
+                                        ///////////////////
+
+                                        k_bar_t[(i + (j * projQsize))] = __out;
+                                    }
+                                }
+                            }
+                        }
+                        _MatMult_gemm_sdfg_0_0_32(__state, &k_bar_t[0], &q_bar[0], &__tmp5[0], projQsize, seqLenK, seqLenQ);
+                        {
+                            for (auto j = 0; j < seqLenK; j += 1) {
+                                attention_test_dace_softmax_0_0_27(__state, &__tmp5[(j * seqLenQ)], &alpha[(j * seqLenQ)], seqLenQ);
+                            }
+                        }
+                        _MatMult_gemm_sdfg_0_0_30(__state, &wv[((Qsize * h) * projQsize)], &v[((Qsize * b) * seqLenK)], &__tmp10[0], Qsize, projQsize, seqLenK);
+                        _MatMult_gemm_sdfg_0_0_33(__state, &__tmp10[0], &alpha[0], &h_bar[0], projQsize, seqLenK, seqLenQ);
+                        _MatMult_gemm_sdfg_0_0_34(__state, &wo[((Qsize * h) * projQsize)], &h_bar[0], &outs[((Qsize * h) * seqLenQ)], Qsize, projQsize, seqLenQ);
+                        delete[] q_bar;
+                        delete[] __tmp9;
+                        delete[] __tmp10;
+                        delete[] k_bar_t;
+                        delete[] __tmp5;
+                        delete[] alpha;
+                        delete[] h_bar;
+                    }
+                }
+                reduce_0_0_28(__state, &outs[0], &__tmp2[0], Qsize, numHeads, seqLenQ);
+                delete[] outs;
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_attention_test_attn_fwd(attention_test_attn_fwd_state_t *__state, float * __restrict__ k, float * __restrict__ out, float * __restrict__ q, float * __restrict__ v, float * __restrict__ wk, float * __restrict__ wo, float * __restrict__ wq, float * __restrict__ wv, int Qsize, int batchSize, int numHeads, int projQsize, int seqLenK, int seqLenQ)
+{
+    __program_attention_test_attn_fwd_internal(__state, k, out, q, v, wk, wo, wq, wv, Qsize, batchSize, numHeads, projQsize, seqLenK, seqLenQ);
+}
+
+struct __dace_batch_args_attention_test_attn_fwd {
+    float * __restrict__ k;
+    float * __restrict__ out;
+    float * __restrict__ q;
+    float * __restrict__ v;
+    float * __restrict__ wk;
+    float * __restrict__ wo;
+    float * __restrict__ wq;
+    float * __restrict__ wv;
+    int Qsize;
+    int batchSize;
+    int numHeads;
+    int projQsize;
+    int seqLenK;
+    int seqLenQ;
+};
+
+DACE_EXPORTED int __program_attention_test_attn_fwd_batch(attention_test_attn_fwd_state_t *__state, const __dace_batch_args_attention_test_attn_fwd *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_attention_test_attn_fwd_internal(__state, __args[__i].k, __args[__i].out, __args[__i].q, __args[__i].v, __args[__i].wk, __args[__i].wo, __args[__i].wq, __args[__i].wv, __args[__i].Qsize, __args[__i].batchSize, __args[__i].numHeads, __args[__i].projQsize, __args[__i].seqLenK, __args[__i].seqLenQ);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED attention_test_attn_fwd_state_t *__dace_init_attention_test_attn_fwd(int Qsize, int batchSize, int numHeads, int projQsize, int seqLenK, int seqLenQ)
+{
+    int __result = 0;
+    attention_test_attn_fwd_state_t *__state = new attention_test_attn_fwd_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_attention_test_attn_fwd(attention_test_attn_fwd_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
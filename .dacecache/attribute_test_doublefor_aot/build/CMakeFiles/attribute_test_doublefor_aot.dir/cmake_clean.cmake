@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/attribute_test_doublefor_aot.dir/root/package/.dacecache/attribute_test_doublefor_aot/src/cpu/attribute_test_doublefor_aot.cpp.o"
+  "CMakeFiles/attribute_test_doublefor_aot.dir/root/package/.dacecache/attribute_test_doublefor_aot/src/cpu/attribute_test_doublefor_aot.cpp.o.d"
+  "libattribute_test_doublefor_aot.pdb"
+  "libattribute_test_doublefor_aot.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/attribute_test_doublefor_aot.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * attribute_test_doublefor_aotHandle_t;
+extern "C" attribute_test_doublefor_aotHandle_t __dace_init_attribute_test_doublefor_aot(int N);
+extern "C" int __dace_exit_attribute_test_doublefor_aot(attribute_test_doublefor_aotHandle_t handle);
+extern "C" void __program_attribute_test_doublefor_aot(attribute_test_doublefor_aotHandle_t handle, double * __restrict__ A, int N);
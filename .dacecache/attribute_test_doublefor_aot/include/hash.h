@@ -0,0 +1 @@
+#define __HASH_attribute_test_doublefor_aot "0bed0f312f9c129a4406abe1eb19d05a0359d85544c65719e5e27fbfb05835d0"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/attribute_test_doublefor_aot.h"
+
+int main(int argc, char **argv) {
+    attribute_test_doublefor_aotHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_attribute_test_doublefor_aot(N);
+    __program_attribute_test_doublefor_aot(handle, A, N);
+    err = __dace_exit_attribute_test_doublefor_aot(handle);
+
+    free(A);
+
+
+    return err;
+}
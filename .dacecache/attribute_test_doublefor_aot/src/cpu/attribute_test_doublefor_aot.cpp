@@ -0,0 +1,85 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct attribute_test_doublefor_aot_state_t {
+
+};
+
+void __program_attribute_test_doublefor_aot_internal(attribute_test_doublefor_aot_state_t*__state, double * __restrict__ A, int N)
+{
+    long long i;
+    long long j;
+
+
+
+
+    for (i = 0; (i < N); i = i + 1) {
+
+
+
+        for (j = 0; (j < N); j = j + 1) {
+            {
+
+                {
+                    double __in1 = A[((N * i) + j)];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_19_12)
+                    __out = (__in1 * N);
+                    ///////////////////
+
+                    A[((N * i) + j)] = __out;
+                }
+
+            }
+
+        }
+
+
+    }
+
+}
+
+DACE_EXPORTED void __program_attribute_test_doublefor_aot(attribute_test_doublefor_aot_state_t *__state, double * __restrict__ A, int N)
+{
+    __program_attribute_test_doublefor_aot_internal(__state, A, N);
+}
+
+struct __dace_batch_args_attribute_test_doublefor_aot {
+    double * __restrict__ A;
+    int N;
+};
+
+DACE_EXPORTED int __program_attribute_test_doublefor_aot_batch(attribute_test_doublefor_aot_state_t *__state, const __dace_batch_args_attribute_test_doublefor_aot *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_attribute_test_doublefor_aot_internal(__state, __args[__i].A, __args[__i].N);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED attribute_test_doublefor_aot_state_t *__dace_init_attribute_test_doublefor_aot(int N)
+{
+    int __result = 0;
+    attribute_test_doublefor_aot_state_t *__state = new attribute_test_doublefor_aot_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_attribute_test_doublefor_aot(attribute_test_doublefor_aot_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
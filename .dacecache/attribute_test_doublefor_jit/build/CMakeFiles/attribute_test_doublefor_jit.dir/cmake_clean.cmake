@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/attribute_test_doublefor_jit.dir/root/package/.dacecache/attribute_test_doublefor_jit/src/cpu/attribute_test_doublefor_jit.cpp.o"
+  "CMakeFiles/attribute_test_doublefor_jit.dir/root/package/.dacecache/attribute_test_doublefor_jit/src/cpu/attribute_test_doublefor_jit.cpp.o.d"
+  "libattribute_test_doublefor_jit.pdb"
+  "libattribute_test_doublefor_jit.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/attribute_test_doublefor_jit.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
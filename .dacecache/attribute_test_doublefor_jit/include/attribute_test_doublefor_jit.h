@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * attribute_test_doublefor_jitHandle_t;
+extern "C" attribute_test_doublefor_jitHandle_t __dace_init_attribute_test_doublefor_jit();
+extern "C" int __dace_exit_attribute_test_doublefor_jit(attribute_test_doublefor_jitHandle_t handle);
+extern "C" void __program_attribute_test_doublefor_jit(attribute_test_doublefor_jitHandle_t handle, double * __restrict__ A);
@@ -0,0 +1 @@
+#define __HASH_attribute_test_doublefor_jit "f156d6a3f87d68e177fd3ae9c0c2c5e972a8c8f08f44cbc1f0861bd2c33b59c0"
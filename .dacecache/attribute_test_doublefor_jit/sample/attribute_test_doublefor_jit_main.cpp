@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/attribute_test_doublefor_jit.h"
+
+int main(int argc, char **argv) {
+    attribute_test_doublefor_jitHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(400, sizeof(double));
+
+
+    handle = __dace_init_attribute_test_doublefor_jit();
+    __program_attribute_test_doublefor_jit(handle, A);
+    err = __dace_exit_attribute_test_doublefor_jit(handle);
+
+    free(A);
+
+
+    return err;
+}
@@ -0,0 +1,84 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct attribute_test_doublefor_jit_state_t {
+
+};
+
+void __program_attribute_test_doublefor_jit_internal(attribute_test_doublefor_jit_state_t*__state, double * __restrict__ A)
+{
+    long long i;
+    long long j;
+
+
+
+
+    for (i = 0; (i < 20); i = i + 1) {
+
+
+
+        for (j = 0; (j < 20); j = j + 1) {
+            {
+
+                {
+                    double __in1 = A[((20 * i) + j)];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_12_12)
+                    __out = (__in1 * 5);
+                    ///////////////////
+
+                    A[((20 * i) + j)] = __out;
+                }
+
+            }
+
+        }
+
+
+    }
+
+}
+
+DACE_EXPORTED void __program_attribute_test_doublefor_jit(attribute_test_doublefor_jit_state_t *__state, double * __restrict__ A)
+{
+    __program_attribute_test_doublefor_jit_internal(__state, A);
+}
+
+struct __dace_batch_args_attribute_test_doublefor_jit {
+    double * __restrict__ A;
+};
+
+DACE_EXPORTED int __program_attribute_test_doublefor_jit_batch(attribute_test_doublefor_jit_state_t *__state, const __dace_batch_args_attribute_test_doublefor_jit *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_attribute_test_doublefor_jit_internal(__state, __args[__i].A);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED attribute_test_doublefor_jit_state_t *__dace_init_attribute_test_doublefor_jit()
+{
+    int __result = 0;
+    attribute_test_doublefor_jit_state_t *__state = new attribute_test_doublefor_jit_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_attribute_test_doublefor_jit(attribute_test_doublefor_jit_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
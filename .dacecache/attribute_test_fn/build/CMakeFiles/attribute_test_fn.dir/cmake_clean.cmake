@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/attribute_test_fn.dir/root/package/.dacecache/attribute_test_fn/src/cpu/attribute_test_fn.cpp.o"
+  "CMakeFiles/attribute_test_fn.dir/root/package/.dacecache/attribute_test_fn/src/cpu/attribute_test_fn.cpp.o.d"
+  "libattribute_test_fn.pdb"
+  "libattribute_test_fn.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/attribute_test_fn.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
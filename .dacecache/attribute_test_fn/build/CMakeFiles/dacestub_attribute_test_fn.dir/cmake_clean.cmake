@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_attribute_test_fn.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_attribute_test_fn.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_attribute_test_fn.pdb"
+  "libdacestub_attribute_test_fn.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_attribute_test_fn.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
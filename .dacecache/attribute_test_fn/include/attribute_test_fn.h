@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * attribute_test_fnHandle_t;
+extern "C" attribute_test_fnHandle_t __dace_init_attribute_test_fn();
+extern "C" int __dace_exit_attribute_test_fn(attribute_test_fnHandle_t handle);
+extern "C" void __program_attribute_test_fn(attribute_test_fnHandle_t handle, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c);
@@ -0,0 +1 @@
+#define __HASH_attribute_test_fn "20869da7c8c96da12928021e93d22c2ba8170764c3e1eb19816030cd27d622ea"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/attribute_test_fn.h"
+
+int main(int argc, char **argv) {
+    attribute_test_fnHandle_t handle;
+    int err;
+    double * __restrict__ a = (double*) calloc(6, sizeof(double));
+    double * __restrict__ b = (double*) calloc(40, sizeof(double));
+    double * __restrict__ c = (double*) calloc(60, sizeof(double));
+
+
+    handle = __dace_init_attribute_test_fn();
+    __program_attribute_test_fn(handle, a, b, c);
+    err = __dace_exit_attribute_test_fn(handle);
+
+    free(a);
+    free(b);
+    free(c);
+
+
+    return err;
+}
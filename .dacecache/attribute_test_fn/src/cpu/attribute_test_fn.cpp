@@ -0,0 +1,175 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct attribute_test_fn_state_t {
+
+};
+
+inline void _Transpose__sdfg_0_0_6(attribute_test_fn_state_t *__state, double* __restrict__ _inp, double* __restrict__ _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __inp = _inp[((3 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (transpose)
+                        __out = __inp;
+                        ///////////////////
+
+                        _out[(__i0 + (2 * __i1))] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_8(attribute_test_fn_state_t *__state, double* __restrict__ _a, double* __restrict__ _b, double* __restrict__ _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 3; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 20; _o1 += 1) {
+                    {
+                        double out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((20 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 20; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 2; __i2 += 1) {
+                        {
+                            double __a = _a[((2 * __i0) + __i2)];
+                            double __b = _b[(__i1 + (20 * __i2))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(_c + ((20 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _Transpose__sdfg_0_0_7(attribute_test_fn_state_t *__state, double* __restrict__ _inp, double* __restrict__ _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 20; __i1 += 1) {
+                    {
+                        double __inp = _inp[((20 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (transpose)
+                        __out = __inp;
+                        ///////////////////
+
+                        _out[(__i0 + (3 * __i1))] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_attribute_test_fn_internal(attribute_test_fn_state_t*__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[6];
+        double* b_0;
+        b_0 = &b[0];
+        double *tmp;
+        tmp = new double DACE_ALIGN(64)[60];
+
+        _Transpose__sdfg_0_0_6(__state, &a[0], &__tmp0[0]);
+        _MatMult_gemm_sdfg_0_0_8(__state, &__tmp0[0], &b_0[0], &tmp[0]);
+        _Transpose__sdfg_0_0_7(__state, &tmp[0], &c[0]);
+        delete[] __tmp0;
+        delete[] tmp;
+
+    }
+}
+
+DACE_EXPORTED void __program_attribute_test_fn(attribute_test_fn_state_t *__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+    __program_attribute_test_fn_internal(__state, a, b, c);
+}
+
+struct __dace_batch_args_attribute_test_fn {
+    double * __restrict__ a;
+    double * __restrict__ b;
+    double * __restrict__ c;
+};
+
+DACE_EXPORTED int __program_attribute_test_fn_batch(attribute_test_fn_state_t *__state, const __dace_batch_args_attribute_test_fn *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_attribute_test_fn_internal(__state, __args[__i].a, __args[__i].b, __args[__i].c);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED attribute_test_fn_state_t *__dace_init_attribute_test_fn()
+{
+    int __result = 0;
+    attribute_test_fn_state_t *__state = new attribute_test_fn_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_attribute_test_fn(attribute_test_fn_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augadd.dir/root/package/.dacecache/augassign_test_test_augadd/src/cpu/augassign_test_test_augadd.cpp.o"
+  "CMakeFiles/augassign_test_test_augadd.dir/root/package/.dacecache/augassign_test_test_augadd/src/cpu/augassign_test_test_augadd.cpp.o.d"
+  "libaugassign_test_test_augadd.pdb"
+  "libaugassign_test_test_augadd.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augadd.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
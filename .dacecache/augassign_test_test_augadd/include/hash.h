@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augadd "ed5184a80e540452a98ac1f4a4422e59ca640b9329c4ddc2ed5778b7c9cd9239"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augbitand.dir/root/package/.dacecache/augassign_test_test_augbitand/src/cpu/augassign_test_test_augbitand.cpp.o"
+  "CMakeFiles/augassign_test_test_augbitand.dir/root/package/.dacecache/augassign_test_test_augbitand/src/cpu/augassign_test_test_augbitand.cpp.o.d"
+  "libaugassign_test_test_augbitand.pdb"
+  "libaugassign_test_test_augbitand.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augbitand.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_augassign_test_test_augbitand.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_augassign_test_test_augbitand.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_augassign_test_test_augbitand.pdb"
+  "libdacestub_augassign_test_test_augbitand.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_augassign_test_test_augbitand.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
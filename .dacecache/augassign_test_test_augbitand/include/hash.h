@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augbitand "204e6a5d00ca70729bde910bc8bbdb3f45ea89f3ae12d8023da87c4c987aa2fb"
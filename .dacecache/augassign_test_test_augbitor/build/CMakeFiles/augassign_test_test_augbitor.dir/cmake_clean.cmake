@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augbitor.dir/root/package/.dacecache/augassign_test_test_augbitor/src/cpu/augassign_test_test_augbitor.cpp.o"
+  "CMakeFiles/augassign_test_test_augbitor.dir/root/package/.dacecache/augassign_test_test_augbitor/src/cpu/augassign_test_test_augbitor.cpp.o.d"
+  "libaugassign_test_test_augbitor.pdb"
+  "libaugassign_test_test_augbitor.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augbitor.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augbitor "33c7977858114cd12684c2a115a75a378b0605b2c7e825bb2afb8cef02daa94d"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augbitxor.dir/root/package/.dacecache/augassign_test_test_augbitxor/src/cpu/augassign_test_test_augbitxor.cpp.o"
+  "CMakeFiles/augassign_test_test_augbitxor.dir/root/package/.dacecache/augassign_test_test_augbitxor/src/cpu/augassign_test_test_augbitxor.cpp.o.d"
+  "libaugassign_test_test_augbitxor.pdb"
+  "libaugassign_test_test_augbitxor.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augbitxor.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augbitxor "588e98c6a52c47cb3410c1768aa0580ef3b80356f0a3593b2d3eff84d4ad1d61"
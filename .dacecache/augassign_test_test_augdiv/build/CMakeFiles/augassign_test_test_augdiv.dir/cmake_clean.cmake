@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augdiv.dir/root/package/.dacecache/augassign_test_test_augdiv/src/cpu/augassign_test_test_augdiv.cpp.o"
+  "CMakeFiles/augassign_test_test_augdiv.dir/root/package/.dacecache/augassign_test_test_augdiv/src/cpu/augassign_test_test_augdiv.cpp.o.d"
+  "libaugassign_test_test_augdiv.pdb"
+  "libaugassign_test_test_augdiv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augdiv.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
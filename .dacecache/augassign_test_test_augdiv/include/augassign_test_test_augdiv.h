@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_test_test_augdivHandle_t;
+extern "C" augassign_test_test_augdivHandle_t __dace_init_augassign_test_test_augdiv();
+extern "C" int __dace_exit_augassign_test_test_augdiv(augassign_test_test_augdivHandle_t handle);
+extern "C" void __program_augassign_test_test_augdiv(augassign_test_test_augdivHandle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return);
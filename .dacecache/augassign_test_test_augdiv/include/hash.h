@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augdiv "ea1800b83b4745e320f59d0aa998dccb0a41f047a42622629dc6e4ee5174a3dc"
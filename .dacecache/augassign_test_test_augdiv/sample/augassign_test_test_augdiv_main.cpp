@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/augassign_test_test_augdiv.h"
+
+int main(int argc, char **argv) {
+    augassign_test_test_augdivHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(25, sizeof(double));
+    double * __restrict__ B = (double*) calloc(25, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(25, sizeof(double));
+
+
+    handle = __dace_init_augassign_test_test_augdiv();
+    __program_augassign_test_test_augdiv(handle, A, B, __return);
+    err = __dace_exit_augassign_test_test_augdiv(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,81 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_test_test_augdiv_state_t {
+
+};
+
+void __program_augassign_test_test_augdiv_internal(augassign_test_test_augdiv_state_t*__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        double __in1 = B[((5 * __i0) + __i1)];
+                        double __in2 = A[((5 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_27_4)
+                        __out = (__in1 / __in2);
+                        ///////////////////
+
+                        B[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+        dace::CopyND<double, 1, false, 25>::template ConstDst<1>::Copy(
+        B, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_test_test_augdiv(augassign_test_test_augdiv_state_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return)
+{
+    __program_augassign_test_test_augdiv_internal(__state, A, B, __return);
+}
+
+struct __dace_batch_args_augassign_test_test_augdiv {
+    double * __restrict__ A;
+    double * __restrict__ B;
+    double * __restrict__ __return;
+};
+
+DACE_EXPORTED int __program_augassign_test_test_augdiv_batch(augassign_test_test_augdiv_state_t *__state, const __dace_batch_args_augassign_test_test_augdiv *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_test_test_augdiv_internal(__state, __args[__i].A, __args[__i].B, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_test_test_augdiv_state_t *__dace_init_augassign_test_test_augdiv()
+{
+    int __result = 0;
+    augassign_test_test_augdiv_state_t *__state = new augassign_test_test_augdiv_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_test_test_augdiv(augassign_test_test_augdiv_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augfloordiv.dir/root/package/.dacecache/augassign_test_test_augfloordiv/src/cpu/augassign_test_test_augfloordiv.cpp.o"
+  "CMakeFiles/augassign_test_test_augfloordiv.dir/root/package/.dacecache/augassign_test_test_augfloordiv/src/cpu/augassign_test_test_augfloordiv.cpp.o.d"
+  "libaugassign_test_test_augfloordiv.pdb"
+  "libaugassign_test_test_augfloordiv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augfloordiv.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
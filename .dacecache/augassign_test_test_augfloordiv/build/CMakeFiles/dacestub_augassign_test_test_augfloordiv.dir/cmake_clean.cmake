@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_augassign_test_test_augfloordiv.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_augassign_test_test_augfloordiv.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_augassign_test_test_augfloordiv.pdb"
+  "libdacestub_augassign_test_test_augfloordiv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_augassign_test_test_augfloordiv.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
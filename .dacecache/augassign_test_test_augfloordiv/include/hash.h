@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augfloordiv "6c26abdcdc95a578d300043b5a249cad536a9ac3d2b1a071a1aa6754f1633be0"
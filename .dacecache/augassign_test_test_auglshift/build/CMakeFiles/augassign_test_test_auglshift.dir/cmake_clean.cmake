@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_auglshift.dir/root/package/.dacecache/augassign_test_test_auglshift/src/cpu/augassign_test_test_auglshift.cpp.o"
+  "CMakeFiles/augassign_test_test_auglshift.dir/root/package/.dacecache/augassign_test_test_auglshift/src/cpu/augassign_test_test_auglshift.cpp.o.d"
+  "libaugassign_test_test_auglshift.pdb"
+  "libaugassign_test_test_auglshift.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_auglshift.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
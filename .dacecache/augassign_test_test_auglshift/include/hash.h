@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_auglshift "1b33df875d6506c01d143911cb7b4f53ef1ad80f6609fa45a5586c9d3321dc17"
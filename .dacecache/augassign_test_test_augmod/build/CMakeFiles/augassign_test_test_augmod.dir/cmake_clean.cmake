@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augmod.dir/root/package/.dacecache/augassign_test_test_augmod/src/cpu/augassign_test_test_augmod.cpp.o"
+  "CMakeFiles/augassign_test_test_augmod.dir/root/package/.dacecache/augassign_test_test_augmod/src/cpu/augassign_test_test_augmod.cpp.o.d"
+  "libaugassign_test_test_augmod.pdb"
+  "libaugassign_test_test_augmod.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augmod.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
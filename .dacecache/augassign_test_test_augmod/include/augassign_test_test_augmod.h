@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_test_test_augmodHandle_t;
+extern "C" augassign_test_test_augmodHandle_t __dace_init_augassign_test_test_augmod();
+extern "C" int __dace_exit_augassign_test_test_augmod(augassign_test_test_augmodHandle_t handle);
+extern "C" void __program_augassign_test_test_augmod(augassign_test_test_augmodHandle_t handle, long long * __restrict__ A, long long * __restrict__ B, long long * __restrict__ __return);
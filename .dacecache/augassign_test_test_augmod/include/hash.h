@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augmod "1d356d60e2677f27fc1325d3b34f746870c9d5b275d824d621e2070b0155032a"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augmult.dir/root/package/.dacecache/augassign_test_test_augmult/src/cpu/augassign_test_test_augmult.cpp.o"
+  "CMakeFiles/augassign_test_test_augmult.dir/root/package/.dacecache/augassign_test_test_augmult/src/cpu/augassign_test_test_augmult.cpp.o.d"
+  "libaugassign_test_test_augmult.pdb"
+  "libaugassign_test_test_augmult.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augmult.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augmult "1e6568d5b897bf371c31a2ec49984d1e8f2cdbc038a6173d06e9827cdb6212b2"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augpow.dir/root/package/.dacecache/augassign_test_test_augpow/src/cpu/augassign_test_test_augpow.cpp.o"
+  "CMakeFiles/augassign_test_test_augpow.dir/root/package/.dacecache/augassign_test_test_augpow/src/cpu/augassign_test_test_augpow.cpp.o.d"
+  "libaugassign_test_test_augpow.pdb"
+  "libaugassign_test_test_augpow.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augpow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
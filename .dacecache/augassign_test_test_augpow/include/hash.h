@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augpow "05ac7a60308991eb86e781cc3a61676c426a58ff43568bffe8346875bcf3ff09"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augrshift.dir/root/package/.dacecache/augassign_test_test_augrshift/src/cpu/augassign_test_test_augrshift.cpp.o"
+  "CMakeFiles/augassign_test_test_augrshift.dir/root/package/.dacecache/augassign_test_test_augrshift/src/cpu/augassign_test_test_augrshift.cpp.o.d"
+  "libaugassign_test_test_augrshift.pdb"
+  "libaugassign_test_test_augrshift.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augrshift.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
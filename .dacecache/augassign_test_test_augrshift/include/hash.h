@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augrshift "ae23f45910bc626b761209d8631cd9915892623610c5308b4b4bb1af0757f039"
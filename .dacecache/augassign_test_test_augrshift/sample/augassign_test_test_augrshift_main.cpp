@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/augassign_test_test_augrshift.h"
+
+int main(int argc, char **argv) {
+    augassign_test_test_augrshiftHandle_t handle;
+    int err;
+    long long * __restrict__ A = (long long*) calloc(25, sizeof(long long));
+    long long * __restrict__ B = (long long*) calloc(25, sizeof(long long));
+    long long * __restrict__ __return = (long long*) calloc(25, sizeof(long long));
+
+
+    handle = __dace_init_augassign_test_test_augrshift();
+    __program_augassign_test_test_augrshift(handle, A, B, __return);
+    err = __dace_exit_augassign_test_test_augrshift(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
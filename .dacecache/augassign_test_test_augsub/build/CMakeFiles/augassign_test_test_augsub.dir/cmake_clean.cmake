@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_test_test_augsub.dir/root/package/.dacecache/augassign_test_test_augsub/src/cpu/augassign_test_test_augsub.cpp.o"
+  "CMakeFiles/augassign_test_test_augsub.dir/root/package/.dacecache/augassign_test_test_augsub/src/cpu/augassign_test_test_augsub.cpp.o.d"
+  "libaugassign_test_test_augsub.pdb"
+  "libaugassign_test_test_augsub.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_test_test_augsub.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_augassign_test_test_augsub "b0b29659e18927dd08f101782292461e1060b0ee87ee4ee5caecedf13e2614c2"
@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr "56963b9132f49db3eba34fa4bd028ddbd230db35376d61ca4ed81b58ff863bdd"
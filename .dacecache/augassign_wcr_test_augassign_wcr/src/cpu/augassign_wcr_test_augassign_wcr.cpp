@@ -0,0 +1,98 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_augassign_wcr_state_t {
+
+};
+
+void augassign_wcr_test_augassign_wcr_9_4_0_2_2(augassign_wcr_test_augassign_wcr_state_t *__state, const bool&  __tmp_11_11_r, int* __restrict__ __tmp_15_28_r, int&  __tmp_10_8_w, long long&  __tmp_12_12_w);
+void __program_augassign_wcr_test_augassign_wcr_internal(augassign_wcr_test_augassign_wcr_state_t*__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    long long count;
+
+
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_8_4)
+            __out = 0;
+            ///////////////////
+
+            count = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 10; i += 1) {
+                augassign_wcr_test_augassign_wcr_9_4_0_2_2(__state, W[i], &A[(100 * i)], B[i], count);
+            }
+        }
+
+    }
+    {
+
+        {
+            long long __inp = count;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_17_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr(augassign_wcr_test_augassign_wcr_state_t *__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    __program_augassign_wcr_test_augassign_wcr_internal(__state, A, B, W, __return);
+}
+
+struct __dace_batch_args_augassign_wcr_test_augassign_wcr {
+    int *A;
+    int *B;
+    bool *W;
+    long long *__return;
+};
+
+DACE_EXPORTED int __program_augassign_wcr_test_augassign_wcr_batch(augassign_wcr_test_augassign_wcr_state_t *__state, const __dace_batch_args_augassign_wcr_test_augassign_wcr *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_wcr_test_augassign_wcr_internal(__state, __args[__i].A, __args[__i].B, __args[__i].W, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_wcr_test_augassign_wcr_state_t *__dace_init_augassign_wcr_test_augassign_wcr()
+{
+    int __result = 0;
+    augassign_wcr_test_augassign_wcr_state_t *__state = new augassign_wcr_test_augassign_wcr_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_augassign_wcr(augassign_wcr_test_augassign_wcr_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
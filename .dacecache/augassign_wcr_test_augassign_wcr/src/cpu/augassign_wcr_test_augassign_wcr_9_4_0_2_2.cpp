@@ -0,0 +1,105 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct augassign_wcr_test_augassign_wcr_state_t;
+void augassign_wcr_test_augassign_wcr_9_4_0_2_2(augassign_wcr_test_augassign_wcr_state_t *__state, const bool&  __tmp_11_11_r, int* __restrict__ __tmp_15_28_r, int&  __tmp_10_8_w, long long&  __tmp_12_12_w) {
+    bool __tmp2;
+    int __tmp3[1]  DACE_ALIGN(64);
+    long long j;
+    long long k;
+
+
+    {
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_10_8)
+            __out = 0;
+            ///////////////////
+
+            __tmp_10_8_w = __out;
+        }
+
+    }
+
+    {
+
+        {
+            bool __in1 = __tmp_11_11_r;
+            bool __out;
+
+            ///////////////////
+            // Tasklet code (_IsNot_)
+            __out = (__in1 != false);
+            ///////////////////
+
+            __tmp2 = __out;
+        }
+
+    }
+    if (__tmp2) {
+
+        {
+
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_12_12)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(&__tmp_12_12_w, __out);
+            }
+
+        }
+
+
+        for (j = 0; (j < 10); j = j + 1) {
+
+
+
+            for (k = 0; (k < 10); k = k + 1) {
+
+                {
+
+
+                    dace::CopyND<int, 1, false, 1>::template ConstDst<1>::Copy(
+                    __tmp_15_28_r + ((10 * j) + k), __tmp3, 1);
+
+                }
+                {
+
+                    {
+                        int __in2 = __tmp3[0];
+                        int __in1 = __tmp_10_8_w;
+                        int __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_15_20)
+                        __out = (__in1 + __in2);
+                        ///////////////////
+
+                        __tmp_10_8_w = __out;
+                    }
+
+                }
+
+            }
+
+
+        }
+
+        if (true) {
+            goto __state_1_endif_11;
+        }
+        goto __state_exit_1;
+
+    }
+    __state_1_endif_11:;
+
+    __state_exit_1:;
+    
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_wcr_test_augassign_wcr2Handle_t;
+extern "C" augassign_wcr_test_augassign_wcr2Handle_t __dace_init_augassign_wcr_test_augassign_wcr2();
+extern "C" int __dace_exit_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2Handle_t handle);
+extern "C" void __program_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2Handle_t handle, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return);
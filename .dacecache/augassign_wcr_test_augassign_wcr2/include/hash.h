@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr2 "7d77986988b1ead9ff67d825eac1ae86782816770b9840c4cb6a7aa5f3e76e30"
@@ -0,0 +1,121 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_augassign_wcr2_state_t {
+
+};
+
+void augassign_wcr_test_augassign_wcr2_24_4_0_3_2(augassign_wcr_test_augassign_wcr2_state_t *__state, const bool&  __tmp_25_11_r, const int&  __tmp_27_20_r, long long&  __tmp_26_12_w, int&  __tmp_27_12_w);
+void __program_augassign_wcr_test_augassign_wcr2_internal(augassign_wcr_test_augassign_wcr2_state_t*__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    long long count;
+
+
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_22_4)
+            __out = 0;
+            ///////////////////
+
+            count = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_23_4)
+                    __out = 0;
+                    ///////////////////
+
+                    B[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 10; i += 1) {
+                for (auto j = 0; j < 10; j += 1) {
+                    for (auto k = 0; k < 10; k += 1) {
+                        augassign_wcr_test_augassign_wcr2_24_4_0_3_2(__state, W[(((100 * i) + (10 * j)) + k)], A[(((100 * i) + (10 * j)) + k)], count, B[i]);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            long long __inp = count;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_29_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2_state_t *__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    __program_augassign_wcr_test_augassign_wcr2_internal(__state, A, B, W, __return);
+}
+
+struct __dace_batch_args_augassign_wcr_test_augassign_wcr2 {
+    int *A;
+    int *B;
+    bool *W;
+    long long *__return;
+};
+
+DACE_EXPORTED int __program_augassign_wcr_test_augassign_wcr2_batch(augassign_wcr_test_augassign_wcr2_state_t *__state, const __dace_batch_args_augassign_wcr_test_augassign_wcr2 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_wcr_test_augassign_wcr2_internal(__state, __args[__i].A, __args[__i].B, __args[__i].W, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_wcr_test_augassign_wcr2_state_t *__dace_init_augassign_wcr_test_augassign_wcr2()
+{
+    int __result = 0;
+    augassign_wcr_test_augassign_wcr2_state_t *__state = new augassign_wcr_test_augassign_wcr2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
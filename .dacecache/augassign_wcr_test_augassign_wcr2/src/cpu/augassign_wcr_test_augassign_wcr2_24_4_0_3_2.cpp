@@ -0,0 +1,50 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct augassign_wcr_test_augassign_wcr2_state_t;
+void augassign_wcr_test_augassign_wcr2_24_4_0_3_2(augassign_wcr_test_augassign_wcr2_state_t *__state, const bool&  __tmp_25_11_r, const int&  __tmp_27_20_r, long long&  __tmp_26_12_w, int&  __tmp_27_12_w) {
+
+
+
+    if (__tmp_25_11_r) {
+
+        {
+
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_26_12)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(&__tmp_26_12_w, __out);
+            }
+
+        }
+        {
+
+            {
+                int __inp = __tmp_27_20_r;
+                int __out;
+
+                ///////////////////
+                // Tasklet code (assign_27_12)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce_atomic(&__tmp_27_12_w, __out);
+            }
+
+        }
+        if (true) {
+            goto __state_1_endif_25;
+        }
+        goto __state_exit_1;
+
+    }
+    __state_1_endif_25:;
+
+    __state_exit_1:;
+    
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_augassign_wcr_test_augassign_wcr3.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_augassign_wcr_test_augassign_wcr3.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_augassign_wcr_test_augassign_wcr3.pdb"
+  "libdacestub_augassign_wcr_test_augassign_wcr3.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_augassign_wcr_test_augassign_wcr3.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
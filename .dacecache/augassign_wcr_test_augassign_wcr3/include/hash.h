@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr3 "6fb3e461554ea16103f6c16a42cfb8d58d07f5dcb88592696a2072f38d9c81c0"
@@ -0,0 +1,26 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_augassign_wcr3.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_augassign_wcr3Handle_t handle;
+    int err;
+    int * __restrict__ A = (int*) calloc(1000, sizeof(int));
+    int * __restrict__ B = (int*) calloc(10, sizeof(int));
+    bool * __restrict__ W = (bool*) calloc(1000, sizeof(bool));
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+    int * __restrict__ ind = (int*) calloc(10, sizeof(int));
+
+
+    handle = __dace_init_augassign_wcr_test_augassign_wcr3();
+    __program_augassign_wcr_test_augassign_wcr3(handle, A, B, W, __return, ind);
+    err = __dace_exit_augassign_wcr_test_augassign_wcr3(handle);
+
+    free(A);
+    free(B);
+    free(W);
+    free(__return);
+    free(ind);
+
+
+    return err;
+}
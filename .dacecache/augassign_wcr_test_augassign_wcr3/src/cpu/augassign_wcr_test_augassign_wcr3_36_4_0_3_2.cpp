@@ -0,0 +1,53 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct augassign_wcr_test_augassign_wcr3_state_t;
+void augassign_wcr_test_augassign_wcr3_36_4_0_3_2(augassign_wcr_test_augassign_wcr3_state_t *__state, const bool&  __tmp_37_11_r, const int&  __tmp_39_14_r, const int&  __tmp_39_25_r, long long&  __tmp_38_12_w, int* __restrict__ __tmp_39_12_w) {
+    int __sym___tmp_39_14_r;
+
+
+
+    if (__tmp_37_11_r) {
+
+        {
+
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_38_12)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(&__tmp_38_12_w, __out);
+            }
+
+        }
+        __sym___tmp_39_14_r = __tmp_39_14_r;
+
+        {
+
+            {
+                int __inp = __tmp_39_25_r;
+                int __out;
+
+                ///////////////////
+                // Tasklet code (assign_39_12)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce_atomic(__tmp_39_12_w + __sym___tmp_39_14_r, __out);
+            }
+
+        }
+        if (true) {
+            goto __state_1_endif_37;
+        }
+        goto __state_exit_1;
+
+    }
+    __state_1_endif_37:;
+
+    __state_exit_1:;
+    
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_wcr_test_augassign_wcr4Handle_t;
+extern "C" augassign_wcr_test_augassign_wcr4Handle_t __dace_init_augassign_wcr_test_augassign_wcr4();
+extern "C" int __dace_exit_augassign_wcr_test_augassign_wcr4(augassign_wcr_test_augassign_wcr4Handle_t handle);
+extern "C" void __program_augassign_wcr_test_augassign_wcr4(augassign_wcr_test_augassign_wcr4Handle_t handle, double * __restrict__ __return);
@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr4 "de671ab32af68d822a6add2ea7dcd22c9feac4af3d7dc9f225ea462407e612d4"
@@ -0,0 +1,111 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_augassign_wcr4_state_t {
+
+};
+
+void __program_augassign_wcr_test_augassign_wcr4_internal(augassign_wcr_test_augassign_wcr4_state_t*__state, double * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_full_)
+                    __out = 0.0;
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 1; i < 9; i += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_48_8)
+                    __out = 1;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce(__return + (i - 1), __out);
+                }
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_49_8)
+                    __out = 2;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce(__return + i, __out);
+                }
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_50_8)
+                    __out = 3;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce(__return + (i + 1), __out);
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr4(augassign_wcr_test_augassign_wcr4_state_t *__state, double * __restrict__ __return)
+{
+    __program_augassign_wcr_test_augassign_wcr4_internal(__state, __return);
+}
+
+struct __dace_batch_args_augassign_wcr_test_augassign_wcr4 {
+    double *__return;
+};
+
+DACE_EXPORTED int __program_augassign_wcr_test_augassign_wcr4_batch(augassign_wcr_test_augassign_wcr4_state_t *__state, const __dace_batch_args_augassign_wcr_test_augassign_wcr4 *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_wcr_test_augassign_wcr4_internal(__state, __args[__i].__return);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_wcr_test_augassign_wcr4_state_t *__dace_init_augassign_wcr_test_augassign_wcr4()
+{
+    int __result = 0;
+    augassign_wcr_test_augassign_wcr4_state_t *__state = new augassign_wcr_test_augassign_wcr4_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_augassign_wcr4(augassign_wcr_test_augassign_wcr4_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
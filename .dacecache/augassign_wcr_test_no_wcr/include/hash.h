@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_no_wcr "aece347801ea42f8bb522324e22651911428229437659651852a7e75db5b9be8"
@@ -0,0 +1,78 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_no_wcr_state_t {
+
+};
+
+void __program_augassign_wcr_test_no_wcr_internal(augassign_wcr_test_no_wcr_state_t*__state, int * __restrict__ A)
+{
+
+
+
+    {
+        int* A_0;
+        A_0 = &A[59];
+
+        {
+            #pragma omp parallel for
+            for (auto __i2 = 0; __i2 < 3; __i2 += 1) {
+                {
+                    int __in1 = A[(__i2 + 66)];
+                    int __in2 = A_0[(25 * __i2)];
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_143_4)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    A[(__i2 + 66)] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcr_state_t *__state, int * __restrict__ A)
+{
+    __program_augassign_wcr_test_no_wcr_internal(__state, A);
+}
+
+struct __dace_batch_args_augassign_wcr_test_no_wcr {
+    int *A;
+};
+
+DACE_EXPORTED int __program_augassign_wcr_test_no_wcr_batch(augassign_wcr_test_no_wcr_state_t *__state, const __dace_batch_args_augassign_wcr_test_no_wcr *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_wcr_test_no_wcr_internal(__state, __args[__i].A);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_wcr_test_no_wcr_state_t *__dace_init_augassign_wcr_test_no_wcr()
+{
+    int __result = 0;
+    augassign_wcr_test_no_wcr_state_t *__state = new augassign_wcr_test_no_wcr_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcr_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
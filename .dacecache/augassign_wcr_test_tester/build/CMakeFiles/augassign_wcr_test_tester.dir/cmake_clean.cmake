@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_wcr_test_tester.dir/root/package/.dacecache/augassign_wcr_test_tester/src/cpu/augassign_wcr_test_tester.cpp.o"
+  "CMakeFiles/augassign_wcr_test_tester.dir/root/package/.dacecache/augassign_wcr_test_tester/src/cpu/augassign_wcr_test_tester.cpp.o.d"
+  "CMakeFiles/augassign_wcr_test_tester.dir/root/package/.dacecache/augassign_wcr_test_tester/src/cpu/augassign_wcr_test_tester_170_4_0_0_2.cpp.o"
+  "CMakeFiles/augassign_wcr_test_tester.dir/root/package/.dacecache/augassign_wcr_test_tester/src/cpu/augassign_wcr_test_tester_170_4_0_0_2.cpp.o.d"
+  "libaugassign_wcr_test_tester.pdb"
+  "libaugassign_wcr_test_tester.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_wcr_test_tester.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
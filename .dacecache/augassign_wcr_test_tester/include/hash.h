@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_tester "8537c193df1144334c37babb403cfa6ead49993e66341a95a0622f11e73f5200"
@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_tester_state_t {
+
+};
+
+void augassign_wcr_test_tester_170_4_0_0_2(augassign_wcr_test_tester_state_t *__state, const double&  __tmp_173_19_r, const double&  __tmp_173_29_r, const double&  __tmp_175_19_r, const double&  __tmp_175_29_r, double&  __tmp_176_8_w, long long i);
+void __program_augassign_wcr_test_tester_internal(augassign_wcr_test_tester_state_t*__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 20; i += 1) {
+                augassign_wcr_test_tester_170_4_0_0_2(__state, b[(2 * i)], c[(2 * i)], b[((2 * i) + 1)], c[((2 * i) + 1)], a[i], i);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_tester(augassign_wcr_test_tester_state_t *__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+    __program_augassign_wcr_test_tester_internal(__state, a, b, c);
+}
+
+struct __dace_batch_args_augassign_wcr_test_tester {
+    double *a;
+    double *b;
+    double *c;
+};
+
+DACE_EXPORTED int __program_augassign_wcr_test_tester_batch(augassign_wcr_test_tester_state_t *__state, const __dace_batch_args_augassign_wcr_test_tester *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_augassign_wcr_test_tester_internal(__state, __args[__i].a, __args[__i].b, __args[__i].c);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED augassign_wcr_test_tester_state_t *__dace_init_augassign_wcr_test_tester()
+{
+    int __result = 0;
+    augassign_wcr_test_tester_state_t *__state = new augassign_wcr_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_tester(augassign_wcr_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
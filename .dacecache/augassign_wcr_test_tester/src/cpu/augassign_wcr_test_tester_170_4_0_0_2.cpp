@@ -0,0 +1,101 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+struct augassign_wcr_test_tester_state_t;
+void augassign_wcr_test_tester_170_4_0_0_2(augassign_wcr_test_tester_state_t *__state, const double&  __tmp_173_19_r, const double&  __tmp_173_29_r, const double&  __tmp_175_19_r, const double&  __tmp_175_29_r, double&  __tmp_176_8_w, long long i) {
+    double tmp;
+
+    {
+
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_171_8)
+            __out = 0;
+            ///////////////////
+
+            tmp = __out;
+        }
+
+    }
+    if (((i % 2) == 0)) {
+        {
+            double __tmp2;
+
+            {
+                double __in1 = __tmp_173_19_r;
+                double __in2 = __tmp_173_29_r;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp2 = __out;
+            }
+            {
+                double __in1 = tmp;
+                double __in2 = __tmp2;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (augassign_173_12)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                tmp = __out;
+            }
+
+        }
+
+    } else {
+        {
+            double __tmp3;
+
+            {
+                double __in1 = __tmp_175_19_r;
+                double __in2 = __tmp_175_29_r;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp3 = __out;
+            }
+            {
+                double __in1 = tmp;
+                double __in2 = __tmp3;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (augassign_175_12)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                tmp = __out;
+            }
+
+        }
+
+    }
+    {
+
+        {
+            double __inp = tmp;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_176_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_176_8_w = __out;
+        }
+
+    }
+    
+}
+
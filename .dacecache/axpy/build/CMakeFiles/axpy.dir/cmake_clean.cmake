@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/axpy.dir/root/package/.dacecache/axpy/src/cpu/axpy.cpp.o"
+  "CMakeFiles/axpy.dir/root/package/.dacecache/axpy/src/cpu/axpy.cpp.o.d"
+  "libaxpy.pdb"
+  "libaxpy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/axpy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
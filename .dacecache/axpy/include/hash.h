@@ -0,0 +1 @@
+#define __HASH_axpy "79acb42b3af1290153c8c646ca3bd05d45599cddd2ea28e10e8ee0920d5fb328"
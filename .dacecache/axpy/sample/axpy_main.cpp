@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/axpy.h"
+
+int main(int argc, char **argv) {
+    axpyHandle_t handle;
+    int err;
+    int N = 42;
+    double a = 42;
+    double * __restrict__ x = (double*) calloc(N, sizeof(double));
+    double * __restrict__ y = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_axpy(N);
+    __program_axpy(handle, x, y, N, a);
+    err = __dace_exit_axpy(handle);
+
+    free(x);
+    free(y);
+
+
+    return err;
+}
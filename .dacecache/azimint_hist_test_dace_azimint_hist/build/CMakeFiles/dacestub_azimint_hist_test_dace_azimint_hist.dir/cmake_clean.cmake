@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_azimint_hist_test_dace_azimint_hist.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_azimint_hist_test_dace_azimint_hist.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_azimint_hist_test_dace_azimint_hist.pdb"
+  "libdacestub_azimint_hist_test_dace_azimint_hist.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_azimint_hist_test_dace_azimint_hist.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_azimint_hist_test_dace_azimint_hist "8678432e81c894ce08377d6f04051a6a7a5c18f35d151a620aaf6d7af9b6bcc2"
@@ -0,0 +1 @@
+#define __HASH_azimint_naive_test_dace_azimint_naive "3b6336a10a2e6f54056c882bc9faae4105c5af0d108aeac6164451e2274c0803"
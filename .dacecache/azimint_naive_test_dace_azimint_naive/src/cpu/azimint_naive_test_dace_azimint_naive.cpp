@@ -0,0 +1,323 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct azimint_naive_test_dace_azimint_naive_state_t {
+    double __0_rmax;
+};
+
+inline void reduce_0_0_6(azimint_naive_test_dace_azimint_naive_state_t *__state, double* __restrict__ _in, double* __restrict__ _out, long long N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = -1.7976931348623157e+308;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < N; _i0 += 1) {
+                {
+                    double __inp = _in[_i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Max, double>::reduce_atomic(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void azimint_naive_test_dace_azimint_naive_31_8_2_1_2(azimint_naive_test_dace_azimint_naive_state_t *__state, const bool&  __tmp_32_15_r, const double&  __tmp_33_23_r, double&  __tmp_33_16_w, long long&  __tmp_34_16_w) {
+
+
+    if (__tmp_32_15_r) {
+        {
+
+            {
+                double __inp = __tmp_33_23_r;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (assign_33_16)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce(&__tmp_33_16_w, __out);
+            }
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_34_16)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce(&__tmp_34_16_w, __out);
+            }
+
+        }
+
+    }
+
+    
+}
+
+inline void loop_body_0_1_0(azimint_naive_test_dace_azimint_naive_state_t *__state, double* __restrict__ data, double* __restrict__ radius, const double&  rmax, double* __restrict__ __return, long long N, long long i, long long npt) {
+    double tmp;
+    bool *mask_r12;
+    mask_r12 = new bool DACE_ALIGN(64)[N];
+    long long on_values;
+
+    {
+        double __tmp4;
+        double r2;
+        double __tmp2;
+        double r1;
+
+        {
+            double __in1 = rmax;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * dace::float64(i));
+            ///////////////////
+
+            __tmp2 = __out;
+        }
+        {
+            double __in1 = __tmp2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / dace::float64(npt));
+            ///////////////////
+
+            r1 = __out;
+        }
+        {
+            double __in1 = rmax;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * dace::float64((i + 1)));
+            ///////////////////
+
+            __tmp4 = __out;
+        }
+        {
+            double __in1 = __tmp4;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / dace::float64(npt));
+            ///////////////////
+
+            r2 = __out;
+        }
+        {
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                bool __s0_n13__out_n14IN___tmp7;
+                {
+                    double __in1 = radius[__i0];
+                    double __in2 = r2;
+                    bool __out;
+
+                    ///////////////////
+                    // Tasklet code (_Lt_)
+                    __out = (__in1 < __in2);
+                    ///////////////////
+
+                    __s0_n13__out_n14IN___tmp7 = __out;
+                }
+                bool __s0_n10__out_n11IN___tmp6;
+                {
+                    double __in2 = radius[__i0];
+                    double __in1 = r1;
+                    bool __out;
+
+                    ///////////////////
+                    // Tasklet code (_LtE_)
+                    __out = (__in1 <= __in2);
+                    ///////////////////
+
+                    __s0_n10__out_n11IN___tmp6 = __out;
+                }
+                {
+                    const bool __in1 = __s0_n10__out_n11IN___tmp6;
+                    const bool __in2 = __s0_n13__out_n14IN___tmp7;
+                    bool __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_logical_and_)
+                    __out = (__in1 && __in2);
+                    ///////////////////
+
+                    mask_r12[__i0] = __out;
+                }
+            }
+        }
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_29_8)
+            __out = 0;
+            ///////////////////
+
+            on_values = __out;
+        }
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_float64_)
+            __out = dace::float64(0);
+            ///////////////////
+
+            tmp = __out;
+        }
+
+    }
+    {
+        double __tmp11;
+
+        {
+            for (auto j = 0; j < N; j += 1) {
+                azimint_naive_test_dace_azimint_naive_31_8_2_1_2(__state, mask_r12[j], data[j], tmp, on_values);
+            }
+        }
+        {
+            double __in1 = tmp;
+            long long __in2 = on_values;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / dace::float64(__in2));
+            ///////////////////
+
+            __tmp11 = __out;
+        }
+        {
+            double __inp = __tmp11;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_35_8)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+    delete[] mask_r12;
+    
+}
+
+void __program_azimint_naive_test_dace_azimint_naive_internal(azimint_naive_test_dace_azimint_naive_state_t*__state, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt)
+{
+
+    {
+
+        reduce_0_0_6(__state, &radius[0], &__state->__0_rmax, N);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < npt; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_full_)
+                    __out = 0.0;
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < npt; i += 1) {
+                loop_body_0_1_0(__state, &data[0], &radius[0], __state->__0_rmax, &__return[i], N, i, npt);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_azimint_naive_test_dace_azimint_naive(azimint_naive_test_dace_azimint_naive_state_t *__state, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt)
+{
+    __program_azimint_naive_test_dace_azimint_naive_internal(__state, __return, data, radius, N, npt);
+}
+
+struct __dace_batch_args_azimint_naive_test_dace_azimint_naive {
+    double * __return;
+    double * data;
+    double * radius;
+    long long N;
+    long long npt;
+};
+
+DACE_EXPORTED int __program_azimint_naive_test_dace_azimint_naive_batch(azimint_naive_test_dace_azimint_naive_state_t *__state, const __dace_batch_args_azimint_naive_test_dace_azimint_naive *__args, long long __count, int __parallel)
+{
+
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_azimint_naive_test_dace_azimint_naive_internal(__state, __args[__i].__return, __args[__i].data, __args[__i].radius, __args[__i].N, __args[__i].npt);
+    }
+    return 0;
+}
+
+DACE_EXPORTED azimint_naive_test_dace_azimint_naive_state_t *__dace_init_azimint_naive_test_dace_azimint_naive(long long N, long long npt)
+{
+    int __result = 0;
+    azimint_naive_test_dace_azimint_naive_state_t *__state = new azimint_naive_test_dace_azimint_naive_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_azimint_naive_test_dace_azimint_naive(azimint_naive_test_dace_azimint_naive_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/baseline.dir/root/package/.dacecache/baseline/src/cpu/baseline.cpp.o"
+  "CMakeFiles/baseline.dir/root/package/.dacecache/baseline/src/cpu/baseline.cpp.o.d"
+  "libbaseline.pdb"
+  "libbaseline.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/baseline.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
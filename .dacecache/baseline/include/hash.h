@@ -0,0 +1 @@
+#define __HASH_baseline "1eb1b58a8c03b81d501f0933aa72d340661b6c81e98e19ece1db0d3999aa92f1"
@@ -0,0 +1,137 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct baseline_state_t {
+
+};
+
+void __program_baseline_internal(baseline_state_t*__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+
+    {
+        double *tmp1;
+        tmp1 = new double DACE_ALIGN(64)[N];
+        double *tmp2;
+        tmp2 = new double DACE_ALIGN(64)[N];
+        double *tmp3;
+        tmp3 = new double DACE_ALIGN(64)[N];
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < (N - 1); i += 1) {
+                {
+                    double in1 = A[(i + 1)];
+                    double in2 = A[i];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m1)
+                    out1 = ((in1 - in2) / float(2.0));
+                    ///////////////////
+
+                    tmp1[(i + 1)] = out1;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 1; i < N; i += 1) {
+                {
+                    double in1 = A[(i - 1)];
+                    double in2 = A[i];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m2)
+                    out1 = ((in2 - in1) / float(2.0));
+                    ///////////////////
+
+                    tmp2[(i - 1)] = out1;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 2; i < N; i += 1) {
+                {
+                    double in1_1 = tmp1[(i - 1)];
+                    double in1_2 = tmp1[i];
+                    double in2_1 = tmp2[(i - 1)];
+                    double in2_0 = tmp2[(i - 2)];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m3)
+                    out1 = (((in1_1 - (float(0.2) * in1_2)) + in2_1) + (float(0.8) * in2_0));
+                    ///////////////////
+
+                    tmp3[(i - 1)] = out1;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < (N - 4); i += 1) {
+                {
+                    double* in1 = &tmp3[(i + 1)];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m4)
+                    out1 = (in1[1] - (0.5 * (in1[0] + in1[2])));
+                    ///////////////////
+
+                    B[(i + 2)] = out1;
+                }
+            }
+        }
+        delete[] tmp1;
+        delete[] tmp2;
+        delete[] tmp3;
+
+    }
+}
+
+DACE_EXPORTED void __program_baseline(baseline_state_t *__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+    __program_baseline_internal(__state, A, B, N);
+}
+
+struct __dace_batch_args_baseline {
+    double * A;
+    double * B;
+    int N;
+};
+
+DACE_EXPORTED int __program_baseline_batch(baseline_state_t *__state, const __dace_batch_args_baseline *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_baseline_internal(__state, __args[__i].A, __args[__i].B, __args[__i].N);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED baseline_state_t *__dace_init_baseline(int N)
+{
+    int __result = 0;
+    baseline_state_t *__state = new baseline_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_baseline(baseline_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_baseline_1_False_False.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_baseline_1_False_False.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_baseline_1_False_False.pdb"
+  "libdacestub_baseline_1_False_False.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_baseline_1_False_False.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
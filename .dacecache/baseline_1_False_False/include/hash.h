@@ -0,0 +1 @@
+#define __HASH_baseline_1_False_False "305e1e03113a3f86e84545b49edfd30f153a85daea9acafc5f43c5b505e249a8"
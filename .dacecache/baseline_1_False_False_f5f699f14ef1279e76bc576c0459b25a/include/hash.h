@@ -0,0 +1 @@
+#define __HASH_baseline_1_False_False "14f24fa7bcd96689eb2d6ffc820c8e57e77a073d92f7b4d11f0853b764a848ec"
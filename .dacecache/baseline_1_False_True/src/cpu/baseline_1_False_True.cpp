@@ -0,0 +1,97 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct baseline_1_False_True_state_t {
+
+};
+
+void __program_baseline_1_False_True_internal(baseline_1_False_True_state_t*__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+
+    {
+        double *tmp1;
+        tmp1 = new double DACE_ALIGN(64)[N];
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    double in1 = A[(2 * i)];
+                    double in2 = A[((2 * i) + 1)];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m1)
+                    out1 = ((in1 + in2) / float(2.0));
+                    ///////////////////
+
+                    tmp1[i] = out1;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 1; i < (N - 1); i += 1) {
+                {
+                    double in1 = tmp1[i];
+                    double in2 = tmp1[(i + 1)];
+                    double in3 = tmp1[(i - 1)];
+                    double out1;
+
+                    ///////////////////
+                    // Tasklet code (m2)
+                    out1 = ((in2 - (0.2 * in1)) - (0.2 * in3));
+                    ///////////////////
+
+                    B[i] = out1;
+                }
+            }
+        }
+        delete[] tmp1;
+
+    }
+}
+
+DACE_EXPORTED void __program_baseline_1_False_True(baseline_1_False_True_state_t *__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+    __program_baseline_1_False_True_internal(__state, A, B, N);
+}
+
+struct __dace_batch_args_baseline_1_False_True {
+    double * A;
+    double * B;
+    int N;
+};
+
+DACE_EXPORTED int __program_baseline_1_False_True_batch(baseline_1_False_True_state_t *__state, const __dace_batch_args_baseline_1_False_True *__args, long long __count, int __parallel)
+{
+    #pragma omp parallel for if(__parallel)
+    for (long long __i = 0; __i < __count; ++__i)
+    {
+        __program_baseline_1_False_True_internal(__state, __args[__i].A, __args[__i].B, __args[__i].N);
+    }
+    return __parallel;
+}
+
+DACE_EXPORTED baseline_1_False_True_state_t *__dace_init_baseline_1_False_True(int N)
+{
+    int __result = 0;
+    baseline_1_False_True_state_t *__state = new baseline_1_False_True_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_baseline_1_False_True(baseline_1_False_True_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
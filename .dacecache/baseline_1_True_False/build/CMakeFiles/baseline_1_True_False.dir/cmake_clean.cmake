@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/baseline_1_True_False.dir/root/package/.dacecache/baseline_1_True_False/src/cpu/baseline_1_True_False.cpp.o"
+  "CMakeFiles/baseline_1_True_False.dir/root/package/.dacecache/baseline_1_True_False/src/cpu/baseline_1_True_False.cpp.o.d"
+  "libbaseline_1_True_False.pdb"
+  "libbaseline_1_True_False.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/baseline_1_True_False.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
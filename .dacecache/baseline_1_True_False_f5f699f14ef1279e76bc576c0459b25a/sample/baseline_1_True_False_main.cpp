@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/baseline_1_True_False.h"
+
+int main(int argc, char **argv) {
+    baseline_1_True_FalseHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc((2 * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_baseline_1_True_False(N);
+    __program_baseline_1_True_False(handle, A, B, N);
+    err = __dace_exit_baseline_1_True_False(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
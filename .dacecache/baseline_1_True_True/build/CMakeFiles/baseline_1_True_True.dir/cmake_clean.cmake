@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/baseline_1_True_True.dir/root/package/.dacecache/baseline_1_True_True/src/cpu/baseline_1_True_True.cpp.o"
+  "CMakeFiles/baseline_1_True_True.dir/root/package/.dacecache/baseline_1_True_True/src/cpu/baseline_1_True_True.cpp.o.d"
+  "libbaseline_1_True_True.pdb"
+  "libbaseline_1_True_True.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/baseline_1_True_True.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
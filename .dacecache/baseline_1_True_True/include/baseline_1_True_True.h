@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * baseline_1_True_TrueHandle_t;
+extern "C" baseline_1_True_TrueHandle_t __dace_init_baseline_1_True_True(int N);
+extern "C" int __dace_exit_baseline_1_True_True(baseline_1_True_TrueHandle_t handle);
+extern "C" void __program_baseline_1_True_True(baseline_1_True_TrueHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
@@ -0,0 +1 @@
+#define __HASH_baseline_1_True_True "faac5cd6ef8d09898ee9de6b620711754269d9677b14f83929f42d7d902ff432"
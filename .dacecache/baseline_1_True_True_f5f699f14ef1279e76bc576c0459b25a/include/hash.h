@@ -0,0 +1 @@
+#define __HASH_baseline_1_True_True "c697e7ab1ee30277558c5f6136424d69d3b01786adf2c2deb1c4dac47f09f3ea"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/baseline_8_False_False.dir/root/package/.dacecache/baseline_8_False_False_f5f699f14ef1279e76bc576c0459b25a/src/cpu/baseline_8_False_False.cpp.o"
+  "CMakeFiles/baseline_8_False_False.dir/root/package/.dacecache/baseline_8_False_False_f5f699f14ef1279e76bc576c0459b25a/src/cpu/baseline_8_False_False.cpp.o.d"
+  "libbaseline_8_False_False.pdb"
+  "libbaseline_8_False_False.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/baseline_8_False_False.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/baseline_8_False_True.h"
+
+int main(int argc, char **argv) {
+    baseline_8_False_TrueHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc((2 * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_baseline_8_False_True(N);
+    __program_baseline_8_False_True(handle, A, B, N);
+    err = __dace_exit_baseline_8_False_True(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * baseline_8_False_TrueHandle_t;
+extern "C" baseline_8_False_TrueHandle_t __dace_init_baseline_8_False_True(int N);
+extern "C" int __dace_exit_baseline_8_False_True(baseline_8_False_TrueHandle_t handle);
+extern "C" void __program_baseline_8_False_True(baseline_8_False_TrueHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/baseline.dir/root/package/.dacecache/baseline_f5f699f14ef1279e76bc576c0459b25a/src/cpu/baseline.cpp.o"
+  "CMakeFiles/baseline.dir/root/package/.dacecache/baseline_f5f699f14ef1279e76bc576c0459b25a/src/cpu/baseline.cpp.o.d"
+  "libbaseline.pdb"
+  "libbaseline.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/baseline.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
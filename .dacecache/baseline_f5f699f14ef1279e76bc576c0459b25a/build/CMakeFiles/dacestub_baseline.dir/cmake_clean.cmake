@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_baseline.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_baseline.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_baseline.pdb"
+  "libdacestub_baseline.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_baseline.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_baseline "52c8309719d81b6dc98d5a967b076f7995820f503e74712ff14db27bad376f4c"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/baseline.h"
+
+int main(int argc, char **argv) {
+    baselineHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc(N, sizeof(double));
+    double * __restrict__ B = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_baseline(N);
+    __program_baseline(handle, A, B, N);
+    err = __dace_exit_baseline(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}